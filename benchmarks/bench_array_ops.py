@@ -0,0 +1,83 @@
+"""Benchmark for the bulk operations of `dsalgos.dstructs.Array`
+
+Times add, multiply (in place), compare + select, sum, argmax and
+searchsorted on N 'q' items with the NumPy backend (when installed),
+the chunked pure Python backend and plain list comprehensions
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_array_ops.py [-n ITEMS]
+"""
+
+
+import argparse
+import bisect
+import random
+import sys
+import time
+
+from dsalgos import dstructs
+from dsalgos.dstructs import Array
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--items', type=int, default=10**7)
+    options = parser.parse_args(argv)
+
+    items = [random.randrange(10**9) for _ in range(options.items)]
+    ordered = sorted(items)
+    queries = items[:10**5]
+    values, sorted_values = Array('q', items), Array('q', ordered)
+
+    cases = {
+        'add': (
+            lambda: values.add(1),
+            lambda: [item + 1 for item in items],
+        ),
+        'multiply in place': (
+            lambda: values.multiply(1, inplace=True),
+            lambda: items.__setitem__(
+                slice(None), [item * 1 for item in items]
+            ),
+        ),
+        'compare+select': (
+            lambda: values.select(values.compare('<', 10**8)),
+            lambda: [item for item in items if item < 10**8],
+        ),
+        'sum': (values.sum, lambda: sum(items)),
+        'argmax': (
+            values.argmax,
+            lambda: max(range(len(items)), key=items.__getitem__),
+        ),
+        'searchsorted': (
+            lambda: sorted_values.searchsorted(queries),
+            lambda: [bisect.bisect_left(ordered, query) for query in queries],
+        ),
+    }
+
+    backends = ['python'] + (['numpy'] if dstructs._load_numpy() else [])
+    print(f"{'operation':<20}" + ''.join(f'{name:>10}' for name in backends)
+          + f"{'list':>10}")
+
+    for name, (operation, baseline) in cases.items():
+        times = []
+
+        for backend in backends:
+            Array.use_numpy = backend == 'numpy'
+            times.append(timed(operation))
+
+        times.append(timed(baseline))
+        print(f'{name:<20}' + ''.join(f'{time_:>9.3f}s' for time_ in times))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Benchmark for `dsalgos.dstructs.BTreeMap`
+
+Builds an ordered map of N random int keys three ways, a BTreeMap
+(bulk loaded with `from_sorted`), a sorted list of keys searched with
+`bisect` next to a dict of values, and a plain dict sorted on demand,
+then runs the same mixed load on each: lookups, inserts, deletes and,
+every `--scan-every` operations, a range scan of 100 keys (which makes
+the dict sort its keys again if they changed since the last scan)
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_btree.py [-s SIZE ...] \
+[-o OPERATIONS] [--scan-every N] [-f FANOUT ...]
+"""
+
+
+import argparse
+import bisect
+import itertools
+import random
+import sys
+import time
+
+from dsalgos.dstructs import BTreeMap
+
+
+class SortedListMap:
+    def __init__(self, items) -> None:
+        self.keys = [key for key, _ in items]
+        self.values = dict(items)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def insert(self, key, value) -> None:
+        if key not in self.values:
+            bisect.insort(self.keys, key)
+
+        self.values[key] = value
+
+    def delete(self, key) -> None:
+        if self.values.pop(key, None) is not None:
+            del self.keys[bisect.bisect_left(self.keys, key)]
+
+    def scan(self, start: int, count: int) -> list:
+        index = bisect.bisect_left(self.keys, start)
+
+        return self.keys[index:index + count]
+
+
+class SortingDictMap:
+    def __init__(self, items) -> None:
+        self.values = dict(items)
+        self.keys = None
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def insert(self, key, value) -> None:
+        if key not in self.values:
+            self.keys = None
+
+        self.values[key] = value
+
+    def delete(self, key) -> None:
+        if self.values.pop(key, None) is not None:
+            self.keys = None
+
+    def scan(self, start: int, count: int) -> list:
+        if self.keys is None:
+            self.keys = sorted(self.values)
+
+        index = bisect.bisect_left(self.keys, start)
+
+        return self.keys[index:index + count]
+
+
+class BTreeMapAdapter:
+    def __init__(self, items, fanout: int) -> None:
+        self.map = BTreeMap.from_sorted(items, fanout)
+
+    def get(self, key):
+        return self.map.get(key)
+
+    def insert(self, key, value) -> None:
+        self.map[key] = value
+
+    def delete(self, key) -> None:
+        self.map.pop(key, None)
+
+    def scan(self, start: int, count: int) -> list:
+        return list(itertools.islice(self.map.irange(start), count))
+
+
+def workload(size: int, count: int, scan_every: int) -> list:
+    operations = []
+
+    for number in range(count):
+        key = random.randrange(4 * size)
+
+        if number % scan_every == scan_every - 1:
+            operations.append(('scan', key))
+
+        else:
+            operations.append((random.choice(
+                ('get', 'get', 'insert', 'delete')
+            ), key))
+
+    return operations
+
+
+def run(container, operations: list) -> float:
+    get, insert, delete, scan = (
+        container.get, container.insert, container.delete, container.scan
+    )
+    start = time.perf_counter()
+
+    for operation, key in operations:
+        if operation == 'get':
+            get(key)
+
+        elif operation == 'insert':
+            insert(key, key)
+
+        elif operation == 'delete':
+            delete(key)
+
+        else:
+            scan(key, 100)
+
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-s', '--size', type=int, nargs='+', default=[10**6])
+    parser.add_argument('-o', '--operations', type=int, default=10**5)
+    parser.add_argument('--scan-every', type=int, default=1000)
+    parser.add_argument(
+        '-f', '--fanout', type=int, nargs='+', default=[64, 128, 512]
+    )
+    options = parser.parse_args(argv)
+
+    print(f"{'size':>10}{'container':>16}{'build s':>10}{'us/op':>10}")
+
+    for size in options.size:
+        items = [
+            (key, key) for key in sorted(random.sample(range(4 * size), size))
+        ]
+        operations = workload(size, options.operations, options.scan_every)
+        containers = [
+            ('sorted list', lambda: SortedListMap(items)),
+            ('dict + sort', lambda: SortingDictMap(items)),
+        ]
+        containers.extend(
+            (f'BTreeMap({fanout})',
+             lambda fanout=fanout: BTreeMapAdapter(items, fanout))
+            for fanout in options.fanout
+        )
+
+        for name, factory in containers:
+            start = time.perf_counter()
+            container = factory()
+            building = time.perf_counter() - start
+            elapsed = run(container, operations)
+            del container
+
+            print(f'{size:>10}{name:>16}{building:>10.3f}'
+                  f'{elapsed / len(operations) * 1e6:>10.2f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
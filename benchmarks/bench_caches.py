@@ -0,0 +1,98 @@
+"""Benchmark for the caches of `dsalgos.dstructs`
+
+Memoizes a function with `functools.lru_cache` and with `LRUCache`,
+`LFUCache`, `TTLCache`, `SizedCache` and a locked `LRUCache`, then
+calls it with N keys drawn from a Zipf distribution ('zipf'), and
+from the same distribution interleaved with sequential scans over
+keys that are never used again ('scan'), printing the time per call
+and the hit ratio of each
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_caches.py [-n CALLS] \
+[-m MAXSIZE] [-k KEYS] [-a EXPONENT]
+"""
+
+
+import argparse
+import functools
+import itertools
+import random
+import sys
+import threading
+import time
+
+from dsalgos.dstructs import (
+    LFUCache, LRUCache, SizedCache, TTLCache, memoize
+)
+
+
+def zipf(calls: int, keys: int, exponent: float) -> list:
+    weights = [1 / rank ** exponent for rank in range(1, keys + 1)]
+
+    return random.choices(range(keys), weights, k=calls)
+
+
+def scan(calls: int, keys: int, exponent: float) -> list:
+    popular = iter(zipf(calls, keys, exponent))
+    unique = itertools.count(keys)
+    result = []
+
+    while len(result) < calls:
+        result.extend(itertools.islice(popular, 1000))
+        result.extend(itertools.islice(unique, 200))
+
+    return result[:calls]
+
+
+def caches(maxsize: int) -> dict:
+    return {
+        'lru_cache': lambda function: functools.lru_cache(maxsize)(function),
+        'LRUCache': memoize(LRUCache(maxsize)),
+        'LFUCache': memoize(LFUCache(maxsize)),
+        'TTLCache': memoize(TTLCache(maxsize, ttl=3600)),
+        'SizedCache': memoize(
+            SizedCache(maxsize * sys.getsizeof(2**40))
+        ),
+        'locked LRU': memoize(LRUCache(maxsize, lock=threading.RLock())),
+    }
+
+
+def hit_ratio(function) -> float:
+    if hasattr(function, 'cache_info'):
+        info = function.cache_info()
+
+        return info.hits / (info.hits + info.misses)
+
+    return function.cache.hits / (function.cache.hits + function.cache.misses)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--calls', type=int, default=10**6)
+    parser.add_argument('-m', '--maxsize', type=int, default=1000)
+    parser.add_argument('-k', '--keys', type=int, default=100000)
+    parser.add_argument('-a', '--exponent', type=float, default=1.0)
+    options = parser.parse_args(argv)
+
+    print(f"{'mix':<6}{'cache':<12}{'ns/call':>10}{'hit ratio':>11}")
+
+    for name, mix in (('zipf', zipf), ('scan', scan)):
+        keys = mix(options.calls, options.keys, options.exponent)
+
+        for cache, decorator in caches(options.maxsize).items():
+            function = decorator(lambda key: 2**40 + key)
+            start = time.perf_counter()
+
+            for key in keys:
+                function(key)
+
+            seconds = time.perf_counter() - start
+            print(f'{name:<6}{cache:<12}'
+                  f'{seconds / len(keys) * 1e9:>10.0f}'
+                  f'{hit_ratio(function):>11.3f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
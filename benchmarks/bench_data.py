@@ -0,0 +1,96 @@
+"""Benchmark for `dsalgos.dstructs.Data`
+
+Compares the cached `Data.data` view against rebuilding the merged
+dict on every access (the previous behaviour), reporting time and
+bytes allocated per operation (via tracemalloc)
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_data.py [-n OPERATIONS]
+"""
+
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+
+from dsalgos.dstructs import Data
+
+
+def rebuilt(data: Data) -> dict:
+    """Rebuilds the merged view the way `Data.data` used to"""
+
+    return {**dict(enumerate(data.args)), **data.kwargs}
+
+
+OPERATIONS = {
+    'eq': (
+        lambda a, b: rebuilt(a) == rebuilt(b),
+        lambda a, b: a == b,
+    ),
+    'hash': (
+        lambda a, b: hash(frozenset(rebuilt(a).items())),
+        lambda a, b: hash(a),
+    ),
+    'contains': (
+        lambda a, b: 'x' in rebuilt(a).values(),
+        lambda a, b: 'x' in a,
+    ),
+    'getitem': (
+        lambda a, b: rebuilt(a)['k'],
+        lambda a, b: a['k'],
+    ),
+    'repr': (
+        lambda a, b: f'Data{rebuilt(a)}',
+        lambda a, b: repr(a),
+    ),
+}
+
+
+def allocated(operation, a, b, n: int) -> float:
+    """Returns the average no. of bytes allocated (peak) per call"""
+
+    tracemalloc.start()
+    total = 0
+
+    for _ in range(n):
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        operation(a, b)
+        total += tracemalloc.get_traced_memory()[1] - start
+
+    tracemalloc.stop()
+
+    return total / n
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', type=int, default=100_000)
+    options = parser.parse_args(argv)
+
+    a = Data(*range(8), k=1, x='x')
+    b = Data(*range(8), k=1, x='x')
+
+    print(f"{'op':<10}{'before ns':>12}{'after ns':>12}"
+          f"{'before B':>12}{'after B':>12}")
+
+    for name, (before, after) in OPERATIONS.items():
+        times = [
+            timeit.timeit(lambda: op(a, b), number=options.n)
+            / options.n * 1e9
+            for op in (before, after)
+        ]
+        sizes = [
+            allocated(op, a, b, min(options.n, 10_000))
+            for op in (before, after)
+        ]
+
+        print(f'{name:<10}{times[0]:>12.0f}{times[1]:>12.0f}'
+              f'{sizes[0]:>12.0f}{sizes[1]:>12.0f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
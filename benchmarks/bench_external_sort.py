@@ -0,0 +1,69 @@
+"""Benchmark for `dsalgos.algos.external_sort`
+
+Writes an Array file of random 'q' items (10 GB by default) and sorts
+it with a memory budget (512 MB by default), optionally sorting the
+runs in worker processes, then checks the output is sorted
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_external_sort.py \
+[-g GIGABYTES] [-m MEGABYTES] [-p PROCESSES] [-d DIRECTORY]
+"""
+
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from dsalgos.algos import external_sort
+from dsalgos.dstructs import Array, ArrayFile
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-g', '--gigabytes', type=float, default=10)
+    parser.add_argument('-m', '--megabytes', type=int, default=512)
+    parser.add_argument('-p', '--processes', type=int, default=None)
+    parser.add_argument('-d', '--directory', default=None)
+    options = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(dir=options.directory) as directory:
+        source = os.path.join(directory, 'source.bin')
+        destination = os.path.join(directory, 'sorted.bin')
+        remaining = int(options.gigabytes * 2**30) // 8 * 8
+        start = time.perf_counter()
+
+        with ArrayFile(source, 'q') as file:
+            while remaining:
+                items = Array('q')
+                items.frombytes(os.urandom(min(remaining, 2**24)))
+                file.extend(items)
+                remaining -= len(items) * 8
+
+        print(f'wrote {options.gigabytes} GB '
+              f'in {time.perf_counter() - start:.1f}s')
+
+        start = time.perf_counter()
+        external_sort(
+            source, destination, memory=options.megabytes * 2**20,
+            processes=options.processes, tempdir=directory
+        )
+        print(f'sorted with {options.megabytes} MB '
+              f'in {time.perf_counter() - start:.1f}s')
+
+        with Array.open_mmap(destination) as values:
+            step = 2**20
+
+            for begin in range(0, len(values), step):
+                chunk = values[max(begin - 1, 0):begin + step]
+                assert all(a <= b for a, b in zip(chunk, chunk[1:]))
+                chunk.release()
+
+        print('output is sorted')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Benchmark for the heaps of `dsalgos.dstructs`
+
+Runs two operation mixes with `heapq` (re-pushing instead of
+decreasing keys), `DaryHeap` (d = 2, 4, 8) and `PairingHeap`:
+'scheduler' (N pushes interleaved with pops, a queue of about 1000
+tasks) and 'dijkstra' (N pushes, 4 N decrease-keys and N pops)
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_heaps.py [-s SIZE ...]
+"""
+
+
+import argparse
+import heapq
+import random
+import sys
+import time
+
+from dsalgos.dstructs import DaryHeap, PairingHeap
+
+
+def scheduler(size: int) -> list:
+    operations, queued = [], 0
+
+    for item in range(size):
+        operations.append((item, random.random()))
+        queued += 1
+
+        if queued > 1000 or random.random() < 0.5:
+            operations.append(None)
+            queued -= 1
+
+    return operations + [None] * queued
+
+
+def dijkstra(size: int) -> list:
+    priorities = {item: random.random() for item in range(size)}
+    operations = list(priorities.items())
+
+    for _ in range(4 * size):
+        item = random.randrange(size)
+        priorities[item] *= random.random()
+        operations.append((item, priorities[item]))
+
+    return operations + [None] * size
+
+
+def run_heapq(operations: list) -> None:
+    heap, current = [], {}
+
+    for operation in operations:
+        if operation is not None:
+            item, priority = operation
+            current[item] = priority
+            heapq.heappush(heap, (priority, item))
+
+            continue
+
+        while True:
+            priority, item = heapq.heappop(heap)
+
+            if current.get(item) == priority:
+                del current[item]
+
+                break
+
+
+def run_heap(heap) -> callable:
+    def run(operations: list) -> None:
+        for operation in operations:
+            if operation is None:
+                heap.pop()
+
+            elif operation[0] in heap:
+                heap.decrease_key(*operation)
+
+            else:
+                heap.push(*operation)
+
+    return run
+
+
+HEAPS = {
+    'heapq': lambda: run_heapq,
+    'DaryHeap(2)': lambda: run_heap(DaryHeap(d=2)),
+    'DaryHeap(4)': lambda: run_heap(DaryHeap(d=4)),
+    'DaryHeap(8)': lambda: run_heap(DaryHeap(d=8)),
+    'PairingHeap': lambda: run_heap(PairingHeap()),
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-s', '--size', type=int, nargs='+', default=[10**5])
+    options = parser.parse_args(argv)
+
+    print(f"{'size':>10} {'mix':<12}"
+          + ''.join(f'{name:>14}' for name in HEAPS))
+
+    for size in options.size:
+        for name, operations in (('scheduler', scheduler(size)),
+                                 ('dijkstra', dijkstra(size))):
+            times = []
+
+            for heap in HEAPS.values():
+                run = heap()
+                start = time.perf_counter()
+                run(operations)
+                times.append(time.perf_counter() - start)
+
+            print(f'{size:>10} {name:<12}'
+                  + ''.join(f'{seconds:>13.3f}s' for seconds in times))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
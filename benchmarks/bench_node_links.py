@@ -0,0 +1,76 @@
+"""Benchmark for `dsalgos.dstructs.Node` link updates
+
+Attaches N children to one parent (through the `parent` setter), then
+re-links every sibling pair in reverse (through `next_`) and detaches
+every child again, last child first and first child first, and 1000
+random children. Attaching and re-linking take a constant time per operation
+across sizes (O(1)), as does detaching the last child; detaching any
+other child scans and shifts the children list, so its time per
+operation grows with the no. of siblings (O(n))
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_node_links.py [-s SIZE ...]
+"""
+
+
+import argparse
+import random
+import sys
+import time
+
+from dsalgos.dstructs import Data, Node
+
+
+def attached(size: int) -> list:
+    parent = Node()
+    children = [Node(Data(i)) for i in range(size)]
+
+    for child in children:
+        child.parent = parent
+
+    return children
+
+
+def detach(children: list) -> float:
+    start = time.perf_counter()
+
+    for child in children:
+        child.parent = None
+
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-s', '--size', type=int, nargs='+', default=[10**4, 10**5]
+    )
+    options = parser.parse_args(argv)
+
+    print(f"{'size':>10}{'attach ns':>12}{'relink ns':>12}"
+          f"{'detach last':>13}{'first':>10}{'random':>10}")
+
+    for size in options.size:
+        start = time.perf_counter()
+        children = attached(size)
+        attach = time.perf_counter() - start
+        start = time.perf_counter()
+
+        for i in range(size - 1, 0, -1):
+            children[i].next_ = children[i-1]
+
+        relink = time.perf_counter() - start
+        last = detach(children[::-1])
+        first = detach(attached(size))
+        sample = random.sample(attached(size), min(size, 1000))
+        anywhere = detach(sample) * size / len(sample)
+
+        print(f'{size:>10}{attach / size * 1e9:>12.0f}'
+              f'{relink / size * 1e9:>12.0f}{last / size * 1e9:>13.0f}'
+              f'{first / size * 1e9:>10.0f}{anywhere / size * 1e9:>10.0f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Benchmark for the `dsalgos.dstructs.Node` traversals
+
+Builds a tree of N nodes whose longest path has D nodes (a spine with
+leaves hanging off every spine node) and walks it with the iterative
+`preorder`, `postorder`, `breadth_first` and `levels`, next to a naive
+recursive walker (which fails past the interpreter's recursion limit)
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_node_traversals.py \
+[-n NODES] [-d DEPTH]
+"""
+
+
+import argparse
+import sys
+import time
+
+from dsalgos.dstructs import Node
+
+
+def build(nodes: int, depth: int) -> Node:
+    root = spine = Node()
+    leaves = max(nodes // depth - 1, 0)
+
+    for _ in range(depth - 1):
+        for _ in range(leaves):
+            Node(parent=spine)
+
+        spine = Node(parent=spine)
+
+    return root
+
+
+def recursive_preorder(node: Node) -> list:
+    nodes = [node]
+
+    for child in node:
+        nodes.extend(recursive_preorder(child))
+
+    return nodes
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--nodes', type=int, default=10**6)
+    parser.add_argument('-d', '--depth', type=int, default=10**5)
+    options = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    root = build(options.nodes, options.depth)
+    print(f'built in {time.perf_counter() - start:.2f}s')
+
+    walkers = {
+        'preorder': lambda: sum(1 for _ in root.preorder()),
+        'postorder': lambda: sum(1 for _ in root.postorder()),
+        'breadth_first': lambda: sum(1 for _ in root.breadth_first()),
+        'levels': lambda: sum(len(level) for level in root.levels()),
+        'recursive': lambda: len(recursive_preorder(root)),
+    }
+
+    for name, walker in walkers.items():
+        start = time.perf_counter()
+
+        try:
+            count = walker()
+
+        except RecursionError:
+            print(f'{name:<15}RecursionError')
+
+            continue
+
+        elapsed = time.perf_counter() - start
+
+        print(f'{name:<15}{count:>10} nodes{elapsed:>10.3f}s'
+              f'{elapsed / count * 1e9:>8.0f} ns/node')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Benchmark for the thread-safe containers of `dsalgos.dstructs`
+
+Passes N items from P producer threads to P consumer threads (for P
+in 1, 2, 4, ..., 32) through `Queue`, `Stack`, `Deque`, `Deque('q')`,
+`queue.Queue` and `collections.deque` (whose consumers spin, yielding
+the GIL, while it is empty), unbounded and bounded to 1000 items, and
+prints the items passed per second
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_queues.py [-n ITEMS] \
+[-t THREADS ...]
+"""
+
+
+import argparse
+import collections
+import queue
+import sys
+import threading
+import time
+
+from dsalgos.dstructs import Deque, Queue, Stack
+
+
+def spin_popleft(container: collections.deque):
+    while True:
+        try:
+            return container.popleft()
+
+        except IndexError:
+            time.sleep(0)
+
+
+CONTAINERS = {
+    'Queue': (Queue, Queue.put, Queue.get),
+    'Stack': (Stack, Stack.push, Stack.pop),
+    'Deque': (Deque, Deque.append, Deque.popleft),
+    "Deque('q')": (lambda maxsize: Deque(maxsize, 'q'), Deque.append,
+                   Deque.popleft),
+    'queue.Queue': (queue.Queue, queue.Queue.put, queue.Queue.get),
+    'deque': (lambda maxsize: collections.deque(),
+              collections.deque.append, spin_popleft),
+}
+
+
+def run(make, put, get, items: int, threads: int, maxsize: int) -> float:
+    container = make(maxsize)
+    share = items // threads
+
+    def produce():
+        for item in range(share):
+            put(container, item)
+
+    def consume():
+        for _ in range(share):
+            get(container)
+
+    workers = [
+        threading.Thread(target=function)
+        for _ in range(threads) for function in (produce, consume)
+    ]
+    start = time.perf_counter()
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    return share * threads / (time.perf_counter() - start)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--items', type=int, default=200000)
+    parser.add_argument('-t', '--threads', type=int, nargs='+',
+                        default=[1, 2, 4, 8, 16, 32])
+    options = parser.parse_args(argv)
+
+    print(f"{'maxsize':>8}{'threads':>8}"
+          + ''.join(f'{name:>13}' for name in CONTAINERS))
+
+    for maxsize in (0, 1000):
+        for threads in options.threads:
+            rates = [
+                run(make, put, get, options.items, threads, maxsize)
+                for make, put, get in CONTAINERS.values()
+            ]
+
+            print(f'{maxsize:>8}{threads:>8}'
+                  + ''.join(f'{rate:>13,.0f}' for rate in rates))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Benchmark for `dsalgos.dstructs.dump`, `load` and `iter_load`
+
+Builds random trees of N nodes holding `Data(int)` payloads (written
+as an Array) or `Data(str, key=int)` payloads (written pickled), then
+times writing and reading them back through a temporary file, next to
+`pickle` (which recurses through the links and fails on deep trees),
+and reports the file sizes and the peak memory of streaming the file
+with `iter_load`
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_serialize.py [-s SIZE ...]
+"""
+
+
+import argparse
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from dsalgos.dstructs import Data, Node, dump, iter_load, load
+
+
+def build(size: int, numeric: bool) -> Node:
+    root = Node(Data(0))
+    nodes = [root]
+
+    for i in range(1, size):
+        data = Data(i) if numeric else Data(str(i), key=i)
+        nodes.append(Node(data, parent=random.choice(nodes[-64:])))
+
+    return root
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+
+    return time.perf_counter() - start, result
+
+
+def with_pickle(root: Node, path: str) -> str:
+    try:
+        with open(path, 'wb') as file:
+            dumping, _ = timed(pickle.dump, root, file)
+
+        with open(path, 'rb') as file:
+            loading, _ = timed(pickle.load, file)
+
+    except RecursionError:
+        return f"{'recursion':>10}{'':>10}{'':>10}"
+
+    return f'{dumping:>10.3f}{loading:>10.3f}{os.path.getsize(path):>10}'
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-s', '--size', type=int, nargs='+', default=[10**5, 10**6]
+    )
+    options = parser.parse_args(argv)
+
+    print(f"{'size':>10}{'payload':>9}{'dump s':>10}{'load s':>10}"
+          f"{'bytes':>10}{'pickle s':>10}{'unpickle':>10}{'bytes':>10}"
+          f"{'stream KiB':>12}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tree.bin')
+
+        for size in options.size:
+            for numeric in (True, False):
+                root = build(size, numeric)
+                dumping, _ = timed(dump, root, path)
+                loading, _ = timed(load, path)
+                written = os.path.getsize(path)
+
+                tracemalloc.start()
+
+                for _ in iter_load(path):
+                    pass
+
+                streaming = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+                print(f"{size:>10}{'int' if numeric else 'mixed':>9}"
+                      f'{dumping:>10.3f}{loading:>10.3f}{written:>10}'
+                      f'{with_pickle(root, path)}'
+                      f'{streaming / 1024:>12.0f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
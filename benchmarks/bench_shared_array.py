@@ -0,0 +1,79 @@
+"""Benchmark for `dsalgos.dstructs.SharedArray`
+
+Sums N 'q' items (by default 1 GB of them) with a pool of P worker
+processes, once sending each worker its slice as a pickled Array (a
+copy per task) and once sending the SharedArray itself (only its name
+is pickled, and workers attach to the same memory)
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_shared_array.py \
+[-n ITEMS] [-p PROCESSES]
+"""
+
+
+import argparse
+import multiprocessing
+import sys
+import time
+
+from dsalgos.dstructs import Array, SharedArray
+
+
+def sum_copy(items: Array) -> int:
+    return sum(items)
+
+
+def sum_shared(shared: SharedArray, start: int, end: int) -> int:
+    view = shared.view[start:end]
+    total = sum(view)
+    view.release()
+    shared.close()
+
+    return total
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--items', type=int, default=2**27)
+    parser.add_argument('-p', '--processes', type=int, default=8)
+    options = parser.parse_args(argv)
+
+    size, processes = options.items, options.processes
+    bounds = [
+        (size * i // processes, size * (i + 1) // processes)
+        for i in range(processes)
+    ]
+
+    start = time.perf_counter()
+    shared = SharedArray('q', capacity=size)
+    step = 2**20
+
+    for begin in range(0, size, step):
+        shared.extend(range(begin, min(begin + step, size)))
+
+    print(f'filled {size * 8 / 2**20:.0f} MB '
+          f'in {time.perf_counter() - start:.2f}s')
+
+    with multiprocessing.Pool(processes) as pool:
+        start = time.perf_counter()
+        items = shared.to_array()
+        copied = sum(pool.map(sum_copy, (items[a:b] for a, b in bounds)))
+        del items
+        print(f'pickled slices {time.perf_counter() - start:>8.2f}s')
+
+        start = time.perf_counter()
+        total = sum(pool.starmap(
+            sum_shared, ((shared, a, b) for a, b in bounds)
+        ))
+        print(f'shared memory  {time.perf_counter() - start:>8.2f}s')
+
+    assert copied == total == size * (size - 1) // 2
+
+    shared.close()
+    shared.unlink()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Benchmark for building a `dsalgos.dstructs.SinglyLinkedList`
+
+Times `SinglyLinkedList(elements=...)` over prebuilt Node objects and
+`SinglyLinkedList.from_iterable` over plain values at growing sizes;
+a constant time per node across sizes shows construction is linear.
+Then times LRU-style operations (a membership test and a
+`move_to_front` of a random node, or a `pop` and an `appendleft`) on
+plain and indexed lists
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_sllist.py [-s SIZE ...]
+"""
+
+
+import argparse
+import random
+import sys
+import time
+
+from dsalgos.dstructs import Data, Node, SinglyLinkedList
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+
+    return time.perf_counter() - start
+
+
+def lru_operations(sllist: SinglyLinkedList, nodes: list,
+                   count: int) -> None:
+    for _ in range(count):
+        node = random.choice(nodes)
+
+        if node in sllist:
+            sllist.move_to_front(node)
+
+        else:
+            sllist.pop()
+            sllist.appendleft(node)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-s', '--size', type=int, nargs='+', default=[10**5, 10**6]
+    )
+    options = parser.parse_args(argv)
+
+    print(f"{'size':>10}{'nodes s':>10}{'ns/node':>10}"
+          f"{'values s':>10}{'ns/value':>10}")
+
+    for size in options.size:
+        nodes = [Node(Data(i)) for i in range(size)]
+        linking = timed(lambda: SinglyLinkedList(elements=nodes))
+        del nodes
+
+        building = timed(SinglyLinkedList.from_iterable, range(size))
+
+        print(f'{size:>10}{linking:>10.3f}{linking / size * 1e9:>10.0f}'
+              f'{building:>10.3f}{building / size * 1e9:>10.0f}')
+
+    print(f"\n{'size':>10}{'plain us/op':>14}{'indexed us/op':>16}")
+
+    for size in options.size:
+        nodes = [Node(Data(i)) for i in range(size)]
+        count = max(10, 10**7 // size)
+        plain, indexed = (
+            timed(
+                lru_operations,
+                SinglyLinkedList(elements=nodes[:size // 2], indexed=indexed),
+                nodes, count
+            ) / count * 1e6
+            for indexed in (False, True)
+        )
+
+        print(f'{size:>10}{plain:>14.2f}{indexed:>16.2f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
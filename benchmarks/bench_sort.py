@@ -0,0 +1,70 @@
+"""Benchmark for the sorting algorithms of `dsalgos.algos`
+
+Sorts 'q' Arrays of N random, nearly sorted (1% of items swapped) and
+many-duplicate (100 distinct values) items with `sort`, `radix_sort`
+(LSD and MSD), `counting_sort` and `sorted`
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_sort.py [-s SIZE ...]
+"""
+
+
+import argparse
+import random
+import sys
+import time
+
+from dsalgos.algos import counting_sort, radix_sort, sort
+from dsalgos.dstructs import Array
+
+
+def distributions(size: int) -> dict:
+    nearly = list(range(size))
+
+    for _ in range(size // 100):
+        i, j = random.randrange(size), random.randrange(size)
+        nearly[i], nearly[j] = nearly[j], nearly[i]
+
+    return {
+        'random': [random.randrange(-2**62, 2**62) for _ in range(size)],
+        'nearly sorted': nearly,
+        'duplicates': [random.randrange(100) for _ in range(size)],
+    }
+
+
+ALGORITHMS = {
+    'sort': sort,
+    'radix_sort': radix_sort,
+    'radix_sort msd': lambda array: radix_sort(array, 'msd'),
+    'counting_sort': counting_sort,
+    'sorted': lambda array: Array(array.typecode, sorted(array)),
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-s', '--size', type=int, nargs='+', default=[10**6])
+    options = parser.parse_args(argv)
+
+    print(f"{'size':>10} {'distribution':<15}"
+          + ''.join(f'{name:>15}' for name in ALGORITHMS))
+
+    for size in options.size:
+        for name, items in distributions(size).items():
+            array = Array('q', items)
+            del items
+            times = []
+
+            for algorithm in ALGORITHMS.values():
+                start = time.perf_counter()
+                algorithm(array)
+                times.append(time.perf_counter() - start)
+
+            print(f'{size:>10} {name:<15}'
+                  + ''.join(f'{time_:>14.3f}s' for time_ in times))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
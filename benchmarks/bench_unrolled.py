@@ -0,0 +1,109 @@
+"""Benchmark for `dsalgos.dstructs.UnrolledList`
+
+Times appends, a full scan (chunk by chunk through `chunks`, and value
+by value), random indexing and random insertion on an UnrolledList of
+N int values at several chunk capacities, next to a plain list and an
+ArrayLinkedList (for appends and scans), and reports the memory used
+per value
+
+Usage
+    PYTHONPATH=. python benchmarks/bench_unrolled.py [-s SIZE ...] \
+[-c CAPACITY ...]
+"""
+
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+
+from dsalgos.dstructs import ArrayLinkedList, UnrolledList
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+
+    return time.perf_counter() - start
+
+
+def filled(factory, size: int):
+    container = factory()
+
+    for value in range(size):
+        container.append(value)
+
+    return container
+
+
+def measured(factory, size: int):
+    tracemalloc.start()
+    container = filled(factory, size)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return container, memory
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '-s', '--size', type=int, nargs='+', default=[10**5, 10**6]
+    )
+    parser.add_argument(
+        '-c', '--capacity', type=int, nargs='+', default=[64, 256, 1024]
+    )
+    options = parser.parse_args(argv)
+
+    print(f"{'size':>10}{'container':>18}{'append ns':>11}{'B/value':>9}"
+          f"{'scan ns':>9}{'iter ns':>9}{'index us':>10}{'insert us':>11}")
+
+    for size in options.size:
+        positions = [random.randrange(size) for _ in range(1000)]
+        containers = [('list', list), ('ArrayLinkedList', ArrayLinkedList)]
+        containers.extend(
+            (f'Unrolled({capacity})',
+             lambda capacity=capacity: UnrolledList('q', capacity=capacity))
+            for capacity in options.capacity
+        )
+
+        for name, factory in containers:
+            appending = timed(filled, factory, size)
+            container, memory = measured(factory, size)
+
+            if isinstance(container, UnrolledList):
+                scanning = timed(
+                    lambda: sum(sum(chunk) for chunk in container.chunks())
+                )
+
+            else:
+                scanning = float('nan')
+
+            iterating = timed(sum, container)
+
+            if isinstance(container, ArrayLinkedList):
+                indexing = inserting = float('nan')
+
+            else:
+                indexing = timed(
+                    lambda: [container[position] for position in positions]
+                )
+                inserting = timed(
+                    lambda: [
+                        container.insert(position, position)
+                        for position in positions
+                    ]
+                )
+
+            print(f'{size:>10}{name:>18}{appending / size * 1e9:>11.0f}'
+                  f'{memory / size:>9.1f}{scanning / size * 1e9:>9.1f}'
+                  f'{iterating / size * 1e9:>9.1f}'
+                  f'{indexing / len(positions) * 1e6:>10.2f}'
+                  f'{inserting / len(positions) * 1e6:>11.2f}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,5 +5,20 @@ __version__: str = '1.0.0'
 __desc__: str = 'A library for basic Data Structures and Algorithms'
 
 
-import dsalgos.algos
-import dsalgos.dstructs
+# The submodules, imported on first access (e.g., `dsalgos.dstructs`) by
+# `__getattr__`, so that importing the package (or its metadata, as
+# `setup.py` does) does not import all of them
+__all__ = ('algos', 'bench', 'dstructs')
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        import importlib
+
+        return importlib.import_module(f'{__name__}.{name}')
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
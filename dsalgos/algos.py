@@ -4,4 +4,1301 @@
 """
 
 
-__all__ = ()
+# Import `annotations` from `__future__` for delayed annotations
+from __future__ import annotations
+
+
+__all__ = ('sort', 'radix_sort', 'counting_sort', 'linked_list_merge_sort',
+           'external_sort', 'lower_bound', 'upper_bound',
+           'exponential_search', 'batch_search', 'introselect',
+           'median_of_medians', 'Graph', 'breadth_first_search',
+           'dijkstra', 'topological_sort', 'connected_components',
+           'pagerank')
+
+
+# Import `bisect_left` and `bisect_right` from `bisect` for binary search
+from bisect import bisect_left as _bisect_left
+from bisect import bisect_right as _bisect_right
+
+# Import `Counter` from `collections` for counting sort
+from collections import Counter as _Counter
+
+# Import `reduce` from `functools` for folding keys
+from functools import reduce as _reduce
+
+# Import `heappop`, `heappush` and `merge` from `heapq` for priority queues
+# and k-way merges
+from heapq import heappop as _heappop
+from heapq import heappush as _heappush
+from heapq import merge as _merge
+
+# Import `chain`, `islice` and `repeat` from `itertools` for iterating
+from itertools import chain as _chain
+from itertools import islice as _islice
+from itertools import repeat as _repeat
+
+# Import `or_` and `xor` from `operator` for bit twiddling keys
+from operator import or_ as _or
+from operator import xor as _xor
+
+# Import `os` as `_os` for file paths and offsets
+import os as _os
+
+# Import `sys` as `_sys` for the native byte order
+import sys as _sys
+
+# Import `typing` for type annotations
+import typing
+
+# Import the data structures the algorithms work on
+from dsalgos.dstructs import Array, Node, SinglyLinkedList
+from dsalgos import dstructs as _dstructs
+
+
+# Type/Class of `None` (NoneType)
+NoneType = type(None)
+
+
+# Typecodes of Arrays by kind of item
+_SIGNED = 'bhilq'
+_UNSIGNED = 'BHILQ'
+_FLOATS = 'fd'
+
+
+def _unsigned_typecode(itemsize: int) -> str:
+    """Returns the unsigned integer typecode of *itemsize* bytes"""
+
+    for typecode in _UNSIGNED:
+        if Array(typecode).itemsize == itemsize:
+            return typecode
+
+    raise ValueError(f"no unsigned typecode of {itemsize} bytes")
+
+
+def _to_keys(array: Array) -> typing.Tuple[str, Array]:
+    """Returns the unsigned typecode and an Array of the unsigned keys \
+whose order is the order of the items of *array*
+
+Signed integers get their sign bit flipped, and floats their sign bit
+flipped when positive or all bits flipped when negative (so their bit
+patterns compare like the numbers do)
+"""
+
+    typecode = _unsigned_typecode(array.itemsize)
+    raw = memoryview(array).cast('B').cast(typecode)
+    bits = array.itemsize * 8
+    sign, ones = 1 << (bits - 1), (1 << bits) - 1
+
+    if array.typecode in _UNSIGNED:
+        keys = Array(typecode, raw)
+
+    elif array.typecode in _SIGNED:
+        keys = Array(typecode, map(_xor, raw, _repeat(sign)))
+
+    else:
+        keys = Array(
+            typecode,
+            (key ^ (-(key >> (bits - 1)) & ones | sign) for key in raw)
+        )
+
+    raw.release()
+
+    return typecode, keys
+
+
+def _from_keys(array: Array, typecode: str, keys: Array) -> Array:
+    """Returns a new Array of the type of *array* from the sorted Array \
+of *keys* (the inverse of `_to_keys`)
+"""
+
+    bits = array.itemsize * 8
+    sign, ones = 1 << (bits - 1), (1 << bits) - 1
+
+    if array.typecode in _SIGNED:
+        keys = Array(typecode, map(_xor, keys, _repeat(sign)))
+
+    elif array.typecode in _FLOATS:
+        keys = Array(
+            typecode, (key ^ (sign if key & sign else ones) for key in keys)
+        )
+
+    result = Array(array.typecode)
+    result.frombytes(memoryview(keys).cast('B'))
+
+    return result
+
+
+def counting_sort(array: Array) -> Array:
+    """Returns a new, sorted copy of an integer Array, \
+in O(n + k log k) for k distinct values
+
+Counts every value once and writes each value as many times as it was
+counted, so it suits narrow typecodes (1 or 2 bytes) and Arrays with
+many duplicates
+"""
+
+    if array.typecode not in _SIGNED + _UNSIGNED:
+        raise TypeError(f"cannot counting sort '{array.typecode}' items")
+
+    counts = _Counter(array)
+    result = Array(array.typecode)
+
+    for value in sorted(counts):
+        result.extend(_repeat(value, counts[value]))
+
+    return result
+
+
+def _distribute(keys: Array, byte: int) -> typing.List[Array]:
+    """Returns 256 Arrays (buckets) of the *keys*, by their byte \
+number *byte* (0 is the least significant), keeping their order
+"""
+
+    itemsize = keys.itemsize
+    offset = byte if _sys.byteorder == 'little' else itemsize - 1 - byte
+    column = memoryview(keys).cast('B')[offset::itemsize]
+    buckets = [Array(keys.typecode) for _ in range(256)]
+    appends = [bucket.append for bucket in buckets]
+
+    for key, digit in zip(keys, column):
+        appends[digit](key)
+
+    column.release()
+
+    return buckets
+
+
+def _differing_bits(keys: Array) -> int:
+    """Returns the bits that are not the same in all the *keys*"""
+
+    return _reduce(_or, map(_xor, keys, _repeat(keys[0])), 0)
+
+
+def radix_sort(array: Array, order: str = 'lsd') -> Array:
+    """Returns a new, sorted copy of an integer or float Array, \
+using a (stable) least (*order* 'lsd') or most (*order* 'msd')
+significant digit radix sort
+
+Explanation
+    The items are turned into an Array of unsigned integer keys with
+    the same order (see `_to_keys`: for floats, this is the IEEE 754
+    sign bit trick, which puts negative NaNs first and positive NaNs
+    last). Digits are the bytes of the keys, and the byte of every
+    key is read straight out of the keys' buffer (a strided
+    memoryview slice) instead of shifting and masking every key.
+    Keys are distributed into 256 bucket Arrays by a digit, keeping
+    their order within a bucket, and the buckets are joined by
+    copying their buffers.
+
+    LSD does one such pass over all the keys for every byte, from
+    the least significant up, skipping bytes that are the same in all
+    keys, so small ranges of values need few passes.
+
+    MSD starts from the most significant byte that differs and then
+    sorts every bucket on its own, by the next differing byte of the
+    keys in that bucket only, and hands buckets of up to
+    `_MSD_CUTOFF` keys to `sorted`. It only reads the bytes needed to
+    tell the keys apart, which suits wide keys with few distinct
+    prefixes (e.g., clustered 8 byte values), where LSD would pass
+    over every low byte.
+"""
+
+    if array.typecode not in _SIGNED + _UNSIGNED + _FLOATS:
+        raise TypeError(f"cannot radix sort '{array.typecode}' items")
+
+    if order not in ('lsd', 'msd'):
+        raise ValueError("order must be 'lsd' or 'msd'")
+
+    if len(array) < 2:
+        return Array(array.typecode, array)
+
+    typecode, keys = _to_keys(array)
+
+    if order == 'msd':
+        return _from_keys(array, typecode, _msd_radix_sort(keys))
+
+    differing = _differing_bits(keys)
+
+    for byte in range(array.itemsize):
+        if not (differing >> (8 * byte)) & 255:
+            continue
+
+        buckets = _distribute(keys, byte)
+        keys = Array(typecode)
+
+        for bucket in buckets:
+            keys.extend(bucket)
+
+    return _from_keys(array, typecode, keys)
+
+
+# Buckets of up to this many keys are sorted with `sorted` by MSD
+# radix sort, as distributing them costs more than sorting them
+_MSD_CUTOFF = 64
+
+
+def _msd_radix_sort(keys: Array) -> Array:
+    """Returns a new Array of the unsigned *keys*, sorted by \
+a most significant digit radix sort (see `radix_sort`)
+"""
+
+    result = Array(keys.typecode)
+    stack = [keys]
+
+    while stack:
+        keys = stack.pop()
+
+        if len(keys) <= _MSD_CUTOFF:
+            result.extend(sorted(keys))
+            continue
+
+        differing = _differing_bits(keys)
+
+        if not differing:
+            result.extend(keys)
+            continue
+
+        stack.extend(
+            bucket
+            for bucket in reversed(
+                _distribute(keys, (differing.bit_length() - 1) // 8)
+            )
+            if bucket
+        )
+
+    return result
+
+
+def linked_list_merge_sort(
+    sllist: SinglyLinkedList,
+    key: typing.Callable[[Node], typing.Any] = None,
+    reverse: bool = False
+) -> SinglyLinkedList:
+    """Sorts the node objects of *sllist* in place (stably) \
+and returns it
+
+Parameters
+    sllist (SinglyLinkedList) - The list to sort
+    key=None (callable) - Returns the value to sort a node object by
+        (by default, the tuple of the values of its data)
+    reverse=False (bool) - Sorts in descending order if True
+
+Explanation
+    A bottom-up merge sort over the `next_` links: sorted runs of 1,
+    2, 4, ... node objects are merged pairwise by relinking them, so
+    no node object is copied and no recursion is used. The key of
+    every node object is computed once, up front (in a dict by id),
+    rather than twice per comparison. Afterwards the `previous` links,
+    the list's elements and its head are updated to the new order.
+"""
+
+    if not isinstance(sllist, SinglyLinkedList):
+        raise TypeError(f"'{sllist}' must be of type 'SinglyLinkedList'")
+
+    elements = sllist.elements
+
+    if len(elements) < 2:
+        return sllist
+
+    if key is None:
+        def key(node: Node):
+            return tuple(node.data)
+
+    keys = dict(zip(map(id, elements), map(key, elements)))
+
+    def before(this: Node, that: Node) -> bool:
+        """Returns True if *that* may not come before *this*"""
+
+        if reverse:
+            return keys[id(this)] >= keys[id(that)]
+
+        return keys[id(this)] <= keys[id(that)]
+
+    for this, that in zip(elements, elements[1:]):
+        this._next = that
+
+    elements[-1]._next = None
+    first = elements[0]
+    size = 1
+
+    while True:
+        this, first, tail, merges = first, None, None, 0
+
+        while this is not None:
+            merges += 1
+            that, length = this, 0
+
+            while that is not None and length < size:
+                that, length = that._next, length + 1
+
+            remaining = size
+
+            while length or (remaining and that is not None):
+                if not length:
+                    node, that, remaining = that, that._next, remaining - 1
+
+                elif not remaining or that is None or before(this, that):
+                    node, this, length = this, this._next, length - 1
+
+                else:
+                    node, that, remaining = that, that._next, remaining - 1
+
+                if tail is None:
+                    first = node
+
+                else:
+                    tail._next = node
+
+                tail = node
+
+            this = that
+
+        tail._next = None
+
+        if merges <= 1:
+            break
+
+        size *= 2
+
+    previous = sllist._head if isinstance(sllist._head, Node) else None
+    node = first
+
+    for index in range(len(elements)):
+        elements[index] = node
+        node._previous = previous
+
+        if previous is not None:
+            previous._next = node
+
+        previous, node = node, node._next
+
+    sllist._relinked()
+
+    return sllist
+
+
+def sort(
+    items, key: typing.Callable = None, reverse: bool = False
+):
+    """Returns *items* sorted, picking an algorithm by their type
+
+Parameters
+    items - The items to sort
+    key=None (callable) - Returns the value to sort an item by
+    reverse=False (bool) - Sorts in descending order if True
+
+Explanation
+    - A SinglyLinkedList is sorted in place with
+      `linked_list_merge_sort` (and returned)
+    - An Array of integers or floats (without a *key*) is returned
+      as a new, sorted Array: 1 and 2 byte integers are counting
+      sorted, wider items are sorted by NumPy (over the Array's
+      buffer) when it is installed, and by `sorted` otherwise (which,
+      in CPython, beats the pure Python `radix_sort`)
+    - Anything else is passed to `sorted`, returning a list
+"""
+
+    if isinstance(items, SinglyLinkedList):
+        return linked_list_merge_sort(items, key, reverse)
+
+    if (
+        isinstance(items, Array) and key is None
+        and items.typecode in _SIGNED + _UNSIGNED + _FLOATS
+    ):
+        if items.typecode in _SIGNED + _UNSIGNED and items.itemsize <= 2:
+            result = counting_sort(items)
+
+        elif Array.use_numpy and _dstructs._load_numpy() is not None:
+            result = _dstructs._from_numpy(
+                items.typecode,
+                _dstructs._numpy.sort(
+                    _dstructs._numpy.asarray(memoryview(items)),
+                    kind='stable'
+                )
+            )
+
+        else:
+            result = Array(items.typecode, sorted(items))
+
+        if reverse:
+            result.reverse()
+
+        return result
+
+    return sorted(items, key=key, reverse=reverse)
+
+
+def _read_run(path, buffersize: int):
+    """Yields the items of the Array file at *path*, reading \
+*buffersize* items at a time
+"""
+
+    with open(path, 'rb') as file:
+        typecode, byteorder, length = _dstructs._read_array_header(file)
+
+        while length:
+            items = Array(typecode)
+            items.fromfile(file, min(buffersize, length))
+            length -= len(items)
+
+            yield from items
+
+
+def _sort_run(source, start: int, count: int, path) -> NoneType:
+    """Sorts *count* items of the Array file *source*, from item \
+*start* on, into the Array file *path*
+"""
+
+    with open(source, 'rb') as file:
+        typecode, _, _ = _dstructs._read_array_header(file)
+        items = Array(typecode)
+        file.seek(start * items.itemsize, _os.SEEK_CUR)
+        items.fromfile(file, count)
+
+    numpy = _dstructs._load_numpy() if Array.use_numpy else None
+
+    # NumPy sorts the items' own buffer in place, where `sort` would
+    # return a sorted copy (and `_from_numpy` another one)
+    if numpy is not None:
+        numpy.asarray(memoryview(items)).sort()
+
+    else:
+        items = sort(items)
+
+    items.save(path)
+
+    return None
+
+
+def _merge_runs(paths: typing.List[str], destination, typecode: str,
+                buffersize: int) -> NoneType:
+    """Merges the sorted Array files *paths* into the Array file \
+*destination*
+"""
+
+    merged = _merge(*(_read_run(path, buffersize) for path in paths))
+
+    with _dstructs.ArrayFile(destination, typecode, buffersize) as output:
+        while True:
+            length = len(output)
+            output.extend(_islice(merged, buffersize))
+
+            if len(output) == length:
+                break
+
+    return None
+
+
+def external_sort(
+    source, destination, memory: int = 512 * 2**20, fanin: int = 64,
+    processes: typing.Union[int, NoneType] = None,
+    tempdir: typing.Union[str, NoneType] = None
+) -> NoneType:
+    """Sorts the items of an Array file into another Array file, \
+using about *memory* bytes of memory however big the files are
+
+Parameters
+    source (str|PathLike) - The Array file to sort (written by
+        `Array.save` or an ArrayFile)
+    destination (str|PathLike) - The sorted Array file to write (or
+        overwrite), which `Array.load` and `Array.open_mmap` can open
+    memory=512 MiB (int) - The memory budget, in bytes
+    fanin=64 (int) - The max. no. of runs merged at once
+    processes=None (int) - Sorts the runs in this many worker
+        processes (in the current process if None)
+    tempdir=None (str) - Where to write the runs (see `tempfile`)
+
+Explanation
+    An external (out-of-core) merge sort. First, the source is read
+    in chunks that fit in the memory budget (split between the
+    worker processes), each chunk is sorted in memory (in place, by
+    NumPy, when it is installed, else with `sort`, which needs several
+    times the chunk's size) and written to a temporary 'run' file.
+    Then up to *fanin* runs at a time are merged, through a heap
+    (`heapq.merge`), reading every run through a small buffer; when
+    there are more runs than that, groups of runs are merged into
+    longer runs first, until one pass can write the destination.
+"""
+
+    if fanin < 2:
+        raise ValueError("'fanin' must be at least 2")
+
+    with open(source, 'rb') as file:
+        typecode, byteorder, length = _dstructs._read_array_header(file)
+
+    if byteorder != _sys.byteorder:
+        raise ValueError(f"'{source}' has a foreign byte order")
+
+    if typecode not in _SIGNED + _UNSIGNED + _FLOATS:
+        raise TypeError(f"cannot externally sort '{typecode}' items")
+
+    itemsize = Array(typecode).itemsize
+    workers = processes or 1
+    # Reading a chunk briefly holds it twice (`array.fromfile` reads it
+    # into a bytes object first), and NumPy then sorts it in place
+    chunk = max(memory // (2 * itemsize * workers), 1)
+    buffersize = max(memory // ((fanin + 1) * itemsize), 1)
+
+    # Imported here, as `concurrent.futures` (with `multiprocessing`) and
+    # `tempfile` take long to import for the one function using them
+    from concurrent.futures import ProcessPoolExecutor
+    import tempfile
+
+    with tempfile.TemporaryDirectory(dir=tempdir) as directory:
+        runs = [
+            (source, start, min(chunk, length - start),
+             _os.path.join(directory, f'run{number}'))
+            for number, start in enumerate(range(0, length, chunk))
+        ]
+
+        if processes:
+            with ProcessPoolExecutor(processes) as executor:
+                for future in [
+                    executor.submit(_sort_run, *run) for run in runs
+                ]:
+                    future.result()
+
+        else:
+            for run in runs:
+                _sort_run(*run)
+
+        paths = [run[-1] for run in runs]
+        generation = 0
+
+        while len(paths) > fanin:
+            generation += 1
+            merged = []
+
+            for number, start in enumerate(range(0, len(paths), fanin)):
+                path = _os.path.join(directory, f'merge{generation}-{number}')
+                _merge_runs(paths[start:start+fanin], path, typecode,
+                            buffersize)
+                merged.append(path)
+
+            paths = merged
+
+        # The last merge writes a new file next to the destination (an
+        # ArrayFile would append to an existing destination), which then
+        # replaces the destination (or is removed if the merge fails)
+        descriptor, partial = tempfile.mkstemp(
+            '.partial', '.' + _os.path.basename(destination),
+            _os.path.dirname(_os.path.abspath(destination))
+        )
+        _os.close(descriptor)
+        _os.remove(partial)
+
+        try:
+            _merge_runs(paths, partial, typecode, buffersize)
+            _os.replace(partial, destination)
+
+        except BaseException:
+            if _os.path.exists(partial):
+                _os.remove(partial)
+
+            raise
+
+    return None
+
+
+def lower_bound(items, value, lo: int = 0,
+                hi: typing.Union[int, NoneType] = None) -> int:
+    """Returns the index of the first item of the sorted *items* \
+(within *lo* to *hi*) that is not less than *value*
+
+*items* is any sorted sequence (e.g., an Array, a MappedArray or a
+memoryview), which is searched in place by binary search
+"""
+
+    return _bisect_left(items, value, lo, len(items) if hi is None else hi)
+
+
+def upper_bound(items, value, lo: int = 0,
+                hi: typing.Union[int, NoneType] = None) -> int:
+    """Returns the index of the first item of the sorted *items* \
+(within *lo* to *hi*) that is greater than *value*
+"""
+
+    return _bisect_right(items, value, lo, len(items) if hi is None else hi)
+
+
+def exponential_search(
+    items, value, lo: int = 0, hi: typing.Union[int, NoneType] = None,
+    side: str = 'left'
+) -> int:
+    """Returns `lower_bound(items, value, lo, hi)` (or `upper_bound`, \
+if *side* is 'right'), galloping from *lo*
+
+Explanation
+    Compares *value* with the items 1, 2, 4, 8, ... places after *lo*
+    until it passes one, then binary searches the last gap. This
+    takes O(log d) steps for an answer d places after *lo*, which
+    beats a plain binary search when the answer is known to be near
+    *lo* (e.g., when searching for increasing values one after the
+    other)
+"""
+
+    if side not in ('left', 'right'):
+        raise ValueError("side must be 'left' or 'right'")
+
+    hi = len(items) if hi is None else hi
+    search = _bisect_left if side == 'left' else _bisect_right
+    passed = 0
+    step = 1
+
+    while lo + step <= hi and (
+        items[lo + step - 1] < value if side == 'left'
+        else items[lo + step - 1] <= value
+    ):
+        passed, step = step, step * 2
+
+    return search(items, value, lo + passed, min(lo + step, hi))
+
+
+def batch_search(items, values, side: str = 'left') -> Array:
+    """Returns an Array of `lower_bound(items, value)` (or \
+`upper_bound`, if *side* is 'right') for every value of *values*
+
+Explanation
+    Instead of binary searching the whole of *items* for every value,
+    the values are sorted first, and then answered in a single pass
+    over *items*, in order: each search gallops (`exponential_search`)
+    from where the one for the previous (smaller) value ended, so it
+    takes O(log d) steps for an answer d places further on. All q
+    searches over n items then take O(q log(n / q)) steps, which is
+    at most O(q log n) and at most O(n) (a linear merge of the
+    sorted values with the items). Uses NumPy's `searchsorted` (over
+    the buffers) when it is installed and *items* is an Array.
+"""
+
+    if side not in ('left', 'right'):
+        raise ValueError("side must be 'left' or 'right'")
+
+    if isinstance(items, Array) and items._uses_numpy():
+        return items.searchsorted(values, side)
+
+    result = Array('q', bytes(8 * len(values)))
+    position, length = 0, len(items)
+
+    for index in sorted(range(len(values)), key=values.__getitem__):
+        position = exponential_search(
+            items, values[index], position, length, side
+        )
+        result[index] = position
+
+    return result
+
+
+def _small_sort(items, lo: int, hi: int) -> NoneType:
+    """Sorts *items* from *lo* to *hi* (inclusive) in place"""
+
+    for offset, value in enumerate(sorted(items[lo:hi+1])):
+        items[lo + offset] = value
+
+    return None
+
+
+def _partition(items, lo: int, hi: int, pivot) -> typing.Tuple[int, int]:
+    """Partitions *items* from *lo* to *hi* (inclusive) in place \
+around *pivot* (three-way), returning the first and last index of the
+items equal to it
+"""
+
+    i = lo
+
+    while i <= hi:
+        value = items[i]
+
+        if value < pivot:
+            items[i], items[lo] = items[lo], value
+            lo, i = lo + 1, i + 1
+
+        elif pivot < value:
+            items[i], items[hi] = items[hi], value
+            hi -= 1
+
+        else:
+            i += 1
+
+    return lo, hi
+
+
+def _median_of_medians(items, lo: int, hi: int):
+    """Returns a pivot for *items* from *lo* to *hi* (inclusive) \
+that is guaranteed to have at least ~30% of the items on either side
+"""
+
+    medians = lo
+
+    for start in range(lo, hi + 1, 5):
+        end = min(start + 4, hi)
+        _small_sort(items, start, end)
+        middle = (start + end) // 2
+        items[medians], items[middle] = items[middle], items[medians]
+        medians += 1
+
+    return _select(items, lo, medians - 1, (lo + medians - 1) // 2, 0)
+
+
+def _select(items, lo: int, hi: int, k: int, budget: int):
+    """Moves the *k*-th smallest item of *items* (from *lo* to *hi*) \
+to index *k*, partitioning the rest around it, and returns it
+
+Picks median-of-3 pivots while *budget* lasts (it is decremented for
+every partition), and median-of-medians pivots afterwards
+"""
+
+    while hi - lo >= 16:
+        if budget > 0:
+            budget -= 1
+            middle = (lo + hi) // 2
+            pivot = sorted((items[lo], items[middle], items[hi]))[1]
+
+        else:
+            pivot = _median_of_medians(items, lo, hi)
+
+        first, last = _partition(items, lo, hi, pivot)
+
+        if k < first:
+            hi = first - 1
+
+        elif k > last:
+            lo = last + 1
+
+        else:
+            return items[k]
+
+    _small_sort(items, lo, hi)
+
+    return items[k]
+
+
+def introselect(items, k: int):
+    """Returns the *k*-th smallest item (counting from 0) of *items*, \
+reordering them in place so that it is at index *k*, with no greater
+item before it and no smaller item after it
+
+Explanation
+    Quickselect: partition the items around a pivot, and continue in
+    the part that holds index *k* only. With median-of-3 pivots this
+    takes O(n) steps on average; once it has partitioned 2 log2(n)
+    times without finishing, it switches to median-of-medians pivots,
+    which bounds the worst case to O(n) too. Works in place on any
+    mutable sequence (e.g., an Array or a writable memoryview)
+"""
+
+    if not 0 <= k < len(items):
+        raise IndexError(f"'{k}' is out of range")
+
+    return _select(items, 0, len(items) - 1, k, 2 * len(items).bit_length())
+
+
+def median_of_medians(items, k: int):
+    """Returns the *k*-th smallest item of *items* like `introselect`, \
+but always picks median-of-medians pivots (a worst case of O(n), with
+a larger constant factor)
+"""
+
+    if not 0 <= k < len(items):
+        raise IndexError(f"'{k}' is out of range")
+
+    return _select(items, 0, len(items) - 1, k, 0)
+
+
+class Graph:
+    """Instantiates a graph stored as a compressed sparse row (CSR) \
+index
+
+Parameters
+    offsets (Array) - The 'q' Array of (vertex count + 1) offsets of
+        the edges of every vertex in *targets*
+    targets (Array) - The 'q' Array of the target vertex of every edge
+    weights=None (Array) - The 'd' Array of the weight of every edge
+    nodes=None (tuple) - The node object of every vertex (if built by
+        `Graph.from_node`)
+
+Example
+    graph = Graph.from_edges([(0, 1), (1, 2), (0, 2)])
+    graph.neighbors(0)
+    breadth_first_search(graph, 0)
+
+Explanation
+    Vertices are the numbers 0 to `len(graph) - 1`. The targets of the
+    edges of vertex v are `targets[offsets[v]:offsets[v + 1]]` (and
+    their weights the same slice of *weights*), so the whole graph is
+    three flat buffers: 8 bytes per vertex and 8 (or 16, weighted)
+    bytes per edge, instead of a list (and a Python integer per edge)
+    per vertex. Build one with `Graph.from_edges`, `Graph.from_arrays`
+    or `Graph.from_node` rather than by hand.
+
+    An undirected graph is stored with every edge in both directions.
+"""
+
+    def __init__(self, offsets: Array, targets: Array,
+                 weights: typing.Union[Array, NoneType] = None,
+                 nodes: typing.Union[tuple, NoneType] = None) -> NoneType:
+        if not len(offsets) or offsets[-1] != len(targets):
+            raise ValueError("'offsets' must end with the edge count")
+
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("'weights' must have a weight per edge")
+
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.nodes = nodes
+
+        return None
+
+    @classmethod
+    def from_arrays(
+        cls, sources, targets, weights=None,
+        count: typing.Union[int, NoneType] = None, directed: bool = True
+    ) -> Graph:
+        """Returns a Graph of the edges *sources[i]* -> *targets[i]* \
+(weighing *weights[i]*), with *count* vertices (by default, one more
+than the largest vertex), raising ValueError for vertices out of range
+
+The edges are bucketed by source in O(V + E) steps (by NumPy, when it
+is installed), keeping the given order within each vertex
+"""
+
+        if len(sources) != len(targets):
+            raise ValueError("'sources' and 'targets' must have the same "
+                             "length")
+
+        if not directed:
+            sources, targets = (
+                Array('q', _chain(sources, targets)),
+                Array('q', _chain(targets, sources))
+            )
+            weights = (
+                None if weights is None else Array('d', _chain(weights,
+                                                               weights))
+            )
+
+        lowest = min(_chain(sources, targets), default=0)
+        highest = max(_chain(sources, targets), default=-1)
+
+        if count is None:
+            count = highest + 1
+
+        if lowest < 0 or highest >= count:
+            raise ValueError(f"vertices must be from 0 to {count - 1} (got "
+                             f"{lowest if lowest < 0 else highest})")
+
+        numpy = _dstructs._load_numpy() if Array.use_numpy else None
+
+        if numpy is not None:
+            sources = numpy.asarray(sources, dtype=numpy.int64)
+            order = numpy.argsort(sources, kind='stable')
+            offsets = numpy.zeros(count + 1, dtype=numpy.int64)
+            numpy.cumsum(numpy.bincount(sources, minlength=count),
+                         out=offsets[1:])
+
+            return cls(
+                _dstructs._from_numpy('q', offsets),
+                _dstructs._from_numpy(
+                    'q', numpy.asarray(targets, dtype=numpy.int64)[order]
+                ),
+                None if weights is None else _dstructs._from_numpy(
+                    'd', numpy.asarray(weights, dtype=numpy.float64)[order]
+                )
+            )
+
+        offsets = Array('q', bytes(8 * (count + 1)))
+
+        for source in sources:
+            offsets[source + 1] += 1
+
+        for vertex in range(count):
+            offsets[vertex + 1] += offsets[vertex]
+
+        positions = Array('q', offsets)
+        ordered = Array('q', bytes(8 * len(targets)))
+        ordered_weights = (
+            None if weights is None else Array('d', bytes(8 * len(targets)))
+        )
+
+        for edge, source in enumerate(sources):
+            position = positions[source]
+            positions[source] = position + 1
+            ordered[position] = targets[edge]
+
+            if weights is not None:
+                ordered_weights[position] = weights[edge]
+
+        return cls(offsets, ordered, ordered_weights)
+
+    @classmethod
+    def from_edges(
+        cls, edges: typing.Iterable[tuple],
+        count: typing.Union[int, NoneType] = None, directed: bool = True
+    ) -> Graph:
+        """Returns a Graph of *edges*, which are (source, target) or \
+(source, target, weight) tuples (see `Graph.from_arrays`)
+"""
+
+        sources, targets, weights = Array('q'), Array('q'), Array('d')
+
+        for edge in edges:
+            sources.append(edge[0])
+            targets.append(edge[1])
+
+            if len(edge) > 2:
+                weights.append(edge[2])
+
+        if weights and len(weights) != len(targets):
+            raise ValueError("either all or no edges must have a weight")
+
+        return cls.from_arrays(sources, targets, weights or None, count,
+                               directed)
+
+    @classmethod
+    def from_node(cls, root: Node, directed: bool = True) -> Graph:
+        """Returns a Graph of the tree under *root*, with an edge from \
+every node object to each of its children
+
+Vertices are numbered in pre-order (*root* is 0), and
+`graph.nodes[vertex]` is the node object of a vertex
+"""
+
+        if not isinstance(root, Node):
+            raise TypeError(f"'{root}' must be of type 'Node'")
+
+        nodes = tuple(root.preorder())
+        vertices = {id(node): vertex for vertex, node in enumerate(nodes)}
+        sources, targets = Array('q'), Array('q')
+
+        for vertex, node in enumerate(nodes):
+            for child in node:
+                sources.append(vertex)
+                targets.append(vertices[id(child)])
+
+        graph = cls.from_arrays(sources, targets, count=len(nodes),
+                                directed=directed)
+        graph.nodes = nodes
+
+        return graph
+
+    def __repr__(self) -> str:
+        return f'<Graph of {len(self)} vertices and {self.edge_count} edges>'
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        """The number of (directed) edges"""
+
+        return len(self.targets)
+
+    def degree(self, vertex: int) -> int:
+        """Returns the number of edges from *vertex*"""
+
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    def neighbors(self, vertex: int) -> memoryview:
+        """Returns a (zero-copy) view of the targets of the edges from \
+*vertex*
+"""
+
+        return memoryview(self.targets)[
+            self.offsets[vertex]:self.offsets[vertex + 1]
+        ]
+
+    def edge_weights(self, vertex: int) -> memoryview:
+        """Returns a (zero-copy) view of the weights of the edges from \
+*vertex* (all 1.0 for an unweighted graph)
+"""
+
+        if self.weights is None:
+            return memoryview(Array('d', _repeat(1.0, self.degree(vertex))))
+
+        return memoryview(self.weights)[
+            self.offsets[vertex]:self.offsets[vertex + 1]
+        ]
+
+    def reverse(self) -> Graph:
+        """Returns the Graph with every edge reversed"""
+
+        sources = Array('q')
+
+        for vertex in range(len(self)):
+            sources.extend(_repeat(vertex, self.degree(vertex)))
+
+        graph = Graph.from_arrays(self.targets, sources, self.weights,
+                                  len(self))
+        graph.nodes = self.nodes
+
+        return graph
+
+
+def breadth_first_search(graph: Graph, source: int) -> Array:
+    """Returns a 'q' Array of the number of edges on a shortest path \
+from *source* to every vertex of *graph* (-1 if there is none)
+
+Explanation
+    Visits the graph level by level: the vertices one edge away from
+    *source*, then those one edge away from them, and so on, reading
+    the neighbors of each vertex from the graph's buffers
+"""
+
+    # Slicing a view of the targets (once per vertex) copies nothing,
+    # where slicing the Array would copy the edges of every vertex
+    offsets, targets = graph.offsets, memoryview(graph.targets)
+    distances = Array('q', _repeat(-1, len(graph)))
+    distances[source] = 0
+    frontier = [source]
+    distance = 0
+
+    while frontier:
+        distance += 1
+        next_frontier = []
+
+        for vertex in frontier:
+            for target in targets[offsets[vertex]:offsets[vertex + 1]]:
+                if distances[target] < 0:
+                    distances[target] = distance
+                    next_frontier.append(target)
+
+        frontier = next_frontier
+
+    return distances
+
+
+def dijkstra(graph: Graph, source: int, heap: str = 'binary') -> Array:
+    """Returns a 'd' Array of the weight of a lightest path from \
+*source* to every vertex of *graph* (inf if there is none)
+
+Parameters
+    graph (Graph) - The graph to search
+    source (int) - The vertex to start from
+    heap='binary' (str) - The priority queue: 'binary' (`heapq`),
+        'dary' (a 4-ary `DaryHeap`) or 'pairing' (a `PairingHeap`)
+
+Explanation
+    Repeatedly takes the closest vertex not yet settled from the heap
+    and relaxes its edges. With a 'binary' heap, instead of
+    decreasing keys, an improved vertex is pushed again, and stale
+    entries are skipped when popped; the other heaps decrease the key
+    of the vertex in place, so they never hold more than one entry
+    per vertex. Edges weigh 1 in an unweighted graph; negative
+    weights are not supported.
+"""
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    if weights and min(weights) < 0:
+        raise ValueError("'graph' must not have negative weights")
+
+    distances = Array('d', _repeat(float('inf'), len(graph)))
+    distances[source] = 0.0
+
+    if heap == 'binary':
+        queue = [(0.0, source)]
+
+        while queue:
+            distance, vertex = _heappop(queue)
+
+            if distance > distances[vertex]:
+                continue
+
+            for edge in range(offsets[vertex], offsets[vertex + 1]):
+                target = targets[edge]
+                length = distance + (
+                    1.0 if weights is None else weights[edge]
+                )
+
+                if length < distances[target]:
+                    distances[target] = length
+                    _heappush(queue, (length, target))
+
+        return distances
+
+    if heap == 'dary':
+        queue = _dstructs.DaryHeap([(source, 0.0)])
+
+    elif heap == 'pairing':
+        queue = _dstructs.PairingHeap([(source, 0.0)])
+
+    else:
+        raise ValueError("heap must be 'binary', 'dary' or 'pairing'")
+
+    while queue:
+        vertex, distance = queue.pop()
+
+        for edge in range(offsets[vertex], offsets[vertex + 1]):
+            target = targets[edge]
+            length = distance + (1.0 if weights is None else weights[edge])
+
+            if length < distances[target]:
+                if target in queue:
+                    queue.decrease_key(target, length)
+
+                else:
+                    queue.push(target, length)
+
+                distances[target] = length
+
+    return distances
+
+
+def topological_sort(graph: Graph) -> Array:
+    """Returns a 'q' Array of the vertices of the (directed, acyclic) \
+*graph*, every vertex before the targets of its edges
+
+Raises ValueError if the graph has a cycle. Uses Kahn's algorithm:
+count the edges into every vertex, and repeatedly output a vertex
+with none left, removing its edges
+"""
+
+    offsets, targets = graph.offsets, memoryview(graph.targets)
+    remaining = Array('q', bytes(8 * len(graph)))
+
+    for target in targets:
+        remaining[target] += 1
+
+    order = Array('q', (
+        vertex for vertex in range(len(graph)) if not remaining[vertex]
+    ))
+    position = 0
+
+    while position < len(order):
+        vertex = order[position]
+        position += 1
+
+        for target in targets[offsets[vertex]:offsets[vertex + 1]]:
+            remaining[target] -= 1
+
+            if not remaining[target]:
+                order.append(target)
+
+    if len(order) != len(graph):
+        raise ValueError("'graph' has a cycle")
+
+    return order
+
+
+def connected_components(graph: Graph) -> Array:
+    """Returns a 'q' Array of the component of every vertex of \
+*graph*, numbering the (weakly) connected components from 0 in order
+of their smallest vertex
+
+Explanation
+    A union-find (disjoint set) forest, kept in a 'q' Array of
+    parents: every edge merges the trees of its two vertices (the
+    smaller tree under the larger one), and lookups halve the paths
+    they walk, so the whole pass is almost linear in the edges
+"""
+
+    offsets, targets = graph.offsets, memoryview(graph.targets)
+    parents = Array('q', range(len(graph)))
+    sizes = Array('q', _repeat(1, len(graph)))
+
+    def find(vertex: int) -> int:
+        while parents[vertex] != vertex:
+            parents[vertex] = parents[parents[vertex]]
+            vertex = parents[vertex]
+
+        return vertex
+
+    for vertex in range(len(graph)):
+        for target in targets[offsets[vertex]:offsets[vertex + 1]]:
+            this, that = find(vertex), find(target)
+
+            if this != that:
+                if sizes[this] < sizes[that]:
+                    this, that = that, this
+
+                parents[that] = this
+                sizes[this] += sizes[that]
+
+    labels = Array('q', _repeat(-1, len(graph)))
+    count = 0
+
+    for vertex in range(len(graph)):
+        root = find(vertex)
+
+        if labels[root] < 0:
+            labels[root] = count
+            count += 1
+
+        labels[vertex] = labels[root]
+
+    return labels
+
+
+def pagerank(graph: Graph, damping: float = 0.85,
+             tolerance: float = 1e-9, iterations: int = 100) -> Array:
+    """Returns a 'd' Array of the PageRank of every vertex of *graph*
+
+Parameters
+    graph (Graph) - The graph to rank
+    damping=0.85 (float) - The probability of following an edge
+    tolerance=1e-9 (float) - Stops once the ranks change by less
+    iterations=100 (int) - Stops after this many iterations anyway
+
+Explanation
+    Power iteration: every vertex passes its rank, split evenly, along
+    its edges (a vertex without edges passes it to all vertices), and
+    every rank is damped towards the average. With NumPy installed,
+    each iteration is a gather and a `bincount` over the buffers.
+"""
+
+    count = len(graph)
+
+    if not count:
+        return Array('d')
+
+    offsets, targets = graph.offsets, graph.targets
+    numpy = _dstructs._load_numpy() if Array.use_numpy else None
+
+    if numpy is not None:
+        degrees = numpy.diff(numpy.asarray(offsets))
+        sources = numpy.repeat(numpy.arange(count), degrees)
+        edges = numpy.asarray(targets)
+        dangling = degrees == 0
+        shares = numpy.where(dangling, 0.0, 1.0 / numpy.maximum(degrees, 1))
+        ranks = numpy.full(count, 1.0 / count)
+
+        for _ in range(iterations):
+            new = numpy.bincount(
+                edges, (ranks * shares)[sources], minlength=count
+            )
+            new = damping * (new + ranks[dangling].sum() / count)
+            new += (1.0 - damping) / count
+            change = numpy.abs(new - ranks).sum()
+            ranks = new
+
+            if change < tolerance:
+                break
+
+        return _dstructs._from_numpy('d', ranks)
+
+    ranks = Array('d', _repeat(1.0 / count, count))
+
+    for _ in range(iterations):
+        dangling = sum(
+            ranks[vertex] for vertex in range(count)
+            if offsets[vertex] == offsets[vertex + 1]
+        )
+        new = Array('d', _repeat(
+            (1.0 - damping) / count + damping * dangling / count, count
+        ))
+
+        for vertex in range(count):
+            start, end = offsets[vertex], offsets[vertex + 1]
+
+            if start != end:
+                share = damping * ranks[vertex] / (end - start)
+
+                for target in targets[start:end]:
+                    new[target] += share
+
+        change = sum(abs(this - that) for this, that in zip(new, ranks))
+        ranks = new
+
+        if change < tolerance:
+            break
+
+    return ranks
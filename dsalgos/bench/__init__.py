@@ -0,0 +1,235 @@
+"""A package to benchmark Data Structures and Algorithms
+
+(run it as `python -m dsalgos.bench --help`)
+
+Every benchmark is a *case*: a function that takes a size N, sets up
+whatever the benchmark needs, and returns the operation to measure (a
+callable taking no arguments), which does N units of work. `run`
+sweeps the registered cases over the given sizes, measuring for each
+- the time of the operation (the best of a few repeats),
+- the peak memory it allocates (with `tracemalloc`) and, optionally,
+- the number of times (per unit of work) it calls every `__init__`,
+  `__eq__` and property setter of the classes of `dsalgos.dstructs`,
+  and rebuilds a `Data.data` view (see `instrument`),
+so a change in complexity shows up as a number that grows with N.
+"""
+
+
+# Import `annotations` from `__future__` for delayed annotations
+from __future__ import annotations
+
+
+__all__ = ('CASES', 'case', 'instrument', 'measure', 'run', 'compare')
+
+
+# Import `Counter` from `collections` for the instrumentation counters
+from collections import Counter as _Counter
+
+# Import `contextmanager` from `contextlib` for the instrumentation mode
+from contextlib import contextmanager as _contextmanager
+
+# Import `fnmatch` from `fnmatch` for selecting cases by name
+from fnmatch import fnmatch as _fnmatch
+
+# Import `wraps` from `functools` for the instrumented methods
+from functools import wraps as _wraps
+
+# Import `gc` as `_gc` to collect garbage between measurements
+import gc as _gc
+
+# Import `perf_counter` from `time` for timing
+from time import perf_counter as _perf_counter
+
+# Import `tracemalloc` as `_tracemalloc` for memory measurements
+import tracemalloc as _tracemalloc
+
+# Import `typing` for type annotations
+import typing
+
+
+# Type/Class of `None` (NoneType)
+NoneType = type(None)
+
+# The registered cases, by name (filled by `dsalgos.bench.cases`)
+CASES: typing.Dict[str, typing.Callable] = {}
+
+
+def case(name: str) -> typing.Callable:
+    """Returns a decorator registering a case as *name*"""
+
+    def register(function: typing.Callable) -> typing.Callable:
+        CASES[name] = function
+
+        return function
+
+    return register
+
+
+def _counted(function: typing.Callable, counts: _Counter,
+             label: str) -> typing.Callable:
+    @_wraps(function)
+    def counted(*args, **kwargs):
+        counts[label] += 1
+
+        return function(*args, **kwargs)
+
+    return counted
+
+
+def _counted_data(fget: typing.Callable, counts: _Counter) -> typing.Callable:
+    @_wraps(fget)
+    def counted(data):
+        if data._data is None:
+            counts['Data.data (rebuild)'] += 1
+
+        return fget(data)
+
+    return counted
+
+
+@_contextmanager
+def instrument(counts: typing.Union[_Counter, NoneType] = None):
+    """Counts calls into the classes of `dsalgos.dstructs` while the \
+`with` block runs, yielding the Counter of the counts
+
+Counts, per class, every `__init__` call (as 'Class()', i.e., the
+objects created), every `__eq__` call and every call of a property
+setter (as 'Class.name='), and every rebuild of a `Data.data` view.
+The methods are wrapped (and put back afterwards) on the classes
+themselves, so this slows everything down and is not thread-safe;
+use it to count, not to time.
+"""
+
+    from dsalgos import dstructs
+
+    counts = _Counter() if counts is None else counts
+    originals = []
+
+    def patch(cls: type, name: str, value) -> NoneType:
+        originals.append((cls, name, vars(cls)[name]))
+        setattr(cls, name, value)
+
+        return None
+
+    for cls in vars(dstructs).values():
+        if not isinstance(cls, type) or cls.__module__ != dstructs.__name__:
+            continue
+
+        for name, attribute in list(vars(cls).items()):
+            if name == '__init__':
+                patch(cls, name, _counted(
+                    attribute, counts, f'{cls.__name__}()'
+                ))
+
+            elif name == '__eq__':
+                patch(cls, name, _counted(
+                    attribute, counts, f'{cls.__name__}.__eq__'
+                ))
+
+            elif isinstance(attribute, property):
+                fget, fset = attribute.fget, attribute.fset
+
+                if (cls, name) == (dstructs.Data, 'data'):
+                    fget = _counted_data(fget, counts)
+
+                elif fset is None:
+                    continue
+
+                if fset is not None:
+                    fset = _counted(fset, counts, f'{cls.__name__}.{name}=')
+
+                patch(cls, name, property(
+                    fget, fset, attribute.fdel, attribute.__doc__
+                ))
+
+    try:
+        yield counts
+
+    finally:
+        for cls, name, value in reversed(originals):
+            setattr(cls, name, value)
+
+
+def measure(function: typing.Callable, size: int, repeat: int = 3,
+            memory: bool = True, counts: bool = False) -> dict:
+    """Returns the measurements of the case *function* at *size*
+
+The result has the best time in seconds of *repeat* runs ('seconds')
+and per unit of work ('ns_per_op') and, if requested, the peak
+memory allocated in bytes ('peak_bytes') and the instrumentation
+counts per unit of work ('counts'), each from a run of its own
+"""
+
+    result = {'size': size, 'seconds': float('inf')}
+
+    for _ in range(repeat):
+        operation = function(size)
+        _gc.collect()
+        start = _perf_counter()
+        operation()
+        result['seconds'] = min(result['seconds'], _perf_counter() - start)
+
+    result['ns_per_op'] = result['seconds'] / max(size, 1) * 1e9
+
+    if memory:
+        operation = function(size)
+        _gc.collect()
+        _tracemalloc.start()
+
+        try:
+            operation()
+            result['peak_bytes'] = _tracemalloc.get_traced_memory()[1]
+
+        finally:
+            _tracemalloc.stop()
+
+    if counts:
+        operation = function(size)
+
+        with instrument() as counter:
+            operation()
+
+        result['counts'] = {
+            label: count / max(size, 1)
+            for label, count in sorted(counter.items())
+        }
+
+    return result
+
+
+def run(sizes: typing.Iterable[int] = (100, 1000, 10000),
+        pattern: str = '*', repeat: int = 3, memory: bool = True,
+        counts: bool = False) -> typing.List[dict]:
+    """Returns the measurements (see `measure`, with a 'case' key) of \
+every registered case whose name matches the glob *pattern*, at every
+size of *sizes*
+"""
+
+    # Importing the cases registers them
+    import dsalgos.bench.cases
+
+    return [
+        {'case': name, **measure(function, size, repeat, memory, counts)}
+        for name, function in CASES.items() if _fnmatch(name, pattern)
+        for size in sizes
+    ]
+
+
+def compare(results: typing.List[dict],
+            baseline: typing.List[dict]) -> typing.List[dict]:
+    """Returns *results* with the ratio of their time to that of the \
+same case and size in *baseline* ('ratio', None if it has none)
+"""
+
+    seconds = {
+        (result['case'], result['size']): result['seconds']
+        for result in baseline
+    }
+
+    return [
+        {**result, 'ratio': (
+            result['seconds'] / seconds[result['case'], result['size']]
+            if seconds.get((result['case'], result['size'])) else None
+        )}
+        for result in results
+    ]
@@ -0,0 +1,97 @@
+"""Runs the benchmarks of `dsalgos.bench`
+
+Usage
+    python -m dsalgos.bench [-s SIZE ...] [-k PATTERN] [-r REPEAT]
+                            [--counts] [--no-memory] [--json PATH]
+                            [--compare PATH] [--list]
+"""
+
+
+# Import `annotations` from `__future__` for delayed annotations
+from __future__ import annotations
+
+
+# Import `argparse` for the command line interface
+import argparse
+
+# Import `json` for reading and writing results
+import json
+
+# Import `platform` and `sys` to record the environment of a run
+import platform
+import sys
+
+# Import `typing` for type annotations
+import typing
+
+# Import the benchmark runner (and its cases, registering them)
+import dsalgos
+import dsalgos.bench.cases
+from dsalgos import bench
+
+
+def main(argv: typing.Union[typing.List[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m dsalgos.bench', description=__doc__.splitlines()[0]
+    )
+    parser.add_argument('-s', '--size', type=int, nargs='+',
+                        default=[100, 1000, 10000],
+                        help='the sizes to sweep (default: 100 1000 10000)')
+    parser.add_argument('-k', '--pattern', default='*',
+                        help="runs the cases matching a glob, e.g. 'Node*'")
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='times each case this often, keeping the best')
+    parser.add_argument('--counts', action='store_true',
+                        help='counts constructor, __eq__ and setter calls')
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                        help='skips the tracemalloc peak memory run')
+    parser.add_argument('--json', metavar='PATH',
+                        help='writes the results to a JSON file')
+    parser.add_argument('--compare', metavar='PATH',
+                        help='compares the times with a previous JSON file')
+    parser.add_argument('--list', action='store_true',
+                        help='lists the cases and exits')
+    options = parser.parse_args(argv)
+
+    if options.list:
+        print('\n'.join(bench.CASES))
+
+        return 0
+
+    results = bench.run(options.size, options.pattern, options.repeat,
+                        options.memory, options.counts)
+
+    if options.compare:
+        with open(options.compare) as file:
+            results = bench.compare(results, json.load(file)['results'])
+
+    print(f"{'case':<32}{'size':>8}{'ns/op':>12}{'peak KiB':>10}"
+          + (f"{'ratio':>8}" if options.compare else ''))
+
+    for result in results:
+        print(
+            f"{result['case']:<32}{result['size']:>8}"
+            f"{result['ns_per_op']:>12.0f}"
+            + (f"{result['peak_bytes'] / 1024:>10.1f}"
+               if 'peak_bytes' in result else f"{'-':>10}")
+            + (f"{result['ratio'] or float('nan'):>8.2f}"
+               if options.compare else '')
+        )
+
+        for label, count in result.get('counts', {}).items():
+            print(f"{'':<4}{label:<36}{count:>12.2f} per op")
+
+    if options.json:
+        with open(options.json, 'w') as file:
+            json.dump({
+                'dsalgos': dsalgos.__version__,
+                'python': sys.version,
+                'platform': platform.platform(),
+                'results': results,
+            }, file, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,436 @@
+"""The benchmark cases of `dsalgos.bench`, one or more for every \
+structure of `dsalgos.dstructs` (and the main algorithms)
+
+Every case takes a size N and returns an operation doing N units of
+work (e.g., N appends), having set up everything else beforehand
+"""
+
+
+# Import `annotations` from `__future__` for delayed annotations
+from __future__ import annotations
+
+
+# Import `asyncio` for the asyncio containers
+import asyncio
+
+# Import `io` for in-memory streams
+import io
+
+# Import `os` for temporary file paths
+import os
+
+# Import `random` for shuffled inputs
+import random
+
+# Import `tempfile` for Array files
+import tempfile
+
+# Import `typing` for type annotations
+import typing
+
+# Import the library
+from dsalgos import algos, dstructs
+from dsalgos.bench import NoneType, case
+
+
+def _chain(size: int) -> typing.List[dstructs.Node]:
+    return [dstructs.Node(dstructs.Data(i)) for i in range(size)]
+
+
+def _tree(size: int) -> dstructs.Node:
+    """Returns a random tree of *size* node objects"""
+
+    nodes = [dstructs.Node(dstructs.Data(0))]
+
+    for i in range(1, size):
+        nodes.append(dstructs.Node(
+            dstructs.Data(i), parent=random.choice(nodes)
+        ))
+
+    return nodes[0]
+
+
+@case('Data.data')
+def data_views(size: int) -> typing.Callable:
+    items = [dstructs.Data(i, key=i) for i in range(size)]
+
+    def operation():
+        for data in items:
+            data[0] = data[0] + 1
+            data.data
+
+    return operation
+
+
+@case('Data.__hash__')
+def data_hashes(size: int) -> typing.Callable:
+    items = [dstructs.Data(i, key=str(i)) for i in range(size)]
+
+    return lambda: set(items)
+
+
+@case('Node.next_')
+def node_links(size: int) -> typing.Callable:
+    nodes = _chain(size)
+
+    def operation():
+        for previous, next_ in zip(nodes, nodes[1:]):
+            previous.next_ = next_
+
+    return operation
+
+
+@case('Node.parent')
+def node_parents(size: int) -> typing.Callable:
+    root, nodes = dstructs.Node(), _chain(size)
+
+    def operation():
+        for node in nodes:
+            node.parent = root
+
+    return operation
+
+
+@case('Node.preorder')
+def node_preorder(size: int) -> typing.Callable:
+    root = _tree(size)
+
+    return lambda: sum(1 for _ in root.preorder())
+
+
+@case('Node.depth')
+def node_depths(size: int) -> typing.Callable:
+    root = _tree(size)
+    nodes = list(root.preorder())
+
+    return lambda: sum(node.depth for node in nodes)
+
+
+@case('AncestorIndex')
+def ancestor_index(size: int) -> typing.Callable:
+    root = _tree(size)
+
+    return lambda: dstructs.AncestorIndex(root)
+
+
+@case('TreeSnapshot')
+def tree_snapshot(size: int) -> typing.Callable:
+    root = _tree(size)
+
+    return root.freeze
+
+
+@case('dump/load')
+def dump_load(size: int) -> typing.Callable:
+    root = _tree(size)
+
+    def operation():
+        file = io.BytesIO()
+        dstructs.dump(root, file)
+        file.seek(0)
+        dstructs.load(file)
+
+    return operation
+
+
+@case('Array.sum')
+def array_sum(size: int) -> typing.Callable:
+    items = dstructs.Array('d', map(float, range(size)))
+
+    return items.sum
+
+
+@case('Array.save/load')
+def array_files(size: int) -> typing.Callable:
+    items = dstructs.Array('q', range(size))
+    path = os.path.join(tempfile.mkdtemp(), 'items.bin')
+
+    def operation():
+        items.save(path)
+        dstructs.Array.load(path)
+        os.remove(path)
+
+    return operation
+
+
+@case('MappedArray')
+def mapped_array(size: int) -> typing.Callable:
+    path = os.path.join(tempfile.mkdtemp(), 'items.bin')
+    dstructs.Array('q', range(size)).save(path)
+
+    def operation():
+        with dstructs.MappedArray(path) as items:
+            sum(items)
+
+    return operation
+
+
+@case('ArrayFile.append')
+def array_file(size: int) -> typing.Callable:
+    directory = tempfile.mkdtemp()
+
+    def operation():
+        path = os.path.join(directory, 'items.bin')
+
+        with dstructs.ArrayFile(path, 'q') as items:
+            for item in range(size):
+                items.append(item)
+
+        os.remove(path)
+
+    return operation
+
+
+@case('SharedArray.extend')
+def shared_array(size: int) -> typing.Callable:
+    def operation():
+        items = dstructs.SharedArray('q', capacity=size)
+
+        try:
+            items.extend(range(size))
+
+        finally:
+            items.close()
+            items.unlink()
+
+    return operation
+
+
+@case('SinglyLinkedList')
+def singly_linked_list(size: int) -> typing.Callable:
+    nodes = _chain(size)
+
+    return lambda: dstructs.SinglyLinkedList(elements=nodes)
+
+
+@case('SinglyLinkedList.move_to_front')
+def singly_linked_list_lru(size: int) -> typing.Callable:
+    nodes = _chain(size)
+    sllist = dstructs.SinglyLinkedList(elements=nodes, indexed=True)
+    order = random.sample(nodes, size)
+
+    def operation():
+        for node in order:
+            sllist.move_to_front(node)
+
+    return operation
+
+
+@case('ArrayLinkedList')
+def array_linked_list(size: int) -> typing.Callable:
+    def operation():
+        allist = dstructs.ArrayLinkedList()
+
+        for item in range(size):
+            allist.append(item)
+
+        while allist:
+            allist.popleft()
+
+    return operation
+
+
+@case('UnrolledList')
+def unrolled_list(size: int) -> typing.Callable:
+    positions = [random.randrange(size) for _ in range(size)]
+
+    def operation():
+        ulist = dstructs.UnrolledList('q', range(size))
+
+        for position in positions:
+            ulist.insert(position, position)
+
+        sum(sum(chunk) for chunk in ulist.chunks())
+
+    return operation
+
+
+@case('BTreeMap')
+def btree_map(size: int) -> typing.Callable:
+    keys = random.sample(range(4 * size), size)
+
+    def operation():
+        bmap = dstructs.BTreeMap()
+
+        for key in keys:
+            bmap[key] = key
+
+        for key in keys:
+            bmap[key]
+
+        sum(bmap.irange(0, 2 * size))
+
+        for key in keys:
+            del bmap[key]
+
+    return operation
+
+
+@case('DaryHeap')
+def dary_heap(size: int) -> typing.Callable:
+    items = [(item, random.random()) for item in range(size)]
+
+    def operation():
+        heap = dstructs.DaryHeap()
+
+        for item, priority in items:
+            heap.push(item, priority)
+
+        while len(heap):
+            heap.pop()
+
+    return operation
+
+
+@case('PairingHeap')
+def pairing_heap(size: int) -> typing.Callable:
+    items = [(item, random.random()) for item in range(size)]
+
+    def operation():
+        heap = dstructs.PairingHeap()
+
+        for item, priority in items:
+            heap.push(item, priority)
+
+        while len(heap):
+            heap.pop()
+
+    return operation
+
+
+@case('merge')
+def merge(size: int) -> typing.Callable:
+    runs = [sorted(random.random() for _ in range(size // 8))
+            for _ in range(8)]
+
+    return lambda: sum(1 for _ in dstructs.merge(*runs))
+
+
+@case('LRUCache')
+def lru_cache(size: int) -> typing.Callable:
+    keys = [random.randrange(size) for _ in range(size)]
+
+    def operation():
+        cache = dstructs.LRUCache(max(size // 10, 1))
+
+        for key in keys:
+            if cache.get(key) is None:
+                cache[key] = key
+
+    return operation
+
+
+@case('LFUCache')
+def lfu_cache(size: int) -> typing.Callable:
+    keys = [random.randrange(size) for _ in range(size)]
+
+    def operation():
+        cache = dstructs.LFUCache(max(size // 10, 1))
+
+        for key in keys:
+            if cache.get(key) is None:
+                cache[key] = key
+
+    return operation
+
+
+@case('TTLCache')
+def ttl_cache(size: int) -> typing.Callable:
+    keys = [random.randrange(size) for _ in range(size)]
+
+    def operation():
+        cache = dstructs.TTLCache(max(size // 10, 1))
+
+        for key in keys:
+            if cache.get(key) is None:
+                cache[key] = key
+
+    return operation
+
+
+@case('SizedCache')
+def sized_cache(size: int) -> typing.Callable:
+    keys = [random.randrange(size) for _ in range(size)]
+
+    def operation():
+        cache = dstructs.SizedCache(max(size // 10, 1) * 28)
+
+        for key in keys:
+            if cache.get(key) is None:
+                cache[key] = key
+
+    return operation
+
+
+def _fill(container, put: str, get: str, size: int) -> NoneType:
+    for item in range(size):
+        getattr(container, put)(item)
+
+    for _ in range(size):
+        getattr(container, get)()
+
+    return None
+
+
+@case('Queue')
+def queue(size: int) -> typing.Callable:
+    return lambda: _fill(dstructs.Queue(), 'put', 'get', size)
+
+
+@case('Stack')
+def stack(size: int) -> typing.Callable:
+    return lambda: _fill(dstructs.Stack(), 'push', 'pop', size)
+
+
+@case('Deque')
+def deque(size: int) -> typing.Callable:
+    return lambda: _fill(dstructs.Deque(), 'append', 'popleft', size)
+
+
+@case('AsyncQueue')
+def async_queue(size: int) -> typing.Callable:
+    async def fill():
+        container = dstructs.AsyncQueue()
+
+        for item in range(size):
+            await container.put(item)
+
+        for _ in range(size):
+            await container.get()
+
+    return lambda: asyncio.run(fill())
+
+
+@case('algos.sort')
+def sort(size: int) -> typing.Callable:
+    items = dstructs.Array('q', random.sample(range(size), size))
+
+    return lambda: algos.sort(items)
+
+
+@case('algos.linked_list_merge_sort')
+def linked_list_merge_sort(size: int) -> typing.Callable:
+    sllist = dstructs.SinglyLinkedList.from_iterable(
+        random.sample(range(size), size)
+    )
+
+    return lambda: algos.linked_list_merge_sort(sllist)
+
+
+@case('algos.batch_search')
+def batch_search(size: int) -> typing.Callable:
+    items = dstructs.Array('q', range(0, 2 * size, 2))
+    values = [random.randrange(2 * size) for _ in range(size)]
+
+    return lambda: algos.batch_search(items, values)
+
+
+@case('algos.dijkstra')
+def dijkstra(size: int) -> typing.Callable:
+    graph = algos.Graph.from_edges(
+        [(random.randrange(size), random.randrange(size), random.random())
+         for _ in range(4 * size)],
+        size
+    )
+
+    return lambda: algos.dijkstra(graph, 0)
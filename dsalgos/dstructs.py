@@ -8,27 +8,123 @@
 from __future__ import annotations
 
 
-__all__ = ('Data', 'Node', 'Array', 'LinkedList')
+__all__ = ('Data', 'Node', 'AncestorIndex', 'TreeSnapshot', 'Array',
+           'MappedArray', 'ArrayFile', 'SharedArray', 'SinglyLinkedList',
+           'ArrayLinkedList', 'UnrolledList', 'DaryHeap', 'PairingHeap',
+           'merge', 'LRUCache', 'LFUCache', 'TTLCache', 'SizedCache',
+           'memoize', 'Queue', 'Stack', 'Deque', 'AsyncQueue', 'AsyncStack',
+           'AsyncDeque', 'dump', 'load', 'iter_load', 'BTreeMap',
+           'BTreeSet')
 
 
 # Import `array` from `array` as `_Array` for C type arrays
 from array import array as _Array
 
+# Import `bisect_left` and `bisect_right` from `bisect` for binary search
+from bisect import bisect_left as _bisect_left
+from bisect import bisect_right as _bisect_right
+
+# Import `deque` from `collections` as `_Deque` for FIFO queues
+from collections import deque as _Deque
+
+# Import `contextmanager` and `nullcontext` from `contextlib` for
+# context managers and optional locks
+from contextlib import contextmanager as _contextmanager
+from contextlib import nullcontext as _nullcontext
+
+# Import `wraps` from `functools` for decorators
+from functools import wraps as _wraps
+
+# Import `gc` as `_gc` to pause the garbage collector while loading
+import gc as _gc
+
+# Import `heapq` as `_heapq` for binary heaps
+import heapq as _heapq
+
+# Import `chain`, `compress`, `count`, `islice` and `repeat` from
+# `itertools` for bulk operations
+from itertools import chain as _chain
+from itertools import compress as _compress
+from itertools import count as _count
+from itertools import islice as _islice
+from itertools import repeat as _repeat
+
+# Import `mmap` as `_mmap` for memory-mapped files
+import mmap as _mmap
+
+# Import `operator` as `_operator` for elementwise operations
+import operator as _operator
+
+# Import `os` as `_os` for file sizes and paths
+import os as _os
+
+# Import `Empty` and `Full` from `queue` for blocking containers
+from queue import Empty as _Empty
+from queue import Full as _Full
+
+# Import `Struct` from `struct` as `_Struct` for binary file headers
+from struct import Struct as _Struct
+
+# Import `sys` as `_sys` for the native byte order
+import sys as _sys
+
+# Import `threading` as `_threading` for locks and conditions
+import threading as _threading
+
+# Import `monotonic` from `time` for cache expiry
+from time import monotonic as _monotonic
+
+# Import `MappingProxyType` from `types` for read-only mappings
+from types import MappingProxyType as _MappingProxy
+
 # Import `typing` for type annotations
 import typing
 
+# `numpy`, for bulk Array operations, is imported (as `_numpy`) when it is
+# first needed, by `_load_numpy`, as importing it takes longer than
+# importing the rest of the package
+_numpy = _NOT_LOADED = object()
+
 
 # Type/Class of `None` (NoneType)
 NoneType = type(None)
 
 
+def _load_numpy():
+    """Returns the `numpy` module (importing it the first time), or \
+None if it is not installed
+"""
+
+    global _numpy
+
+    if _numpy is _NOT_LOADED:
+        try:
+            import numpy as _numpy
+
+        except ImportError:
+            _numpy = None
+
+    return _numpy
+
+
 class Data:
     """Data class to store any data, in any no. of *args* \
 (arguments) and *kwargs* (keyword arguments)
+
+The merged view of *args* and *kwargs* (`data`) is built once and
+cached, then kept up to date by `__setitem__` and dropped by
+`__iadd__` or by rebinding `args`/`kwargs`, so hashing, comparing
+and indexing a Data object does not rebuild a dict every time.
+Mutating the `kwargs` dict directly bypasses the cache; use item
+assignment instead.
 """
+    __slots__ = ('_args', '_kwargs', '_data', '_hash')
+
     def __init__(self, *args, **kwargs) -> NoneType:
-        self.args = args
-        self.kwargs = kwargs
+        self._args = args
+        self._kwargs = kwargs
+        self._data = None
+        self._hash = None
 
         return None
 
@@ -36,16 +132,22 @@ class Data:
         return f'Data{self.data}'
 
     def __eq__(self, data) -> bool:
+        if self is data:
+            return True
+
         if isinstance(data, Data):
             return self.data == data.data
         
         return False
 
     def __bool__(self) -> bool:
-        return self != Data()
+        return bool(self._args) or bool(self._kwargs)
     
     def __hash__(self) -> int:
-        return hash(self.data)
+        if self._hash is None:
+            self._hash = hash(frozenset(self.data.items()))
+
+        return self._hash
     
     def __contains__(self, value) -> bool:
         return value in self.data.values()
@@ -58,35 +160,129 @@ class Data:
 
     def __setitem__(self, key, value) -> NoneType:
         try:
-            self.args[key] = value
+            self._args[key] = value
 
         except TypeError:
-            self.kwargs[key] = value
+            self._kwargs[key] = value
+
+        if self._data is not None:
+            self._data[key] = value
+
+        self._hash = None
 
         return None
 
     def __add__(self, data) -> Data:
         if isinstance(data, Data):
             return Data(
-                *self.args, *data.args,
-                **self.kwargs, **data.kwargs
+                *self._args, *data._args,
+                **self._kwargs, **data._kwargs
             )
         
         raise TypeError(f"'{data}' must be of type 'Data'")
     
-    def __iadd__(self, data) -> NoneType:
+    def __iadd__(self, data) -> Data:
         if isinstance(data, Data):
-            self.args = self.args + data.args
-            self.kwargs.update(data.kwargs)
+            self._args = self._args + data._args
+            self._kwargs.update(data._kwargs)
+            self._invalidate()
+
+            return self
         
         raise TypeError(f"'{data}' must be of type 'Data'")
+
+    def _invalidate(self) -> NoneType:
+        self._data = None
+        self._hash = None
+
+        return None
+
+    @property
+    def args(self) -> tuple:
+        return self._args
+
+    @args.setter
+    def args(self, args) -> NoneType:
+        self._args = args
+        self._invalidate()
+
+        return None
+
+    @property
+    def kwargs(self) -> dict:
+        return self._kwargs
+
+    @kwargs.setter
+    def kwargs(self, kwargs) -> NoneType:
+        self._kwargs = kwargs
+        self._invalidate()
+
+        return None
     
     @property
     def data(self) -> dict:
-        return {
-            **dict(enumerate(self.args)),
-            **self.kwargs
-        }
+        """Returns the merged view of *args* (keyed by position) \
+and *kwargs* (keyed by name)
+
+The returned dict is cached and shared, so treat it as read-only
+"""
+
+        if self._data is None:
+            self._data = {
+                **dict(enumerate(self._args)),
+                **self._kwargs
+            }
+
+        return self._data
+
+
+class _EmptyData(Data):
+    """The shared, immutable empty Data object (`_EMPTY_DATA`) \
+used as the default data of node objects
+"""
+
+    __slots__ = ()
+
+    def __init__(self) -> NoneType:
+        super().__init__()
+        self._kwargs = _MappingProxy(self._kwargs)
+
+        return None
+
+    def __setitem__(self, key, value) -> NoneType:
+        raise TypeError("the empty default 'Data' is immutable, \
+assign a new 'Data' object instead")
+
+    def __iadd__(self, data) -> Data:
+        return self + data
+
+    @Data.args.setter
+    def args(self, args) -> NoneType:
+        raise TypeError("the empty default 'Data' is immutable")
+
+    @Data.kwargs.setter
+    def kwargs(self, kwargs) -> NoneType:
+        raise TypeError("the empty default 'Data' is immutable")
+
+    def __reduce__(self) -> tuple:
+        # Unpickles to the shared object (its read-only kwargs mapping
+        # cannot be pickled)
+        return _get_empty_data, ()
+
+    def __copy__(self) -> _EmptyData:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> _EmptyData:
+        return self
+
+
+_EMPTY_DATA = _EmptyData()
+
+
+def _get_empty_data() -> _EmptyData:
+    """Returns the shared empty Data object (for unpickling it)"""
+
+    return _EMPTY_DATA
 
 
 class Node:
@@ -95,7 +291,7 @@ class Node:
 Parameters
     data=0 (object) - An object of any datatype
     parent=None (Node) - A Node object as the parent
-    children=[] (list|tuple|set) - A list of children Node objects
+    children=() (list|tuple|set) - A list of children Node objects
     previous=None (Node) - A Node object before the current Node
     object in a collection (e.g., LinkedList, Stack,
         Queue, etc., objects)
@@ -129,14 +325,17 @@ Explanation
     in a network.
 """
 
+    __slots__ = ('data', 'action', '_parent', '_children',
+                 '_previous', '_next', '_depth', '_root')
+
     def __init__(
-        self, data: Data = Data(),
+        self, data: Data = _EMPTY_DATA,
         parent: typing.Union[Node, NoneType] = None,
         children: typing.Union[
             typing.List[Node],
             typing.Tuple[Node],
             typing.Set[Node]
-        ] = [],
+        ] = (),
         previous: typing.Union[Node, NoneType] = None,
         next_: typing.Union[Node, NoneType] = None,
         action = None
@@ -151,12 +350,13 @@ and next_ must be 'None' or of type 'Node'")
 type list|tuple|set containing 'Node' objects")
         
         self.data = data
-        self._parent = parent
-
-        if isinstance(parent, Node):
-            self.parent.children.append(self)
-
-        self.children = list(children)
+        self.action = action
+        self._parent = None
+        self._previous = None
+        self._next = None
+        self._children = None
+        self._depth = 0
+        self._root = None
 
         for child in children:
             if isinstance(child, Node):
@@ -164,43 +364,30 @@ type list|tuple|set containing 'Node' objects")
 
             else:
                 raise TypeError(f"{child} must be of type 'Node'")
-            
-        self._previous = previous
+
+        if parent is not None:
+            self.parent = parent
 
         if isinstance(previous, Node):
-            self.previous.next_ = self
-            
-        self._next = next_
+            self.previous = previous
 
         if isinstance(next_, Node):
-            self.next_.previous = self
-            
-        self.action = action
+            self.next_ = next_
 
         return None
 
     def __repr__(self) -> str:
         return (
             f'Node({repr(self.data)}, {repr(self.parent)}, '
-            f'{repr(self.children)}, {repr(self.previous)},'
+            f'{repr(self._children or [])}, {repr(self.previous)},'
             f' {repr(self.next_)}, {repr(self.action)})'
         )
 
     def __len__(self) -> int:
-        return len(self.children)
+        return 0 if self._children is None else len(self._children)
 
     def __eq__(self, node: Node) -> bool:
-        if isinstance(node, Node):
-            return (
-                self.data == node.data
-                and self.data == node.parent
-                and self.children == node.children
-                and self.previous == node.previous
-                and self.next_ == node.next_
-                and self.action == node.action
-            )
-        
-        return False
+        return self.equals(node)
 
     def __bool__(self) -> bool:
         return self == Node()
@@ -209,10 +396,114 @@ type list|tuple|set containing 'Node' objects")
         return hash((self.data, self.action))
     
     def __iter__(self):
-        return iter(self.children)
-        
+        return iter(() if self._children is None else self._children)
+
     def __contains__(self, child: Node) -> bool:
-        return child in self.children
+        return isinstance(child, Node) and child._parent is self
+
+    def equals(self, node: Node) -> bool:
+        """Returns True if *node* is equal in value to the node object, \
+else returns False
+
+Two node objects are equal in value when their data, action and
+children (compared the same way, pairwise) are equal. The links
+(parent, previous and next_) are not compared, which keeps the
+comparison finite on linked nodes; it is done without recursion.
+
+This is what `==` uses. The linkage setters (parent, previous and
+next_) compare node objects by identity (`is`) instead.
+"""
+
+        stack = [(self, node)]
+
+        while stack:
+            this, that = stack.pop()
+
+            if this is that:
+                continue
+
+            if not (
+                isinstance(that, Node)
+                and this.data == that.data
+                and this.action == that.action
+                and len(this) == len(that)
+            ):
+                return False
+
+            stack.extend(zip(this, that))
+
+        return True
+
+    def _detach(self) -> NoneType:
+        """Removes the node object from its parent's children \
+and links its previous and next siblings to each other
+
+Detaching the last child takes O(1). Any other child is found by an
+identity scan of the children list (run in C, as `list.index` would
+compare by value) and deleted from it, which takes O(n) in the no. of
+siblings, though with a small constant
+"""
+
+        parent = self._parent
+
+        if parent is None:
+            return None
+
+        children = parent._children
+
+        if children[-1] is self:
+            children.pop()
+
+        else:
+            del children[next(_compress(
+                _count(), map(_operator.is_, children, _repeat(self))
+            ))]
+
+        previous, next_ = self._previous, self._next
+
+        if previous is not None and previous._next is self:
+            previous._next = next_
+
+        if next_ is not None and next_._previous is self:
+            next_._previous = previous
+
+        self._parent = self._previous = self._next = None
+
+        return None
+
+    @property
+    def children(self) -> typing.List[Node]:
+        """Returns the list of children node objects
+
+The list is only created once a child is attached (or the property is
+read), so leaf nodes carry no empty list; prefer `len(node)` and
+`iter(node)` to check or walk the children without creating it.
+Detaching (or re-parenting) the last child takes O(1), any other child
+O(n) in the no. of its siblings
+"""
+
+        if self._children is None:
+            self._children = []
+
+        return self._children
+
+    @children.setter
+    def children(self, children) -> NoneType:
+        if not isinstance(children, (list, tuple, set)):
+            raise TypeError("children must be of \
+type list|tuple|set containing 'Node' objects")
+
+        for child in children:
+            if not isinstance(child, Node):
+                raise TypeError(f"{child} must be of type 'Node'")
+
+        for child in tuple(self):
+            child.parent = None
+
+        for child in children:
+            child.parent = self
+
+        return None
 
     @property
     def parent(self) -> typing.Union[Node, NoneType]:
@@ -222,18 +513,58 @@ type list|tuple|set containing 'Node' objects")
     def parent(self, parent: typing.Union[Node, NoneType]) -> NoneType:
         if not isinstance(parent, (Node, NoneType)):
             raise TypeError("parent must be 'None' or of type 'Node'")
-        
-        self._parent = parent
+
+        if parent is self._parent:
+            return None
+
+        if parent is self or (
+            parent is not None and self.is_ancestor_of(parent)
+        ):
+            raise ValueError("a node object cannot be its own ancestor")
+
+        self._detach()
+        self._invalidate_depth()
 
         if isinstance(parent, Node):
-            if self not in parent.children:
-                self.previous = (
-                    parent.children[-1]
-                    if len(parent.children) > 0
-                    else None
+            self._parent = parent
+
+            if parent._children is None:
+                parent._children = []
+
+            children = parent._children
+            self.previous = children[-1] if children else None
+            children.append(self)
+
+            if parent._depth != -1:
+                self._depth = parent._depth + 1
+                self._root = (
+                    parent if parent._root is None else parent._root
                 )
-                
-                parent.children.append(self)
+
+        else:
+            self._depth = 0
+
+        return None
+
+    def _invalidate_depth(self) -> NoneType:
+        """Marks the cached depth and root of the node object \
+and its descendants as stale
+
+A cached depth is only ever valid when the depths of all ancestors are
+valid too, so the walk stops at descendants that are already stale
+"""
+
+        stack = [self]
+
+        while stack:
+            node = stack.pop()
+
+            if node._depth != -1:
+                node._depth = -1
+                node._root = None
+
+                if node._children:
+                    stack.extend(node._children)
 
         return None
 
@@ -246,12 +577,19 @@ type list|tuple|set containing 'Node' objects")
         if not isinstance(previous, (Node, NoneType)):
             raise TypeError("previous must be 'None' or of type 'Node'")
 
+        if previous is self._previous:
+            return None
+
+        if isinstance(previous, Node) and previous._parent is not self._parent:
+            self.parent = previous._parent
+
+        if self._previous is not None and self._previous._next is self:
+            self._previous._next = None
+
         self._previous = previous
 
-        if isinstance(previous, Node):
-            if self != previous.next_:
-                previous.next_ = self
-                self.parent = previous.parent
+        if isinstance(previous, Node) and previous._next is not self:
+            previous.next_ = self
 
         return None
 
@@ -263,16 +601,160 @@ type list|tuple|set containing 'Node' objects")
     def next_(self, next_: typing.Union[Node, NoneType]) -> NoneType:
         if not isinstance(next_, (Node, NoneType)):
             raise TypeError("next_ must be 'None' or of type 'Node'")
-        
+
+        if next_ is self._next:
+            return None
+
+        if isinstance(next_, Node) and next_._parent is not self._parent:
+            self.parent = next_._parent
+
+        if self._next is not None and self._next._previous is self:
+            self._next._previous = None
+
         self._next = next_
 
-        if isinstance(next_, Node):
-            if self != next_.previous:
-                next_.previous = self
-                self.parent = next_.parent
+        if isinstance(next_, Node) and next_._previous is not self:
+            next_.previous = self
 
         return None
 
+    def preorder(
+        self,
+        prune: typing.Union[typing.Callable[[Node], bool], NoneType] = None,
+        max_depth: typing.Union[int, NoneType] = None
+    ):
+        """Yields the node object and its descendants in pre-order \
+(every node object before its children)
+
+The descendants of a node object for which *prune* returns True are
+skipped, as is everything deeper than *max_depth* levels below the
+node object. No recursion is used, so trees of any depth can be walked
+"""
+
+        yield self
+
+        if max_depth == 0 or not self._children or (prune and prune(self)):
+            return
+
+        stack = [iter(self._children)]
+
+        while stack:
+            for node in stack[-1]:
+                yield node
+
+                if (
+                    node._children
+                    and (max_depth is None or len(stack) < max_depth)
+                    and not (prune and prune(node))
+                ):
+                    stack.append(iter(node._children))
+
+                    break
+
+            else:
+                stack.pop()
+
+    def postorder(
+        self,
+        prune: typing.Union[typing.Callable[[Node], bool], NoneType] = None,
+        max_depth: typing.Union[int, NoneType] = None
+    ):
+        """Yields the descendants of the node object and then the node \
+object itself in post-order (every node object after its children)
+
+*prune* and *max_depth* work the same way as for `preorder`
+"""
+
+        if (
+            max_depth == 0 or not self._children
+            or (prune and prune(self))
+        ):
+            yield self
+
+            return
+
+        stack = [(self, iter(self._children))]
+
+        while stack:
+            node, iterator = stack[-1]
+
+            for child in iterator:
+                if (
+                    child._children
+                    and (max_depth is None or len(stack) < max_depth)
+                    and not (prune and prune(child))
+                ):
+                    stack.append((child, iter(child._children)))
+
+                    break
+
+                yield child
+
+            else:
+                stack.pop()
+
+                yield node
+
+    def breadth_first(
+        self,
+        prune: typing.Union[typing.Callable[[Node], bool], NoneType] = None,
+        max_depth: typing.Union[int, NoneType] = None
+    ):
+        """Yields the node object and its descendants in breadth-first \
+(level) order
+
+*prune* and *max_depth* work the same way as for `preorder`
+"""
+
+        queue = _Deque(((self, 0),))
+
+        while queue:
+            node, depth = queue.popleft()
+
+            yield node
+
+            if (
+                node._children
+                and (max_depth is None or depth < max_depth)
+                and not (prune and prune(node))
+            ):
+                queue.extend((child, depth + 1) for child in node._children)
+
+    def levels(
+        self,
+        prune: typing.Union[typing.Callable[[Node], bool], NoneType] = None,
+        max_depth: typing.Union[int, NoneType] = None
+    ):
+        """Yields a list of node objects for every level of the subtree, \
+starting with `[self]`
+
+*prune* and *max_depth* work the same way as for `preorder`
+"""
+
+        level = [self]
+        depth = 0
+
+        while level:
+            yield level
+
+            if max_depth is not None and depth >= max_depth:
+                return
+
+            level = [
+                child
+                for node in level
+                if node._children and not (prune and prune(node))
+                for child in node._children
+            ]
+            depth += 1
+
+    def freeze(self) -> TreeSnapshot:
+        """Returns a TreeSnapshot (a flat, array-backed copy) of the \
+subtree rooted at the node object
+"""
+
+        return TreeSnapshot(self)
+
     @property
     def degree(self) -> int:
         """Returns the degree, i.e., the no. of children of node object
@@ -292,15 +774,95 @@ between the root/main parent node object and the
 current node object, or the no. of node objects
 between the root and the current node objects
 """
-        
-        depth = 0
+
+        if self._depth != -1:
+            return self._depth
+
+        path = []
         currentnode = self
 
-        while currentnode.parent is not None:
-            depth = depth + 1
-            currentnode = currentnode.parent
+        while currentnode._depth == -1:
+            path.append(currentnode)
+            currentnode = currentnode._parent
+
+        for node in reversed(path):
+            node._depth = currentnode._depth + 1
+            node._root = (
+                currentnode if currentnode._root is None
+                else currentnode._root
+            )
+            currentnode = node
+
+        return self._depth
+
+    @property
+    def root(self) -> Node:
+        """Returns the root node object of the tree the node object is in
+
+The depth and root of a node object are cached, and only recomputed
+(from the nearest ancestor with a cached value) after the node object
+or one of its ancestors has been re-parented
+"""
+
+        self.depth
+
+        return self if self._root is None else self._root
+
+    def ancestors(self):
+        """Yields the ancestors of the node object, from its parent \
+up to the root
+"""
+
+        node = self._parent
+
+        while node is not None:
+            yield node
+            node = node._parent
+
+    def is_ancestor_of(self, node: Node) -> bool:
+        """Returns True if the node object is a (proper) ancestor \
+of *node*, else returns False
+
+Takes O(depth difference) steps; use an AncestorIndex to answer many
+such queries in O(1) each
+"""
+
+        if not isinstance(node, Node):
+            raise TypeError(f"'{node}' must be of type 'Node'")
+
+        steps = node.depth - self.depth
+
+        if steps <= 0:
+            return False
 
-        return depth
+        for _ in range(steps):
+            node = node._parent
+
+        return node is self
+
+    def lowest_common_ancestor(
+        self, node: Node
+    ) -> typing.Union[Node, NoneType]:
+        """Returns the deepest node object that is the node object \
+or an ancestor of it, and *node* or an ancestor of it (None if the
+two are not in the same tree)
+"""
+
+        if not isinstance(node, Node):
+            raise TypeError(f"'{node}' must be of type 'Node'")
+
+        this, that = self, node
+
+        for _ in range(this.depth - that.depth):
+            this = this._parent
+
+        for _ in range(that.depth - this.depth):
+            that = that._parent
+
+        while this is not that:
+            this, that = this._parent, that._parent
+
+        return this
 
     @property
     def isinternal(self):
@@ -342,41 +904,446 @@ A 'root' node is the main parent node
 
     @property
     def siblings(self) -> tuple:
-        """Returns a list of all siblings of a node object \
-(includes the current node object if *include_self* is True)
+        """Returns a tuple of all siblings of a node object \
+(excluding the current node object)
 
 A 'sibling' is a node object with the same
 parent node as the current Node object
+
+The parent's children are left untouched; use `iter_siblings` to walk
+the siblings without building a tuple
 """
-        
-        if self.isroot:
-            return ()
-        
-        siblings = self.parent.children
-        siblings.remove(self)
 
-        return tuple(siblings)
+        return tuple(self.iter_siblings())
 
+    def iter_siblings(self, include_self: bool = False):
+        """Yields all siblings of a node object, in order \
+(includes the current node object if *include_self* is True)
+"""
 
-class Array(_Array):
-    """Array(typecode [, initializer]) -> Array
+        if self._parent is None:
+            if include_self:
+                yield self
 
-Return a new Array whose items are restricted by typecode, and
-initialized from the optional initializer value, which must be a list,
-string or iterable over elements of the appropriate type.
+            return
 
-Arrays represent basic values and behave very much like lists, except
-the type of objects stored in them is constrained. The type is specified
-at object creation time by using a type code, which is a single character.
-The following type codes are defined:
-    Type code   C Type             Minimum size in bytes
-    'b'         signed integer     1
-    'B'         unsigned integer   1
-    'u'         Unicode character  2 (see note)
-    'h'         signed integer     2
-    'H'         unsigned integer   2
-    'i'         signed integer     2
-    'I'         unsigned integer   2
+        for child in self._parent._children:
+            if include_self or child is not self:
+                yield child
+
+    @property
+    def sibling_count(self) -> int:
+        """Returns the no. of siblings of a node object \
+(excluding the current node object)
+
+Returned value also accessible directly using:
+len(node.parent) - 1
+"""
+
+        return 0 if self._parent is None else len(self._parent) - 1
+
+    @property
+    def next_sibling(self) -> typing.Union[Node, NoneType]:
+        """Returns the sibling after the node object (None if it is \
+the last one, or a root), in O(1) through the `next_` link
+"""
+
+        next_ = self._next
+
+        if (
+            self._parent is None or next_ is None
+            or next_._parent is not self._parent
+        ):
+            return None
+
+        return next_
+
+    @property
+    def previous_sibling(self) -> typing.Union[Node, NoneType]:
+        """Returns the sibling before the node object (None if it is \
+the first one, or a root), in O(1) through the `previous` link
+"""
+
+        previous = self._previous
+
+        if (
+            self._parent is None or previous is None
+            or previous._parent is not self._parent
+        ):
+            return None
+
+        return previous
+
+
+class AncestorIndex:
+    """Instantiates an index of a tree for O(1) ancestor queries
+
+Parameters
+    root (Node) - The root node object of the (sub)tree to index
+
+Example
+    index = AncestorIndex(root)
+    index.is_ancestor(root, leaf)
+    index.lowest_common_ancestor(leaf, other_leaf)
+
+Explanation
+    The tree is walked once (without recursion), recording for every
+    node object its entry and exit time in a depth-first traversal.
+    A node object is an ancestor of another exactly when it is
+    entered before and exited after it, which is answered in O(1).
+    For lowest common ancestors, the index also keeps, for every k,
+    the 2**k-th ancestor of every node object ('binary lifting'), so
+    each query takes O(log(depth)) steps.
+
+    The index is a snapshot: it is not updated when the tree changes,
+    so build a new one after re-linking the nodes.
+"""
+
+    def __init__(self, root: Node) -> NoneType:
+        if not isinstance(root, Node):
+            raise TypeError(f"'{root}' must be of type 'Node'")
+
+        self.root = root
+        self._nodes = []
+        self._positions = {}
+        self._entry = Array('q')
+        self._exit = Array('q')
+        self._depth = Array('q')
+        parents = Array('q')
+
+        clock = 0
+        stack = [(root, -1, 0, False)]
+
+        while stack:
+            node, parent, depth, done = stack.pop()
+
+            if done:
+                self._exit[self._positions[id(node)]] = clock
+                clock += 1
+
+                continue
+
+            position = len(self._nodes)
+            self._positions[id(node)] = position
+            self._nodes.append(node)
+            self._entry.append(clock)
+            self._exit.append(clock)
+            self._depth.append(depth)
+            parents.append(position if parent == -1 else parent)
+            clock += 1
+
+            stack.append((node, parent, depth, True))
+            stack.extend(
+                (child, position, depth + 1, False)
+                for child in reversed(tuple(node))
+            )
+
+        self._up = [parents]
+
+        while (1 << len(self._up)) <= max(self._depth):
+            previous = self._up[-1]
+            self._up.append(Array('q', (previous[i] for i in previous)))
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'AncestorIndex({self.root!r})'
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node) -> bool:
+        return (
+            isinstance(node, Node)
+            and self._nodes[self._positions.get(id(node), 0)] is node
+        )
+
+    def _position(self, node: Node) -> int:
+        position = self._positions.get(id(node))
+
+        if position is None or self._nodes[position] is not node:
+            raise KeyError(f"'{node}' is not in the indexed tree")
+
+        return position
+
+    def depth(self, node: Node) -> int:
+        """Returns the depth of *node* relative to the indexed root"""
+
+        return self._depth[self._position(node)]
+
+    def is_ancestor(self, ancestor: Node, node: Node) -> bool:
+        """Returns True if *ancestor* is a (proper) ancestor of *node*, \
+else returns False, in O(1)
+"""
+
+        this, that = self._position(ancestor), self._position(node)
+
+        return (
+            self._entry[this] < self._entry[that]
+            and self._exit[that] < self._exit[this]
+        )
+
+    def _lowest_common_ancestor(self, this: int, that: int) -> int:
+        entry, exit_ = self._entry, self._exit
+
+        def covers(ancestor: int, node: int) -> bool:
+            return (
+                entry[ancestor] <= entry[node]
+                and exit_[node] <= exit_[ancestor]
+            )
+
+        if covers(this, that):
+            return this
+
+        if covers(that, this):
+            return that
+
+        for up in reversed(self._up):
+            if not covers(up[this], that):
+                this = up[this]
+
+        return self._up[0][this]
+
+    def lowest_common_ancestor(self, this: Node, that: Node) -> Node:
+        """Returns the deepest common ancestor of *this* and *that* \
+(either of them, if one is an ancestor of the other)
+"""
+
+        return self._nodes[self._lowest_common_ancestor(
+            self._position(this), self._position(that)
+        )]
+
+    def lowest_common_ancestors(
+        self, pairs: typing.Iterable[typing.Tuple[Node, Node]]
+    ):
+        """Yields the lowest common ancestor of each pair of *pairs*"""
+
+        position, nodes = self._position, self._nodes
+
+        for this, that in pairs:
+            yield nodes[self._lowest_common_ancestor(
+                position(this), position(that)
+            )]
+
+
+class TreeSnapshot:
+    """Instantiates a flat, array-backed snapshot of a tree
+
+Parameters
+    root (Node) - The root node object of the (sub)tree to copy
+
+Example
+    snapshot = TreeSnapshot(root)  # or root.freeze()
+    snapshot.depth_histogram()
+    root_copy = snapshot.to_node()
+
+Explanation
+    The node objects of the tree are numbered in pre-order (the root
+    is 0) and their structure is stored column by column, in Array
+    objects indexed by that number:
+
+        parent        - number of the parent (-1 for the root)
+        first_child   - number of the first child (-1 for leaves)
+        next_sibling  - number of the next sibling (-1 for the last)
+        depth         - depth below the root
+        size          - no. of node objects in the subtree
+
+    The `data` and `action` of every node object are kept in two
+    plain lists. Because of the pre-order numbering, the subtree of
+    node i is exactly the numbers i to i + size[i] - 1 (so i is its
+    entry time and i + size[i] - 1 its exit time), which turns
+    descendant tests and subtree scans into range checks and slices
+    instead of pointer chasing.
+
+    A snapshot does not change when the tree does; `to_node` builds
+    a new tree of node objects from it.
+"""
+
+    __slots__ = ('parent', 'first_child', 'next_sibling', 'depth', 'size',
+                 'data', 'action')
+
+    def __init__(self, root: Node) -> NoneType:
+        if not isinstance(root, Node):
+            raise TypeError(f"'{root}' must be of type 'Node'")
+
+        self.parent = parent = Array('q')
+        self.first_child = first_child = Array('q')
+        self.next_sibling = next_sibling = Array('q')
+        self.depth = depth = Array('q')
+        self.data = []
+        self.action = []
+        last_child = Array('q')
+
+        stack = [(root, -1, 0)]
+
+        while stack:
+            node, up, level = stack.pop()
+            number = len(parent)
+
+            parent.append(up)
+            first_child.append(-1)
+            next_sibling.append(-1)
+            last_child.append(-1)
+            depth.append(level)
+            self.data.append(node.data)
+            self.action.append(node.action)
+
+            if up != -1:
+                if first_child[up] == -1:
+                    first_child[up] = number
+
+                else:
+                    next_sibling[last_child[up]] = number
+
+                last_child[up] = number
+
+            if node._children:
+                stack.extend(
+                    (child, number, level + 1)
+                    for child in reversed(node._children)
+                )
+
+        self.size = size = Array('q', bytes(8 * len(parent)))
+
+        for number in range(len(parent) - 1, -1, -1):
+            size[number] += 1
+
+            if number:
+                size[parent[number]] += size[number]
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'TreeSnapshot({len(self)} nodes)'
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def __eq__(self, snapshot) -> bool:
+        if isinstance(snapshot, TreeSnapshot):
+            return (
+                self.parent == snapshot.parent
+                and self.data == snapshot.data
+                and self.action == snapshot.action
+            )
+
+        return False
+
+    def children(self, number: int):
+        """Yields the numbers of the children of node *number*"""
+
+        child = self.first_child[number]
+
+        while child != -1:
+            yield child
+            child = self.next_sibling[child]
+
+    def descendants(self, number: int) -> range:
+        """Returns the numbers of all (proper) descendants \
+of node *number*
+"""
+
+        return range(number + 1, number + self.size[number])
+
+    def is_descendant(self, number: int, ancestor: int) -> bool:
+        """Returns True if node *number* is a (proper) descendant \
+of node *ancestor*, else returns False, in O(1)
+"""
+
+        return ancestor < number < ancestor + self.size[ancestor]
+
+    def subtree_size(self, number: int) -> int:
+        """Returns the no. of node objects in the subtree \
+of node *number* (including itself)
+"""
+
+        return self.size[number]
+
+    def height(self) -> int:
+        """Returns the height of the tree (its greatest depth)"""
+
+        return max(self.depth)
+
+    def depth_histogram(self) -> typing.List[int]:
+        """Returns the no. of node objects at every depth"""
+
+        histogram = [0] * (self.height() + 1)
+
+        for level in self.depth:
+            histogram[level] += 1
+
+        return histogram
+
+    def level(self, depth: int) -> Array:
+        """Returns the numbers of all node objects at *depth*, in order"""
+
+        return Array(
+            'q', (number for number, level in enumerate(self.depth)
+                  if level == depth)
+        )
+
+    def leaves(self) -> Array:
+        """Returns the numbers of all node objects without children"""
+
+        return Array(
+            'q', (number for number, size in enumerate(self.size)
+                  if size == 1)
+        )
+
+    def to_node(self) -> Node:
+        """Returns the root of a new tree of node objects \
+with the snapshot's structure, data and actions
+"""
+
+        nodes = [
+            Node(data, action=action)
+            for data, action in zip(self.data, self.action)
+        ]
+        parent = self.parent
+
+        for number in range(1, len(nodes)):
+            nodes[number].parent = nodes[parent[number]]
+
+        return nodes[0]
+
+
+def _link(previous: Node, next_: Node) -> NoneType:
+    """Links *previous* to *next_* without running the Node setters"""
+
+    previous._next = next_
+    next_._previous = previous
+
+    return None
+
+
+def _as_node(value) -> Node:
+    """Returns *value* if it is a Node, else a new Node holding it"""
+
+    if isinstance(value, Node):
+        return value
+
+    return Node(value if isinstance(value, Data) else Data(value))
+
+
+class Array(_Array):
+    """Array(typecode [, initializer]) -> Array
+
+Return a new Array whose items are restricted by typecode, and
+initialized from the optional initializer value, which must be a list,
+string or iterable over elements of the appropriate type.
+
+Arrays represent basic values and behave very much like lists, except
+the type of objects stored in them is constrained. The type is specified
+at object creation time by using a type code, which is a single character.
+The following type codes are defined:
+    Type code   C Type             Minimum size in bytes
+    'b'         signed integer     1
+    'B'         unsigned integer   1
+    'u'         Unicode character  2 (see note)
+    'h'         signed integer     2
+    'H'         unsigned integer   2
+    'i'         signed integer     2
+    'I'         unsigned integer   2
     'l'         signed integer     4
     'L'         unsigned integer   4
     'q'         signed integer     8 (see note)
@@ -409,189 +1376,5259 @@ reverse() -- reverse the order of the items in the array
 tofile() -- write all items to a file object
 tolist() -- return the array converted to an ordinary list
 tobytes() -- return the array converted to a string
+save() -- write the array, with a small header, to a file
+load() -- read an array saved with save() (class method)
+open_mmap() -- map a file saved with save() into memory (class method)
+add(), subtract(), multiply(), divide() -- elementwise arithmetic
+compare() -- return an elementwise comparison as a mask Array
+select() -- return the items where a mask Array is set
+sum(), min(), max(), argmin(), argmax() -- reductions
+searchsorted() -- return insertion points into the (sorted) array
 
 Attributes:
 
 typecode -- the typecode character used to create the array
 itemsize -- the length in bytes of one array item
+
+The bulk operations (arithmetic to searchsorted) run in NumPy, over
+the array's own buffer (without copying it), when NumPy is installed
+and `Array.use_numpy` is True; otherwise they run in chunks of
+`Array.chunksize` items with C-level helpers (map, operator, bisect).
+Both backends behave the same way: dividing by zero raises
+ZeroDivisionError, and an integer result that does not fit in the
+typecode raises OverflowError, before the array is changed (operands
+that NumPy cannot compute exactly, such as 'Q' items with 'q' items,
+are computed in Python). Integers are summed exactly and floats in
+double precision (the last bits may differ, as NumPy sums pairwise),
+and NaN items are the smallest and the largest item, as in NumPy.
 """
 
-    pass
+    use_numpy: bool = True
+    chunksize: int = 65536
 
+    def _uses_numpy(self) -> bool:
+        return (
+            Array.use_numpy and self.typecode != 'u'
+            and _load_numpy() is not None
+        )
 
-class SinglyLinkedList:
-    """Instantiates a Singly Linked List object
+    def _operand(self, other):
+        """Returns *other* as a NumPy array (or scalar), checking its size"""
 
-Parameters
-    head=None (Node) - A head node object (at index = 0)
-    elements=[] (list|tuple|set) - A default list of node objects
+        if isinstance(other, (int, float)):
+            return other
 
-Example
-    sllist = SinglyLinkedList()
+        if len(other) != len(self):
+            raise ValueError("operands must have the same length")
 
-Explanation
-    A linked list is a linear collection of data elements, whose
-    order is not given by their physical placement in memory,
-    instead, each element points to the next. It is a data
-    structure consisting of a collection of nodes which together
-    represent a sequence. In its most basic form, each node contains:
-    data, and a reference (in other words, a link) to the next node
-    in the sequence. This structure allows for efficient insertion or
-    removal of elements from any position in the sequence during
-    iteration. More complex variants add additional links, allowing
-    more efficient insertion or removal of nodes at arbitrary
-    positions. A drawback of linked lists is that access time is
-    linear (and difficult to pipeline). Faster access, such as random
-    access, is not feasible. Arrays have better cache locality
-    compared to linked lists.
+        if isinstance(other, (_Array, MappedArray, memoryview)):
+            return _numpy.asarray(memoryview(
+                other.view if isinstance(other, MappedArray) else other
+            ))
 
-    Linked lists are among the simplest and most common data structures
-    They can be used to implement several other common abstract data
-    types, including lists, stacks, queues, associative arrays, and
-    S-expressions, though it is not uncommon to implement those data
-    structures directly without using a linked list as the basis.
+        return _numpy.asarray(other)
 
-    The principal benefit of a linked list over a conventional array
-    is that the list elements can be easily inserted or removed
-    without reallocation or reorganization of the entire structure
-    because the data items need not be stored contiguously in memory
-    or on disk, while restructuring an array at run-time is a much
-    more expensive operation. Linked lists allow insertion and
-    removal of nodes at any point in the list, and allow doing so
-    with a constant number of operations by keeping the link previous
-    to the link being added or removed in memory during list traversal.
+    def _chunks(self, other):
+        """Yields (start, end, items, other items) for every chunk"""
 
-    On the other hand, since simple linked lists by themselves do not
-    allow random access to the data or any form of efficient indexing,
-    many basic operations—such as obtaining the last node of the list,
-    finding a node that contains a given datum, or locating the place
-    where a new node should be inserted—may require iterating through
-    most or all of the list elements. The advantages and disadvantages
-    of using linked lists are given below. Linked list are dynamic, so
-    the length of list can increase or decrease as necessary. Each
-    node does not necessarily follow the previous one physically
-    in the memory.
-"""
+        scalar = isinstance(other, (int, float))
 
-    def __init__(
-        self,
-        head: typing.Union[Node, NoneType] = None,
-        elements: typing.Union[
-            typing.List[Node],
-            typing.Tuple[Node],
-            typing.Set[Node]
-        ] = []
-    ) -> NoneType:
-        if not isinstance(head, (Node, NoneType)):
-            raise TypeError("'head' must be 'None' or of type 'Node'")
-        
-        if not isinstance(elements, (list, tuple, set)):
-            raise TypeError("'elements' \
-must be a list|tuple|set of 'Node' objects")
+        if not scalar and len(other) != len(self):
+            raise ValueError("operands must have the same length")
 
-        self._head = head
-        self._elements = []
+        size = Array.chunksize
 
-        for i, element in enumerate(elements := list(elements)):
-            if not isinstance(element, Node):
-                raise TypeError(f"'{element}' must be of type 'Node'")
-            
-            if i < len(elements) - 1:
-                element.next_ = elements[i+1]
-            
-            self._elements.append(element)
-        
-        if isinstance(head, Node) and len(self._elements) > 0:
-            self._head.next_ = self._elements[0]
-        
-        return None
-    
-    def __repr__(self) -> str:
-        return f'SinglyLL({self.head}, {self.elements})'
-    
-    def __eq__(self, sllist) -> bool:
-        if isinstance(sllist, SinglyLinkedList):
-            return (
-                self.head == sllist.head and
-                self.elements == sllist.elements
+        for start in range(0, len(self), size):
+            end = min(start + size, len(self))
+
+            yield (
+                start, end, self[start:end],
+                _repeat(other, end - start) if scalar else other[start:end]
             )
-        
-        return False
-    
-    def __bool__(self) -> bool:
-        return bool(self.elements)
-    
-    def __len__(self) -> int:
-        return len(self.elements)
-    
+
+    def _arithmetic(self, operation: str, other, inplace: bool,
+                    typecode: typing.Union[str, NoneType] = None) -> Array:
+        typecode = typecode or self.typecode
+
+        if inplace and typecode != self.typecode:
+            raise TypeError(f"'{operation}' cannot be done in place "
+                            f"on '{self.typecode}' items")
+
+        numpy = self._uses_numpy()
+
+        if numpy:
+            items = _numpy.asarray(memoryview(self))
+            operand = self._operand(other)
+            numpy = _numpy_is_exact(operation, items, operand)
+
+        if numpy:
+            if operation == 'truediv' and not _numpy.all(operand):
+                raise ZeroDivisionError('division by zero')
+
+            # Floats overflow to inf (or become nan) silently, like in
+            # Python; integer results are checked below
+            with _numpy.errstate(over='ignore', invalid='ignore'):
+                result = getattr(_numpy, _NUMPY_UFUNCS[operation])(
+                    items, operand
+                )
+
+            if result.dtype.kind in 'iu':
+                _check_overflow(operation, items, operand, result, typecode)
+
+            if inplace:
+                _numpy.copyto(items, result, casting='same_kind')
+
+                return self
+
+            return _from_numpy(
+                typecode, result.astype(typecode, casting='same_kind')
+            )
+
+        function = getattr(_operator, operation)
+        array = Array(typecode)
+
+        for _, _, items, others in self._chunks(other):
+            array.extend(map(function, items, others))
+
+        if inplace:
+            self[:] = array
+
+            return self
+
+        return array
+
+    def add(self, other, inplace: bool = False) -> Array:
+        """Returns the items plus *other* (a number, or a sequence \
+of the same length), elementwise; in place if *inplace* is True
+"""
+
+        return self._arithmetic('add', other, inplace)
+
+    def subtract(self, other, inplace: bool = False) -> Array:
+        """Returns the items minus *other*, elementwise \
+(see `add`)
+"""
+
+        return self._arithmetic('sub', other, inplace)
+
+    def multiply(self, other, inplace: bool = False) -> Array:
+        """Returns the items times *other*, elementwise \
+(see `add`)
+"""
+
+        return self._arithmetic('mul', other, inplace)
+
+    def divide(self, other, inplace: bool = False) -> Array:
+        """Returns the items divided by *other*, elementwise, \
+as 'd' items (so only 'f' and 'd' Arrays can be divided in place)
+"""
+
+        return self._arithmetic(
+            'truediv', other, inplace,
+            self.typecode if self.typecode in 'fd' else 'd'
+        )
+
+    def compare(self, operator: str, other) -> Array:
+        """Returns a 'B' Array holding 1 where `item <operator> other` \
+is True, else 0
+
+*operator* is one of '<', '<=', '>', '>=', '==' or '!=', and *other*
+a number or a sequence of the same length
+"""
+
+        if operator not in _COMPARISONS:
+            raise ValueError(f"'{operator}' is not a comparison operator")
+
+        if self._uses_numpy():
+            result = getattr(_numpy, _NUMPY_UFUNCS[_COMPARISONS[operator]])(
+                _numpy.asarray(memoryview(self)), self._operand(other)
+            )
+
+            return _from_numpy('B', result.view(_numpy.uint8))
+
+        mask = Array('B')
+
+        function = getattr(_operator, _COMPARISONS[operator])
+
+        for _, _, items, others in self._chunks(other):
+            mask.extend(map(function, items, others))
+
+        return mask
+
+    def select(self, mask) -> Array:
+        """Returns a new Array of the items where *mask* \
+(e.g., from `compare`) is set
+"""
+
+        if len(mask) != len(self):
+            raise ValueError("mask must have the same length")
+
+        if self._uses_numpy():
+            items = _numpy.asarray(memoryview(self))
+
+            return _from_numpy(
+                self.typecode, items[self._operand(mask).astype(bool)]
+            )
+
+        array = Array(self.typecode)
+        array.extend(_compress(self, mask))
+
+        return array
+
+    def sum(self):
+        """Returns the sum of the items, exactly for integers and \
+in double precision for floats
+"""
+
+        if self._uses_numpy():
+            items = _numpy.asarray(memoryview(self))
+
+            if items.dtype.kind == 'f':
+                return float(items.sum(dtype=_numpy.float64))
+
+            if items.itemsize < 8:
+                return int(items.sum(dtype=_numpy.int64))
+
+            # 64 bit sums can wrap around, so the high and the low 32 bits
+            # are summed separately (neither of which can, below 2**31
+            # items) and combined as Python ints
+            return (
+                int((items >> 32).sum(dtype=items.dtype)) << 32
+            ) + int((items & 0xFFFFFFFF).sum(dtype=_numpy.uint64))
+
+        return sum(self, 0.0) if self.typecode in 'fd' else sum(self)
+
+    def _first_nan(self) -> typing.Union[int, NoneType]:
+        """Returns the index of the first NaN item (None if there is \
+none), which is what NumPy's min, max, argmin and argmax return
+"""
+
+        if self.typecode not in 'fd':
+            return None
+
+        return next(_compress(_count(), map(_operator.ne, self, self)), None)
+
+    def min(self):
+        """Returns the smallest item (NaN if there is a NaN item)"""
+
+        if self._uses_numpy():
+            return _numpy.asarray(memoryview(self)).min().item()
+
+        nan = self._first_nan()
+
+        return min(self) if nan is None else self[nan]
+
+    def max(self):
+        """Returns the largest item (NaN if there is a NaN item)"""
+
+        if self._uses_numpy():
+            return _numpy.asarray(memoryview(self)).max().item()
+
+        nan = self._first_nan()
+
+        return max(self) if nan is None else self[nan]
+
+    def argmin(self) -> int:
+        """Returns the index of the (first) smallest item \
+(or of the first NaN item)
+"""
+
+        if self._uses_numpy():
+            return int(_numpy.asarray(memoryview(self)).argmin())
+
+        nan = self._first_nan()
+
+        return self.index(min(self)) if nan is None else nan
+
+    def argmax(self) -> int:
+        """Returns the index of the (first) largest item \
+(or of the first NaN item)
+"""
+
+        if self._uses_numpy():
+            return int(_numpy.asarray(memoryview(self)).argmax())
+
+        nan = self._first_nan()
+
+        return self.index(max(self)) if nan is None else nan
+
+    def searchsorted(self, values, side: str = 'left'):
+        """Returns the index where *values* (a number, or a sequence of \
+numbers, for which an Array of indices is returned) would be inserted
+to keep the (sorted) array sorted
+
+With *side* 'left' the index is before equal items, with 'right'
+after them
+"""
+
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'")
+
+        scalar = isinstance(values, (int, float))
+
+        if self._uses_numpy():
+            indices = _numpy.searchsorted(
+                _numpy.asarray(memoryview(self)),
+                values if scalar else _numpy.asarray(values), side=side
+            )
+
+            if scalar:
+                return int(indices)
+
+            return _from_numpy('q', indices.astype(_numpy.int64))
+
+        function = _bisect_left if side == 'left' else _bisect_right
+
+        if scalar:
+            return function(self, values)
+
+        return Array('q', (function(self, value) for value in values))
+
+    def save(self, path) -> NoneType:
+        """Writes the array to the file at *path*, after a header \
+recording its typecode, length and byte order
+
+The file can be read back with `Array.load`, or mapped into memory
+(without reading it) with `Array.open_mmap`
+"""
+
+        with open(path, 'wb') as file:
+            file.write(_ARRAY_HEADER.pack(
+                _ARRAY_MAGIC, _ARRAY_VERSION, self.typecode.encode(),
+                _BYTEORDERS[_sys.byteorder], len(self)
+            ))
+            self.tofile(file)
+
+        return None
+
+    @classmethod
+    def load(cls, path) -> Array:
+        """Returns a new Array read (copied) from the file at *path*, \
+written by `Array.save`
+"""
+
+        with open(path, 'rb') as file:
+            typecode, byteorder, length = _read_array_header(file)
+            array = cls(typecode)
+            array.fromfile(file, length)
+
+        if byteorder != _sys.byteorder:
+            array.byteswap()
+
+        return array
+
+    @classmethod
+    def open_mmap(cls, path, mode: str = 'r') -> MappedArray:
+        """Returns a MappedArray over the file at *path*, \
+written by `Array.save` (or an ArrayFile)
+
+Nothing is read or copied: the file is mapped into memory, and
+processes mapping the same file share the same pages
+"""
+
+        return MappedArray(path, mode)
+
+
+# Header of SharedArray memory blocks: typecode, padding, length and
+# capacity (both in items)
+_SHARED_HEADER = _Struct('<cxxxxxxxQQ')
+
+
+# Names of the NumPy ufuncs for the `operator` functions used by Array
+_NUMPY_UFUNCS = {
+    'add': 'add', 'sub': 'subtract', 'mul': 'multiply',
+    'truediv': 'true_divide', 'lt': 'less', 'le': 'less_equal',
+    'gt': 'greater', 'ge': 'greater_equal', 'eq': 'equal',
+    'ne': 'not_equal',
+}
+_COMPARISONS = {
+    '<': 'lt', '<=': 'le', '>': 'gt', '>=': 'ge', '==': 'eq', '!=': 'ne',
+}
+
+
+def _numpy_is_exact(operation: str, items, operand) -> bool:
+    """Returns False if NumPy's *operation* on the integer *items* \
+would not compute the exact results (so the Python backend must)
+
+That is when the *operand* is an int outside the range of the items'
+dtype (NumPy refuses to convert it), or integer items that NumPy
+promotes to floats together with the items (64 bit signed with
+unsigned ones), except for division, whose results are floats anyway
+"""
+
+    if items.dtype.kind not in 'iu':
+        return True
+
+    if isinstance(operand, int):
+        limits = _numpy.iinfo(items.dtype)
+
+        return limits.min <= operand <= limits.max
+
+    return (
+        isinstance(operand, float) or operation == 'truediv'
+        or operand.dtype.kind not in 'iu'
+        or _numpy.result_type(items, operand).kind != 'f'
+    )
+
+
+def _check_overflow(operation: str, items, operand, result,
+                    typecode: str) -> NoneType:
+    """Raises OverflowError if the integer *result* of NumPy's \
+*operation* on *items* and *operand* wrapped around, or does not fit
+in *typecode* items
+
+NumPy integer arithmetic wraps silently (`numpy.errstate` only covers
+floating point errors). With a scalar *operand* the result is monotonic
+in the items, so computing it exactly for the smallest and the largest
+item suffices; otherwise the operands are checked against the result,
+elementwise, in its own dtype
+"""
+
+    limits = _numpy.iinfo(typecode)
+
+    if isinstance(operand, int):
+        if not len(items):
+            return None
+
+        function = getattr(_operator, operation)
+        ends = (
+            function(int(items.min()), operand),
+            function(int(items.max()), operand)
+        )
+
+        if min(ends) >= limits.min and max(ends) <= limits.max:
+            return None
+
+    else:
+        dtype = result.dtype
+        a = items.astype(dtype, copy=False)
+        b = _numpy.asarray(operand, dtype=dtype)
+
+        if operation == 'add':
+            wrapped = (
+                ((a ^ result) & (b ^ result)) < 0 if dtype.kind == 'i'
+                else result < a
+            )
+
+        elif operation == 'sub':
+            wrapped = (
+                ((a ^ b) & (a ^ result)) < 0 if dtype.kind == 'i'
+                else a < b
+            )
+
+        else:
+            nonzero = b != 0
+
+            with _numpy.errstate(all='ignore'):
+                wrapped = nonzero & (
+                    result // _numpy.where(nonzero, b, 1) != a
+                )
+
+            if dtype.kind == 'i':
+                wrapped |= (a == _numpy.iinfo(dtype).min) & (b == -1)
+
+        if not _numpy.any(wrapped) and (
+            dtype == _numpy.dtype(typecode) or not len(result)
+            or result.min() >= limits.min and result.max() <= limits.max
+        ):
+            return None
+
+    raise OverflowError(
+        f"the result of '{operation}' does not fit in '{typecode}' items"
+    )
+
+
+def _from_numpy(typecode: str, items) -> Array:
+    """Returns a new Array (of *typecode*) with a copy of the NumPy \
+array *items*
+"""
+
+    array = Array(typecode)
+    array.frombytes(memoryview(_numpy.ascontiguousarray(items)).cast('B'))
+
+    return array
+
+
+# Header of files written by `Array.save`: magic, format version,
+# typecode, byte order ('<' or '>'), padding and length (in items)
+_ARRAY_HEADER = _Struct('<4sBccxQ')
+_ARRAY_MAGIC = b'DSAA'
+_ARRAY_VERSION = 1
+_BYTEORDERS = {'little': b'<', 'big': b'>'}
+
+
+def _read_array_header(file) -> typing.Tuple[str, str, int]:
+    """Reads the header of an Array file, returning its typecode, \
+byte order ('little' or 'big') and length
+"""
+
+    header = file.read(_ARRAY_HEADER.size)
+
+    if len(header) != _ARRAY_HEADER.size:
+        raise ValueError(f"'{file.name}' is not an Array file")
+
+    magic, version, typecode, byteorder, length = _ARRAY_HEADER.unpack(
+        header
+    )
+
+    if magic != _ARRAY_MAGIC or byteorder not in (b'<', b'>'):
+        raise ValueError(f"'{file.name}' is not an Array file")
+
+    if version != _ARRAY_VERSION:
+        raise ValueError(
+            f"'{file.name}' has an unsupported version ({version})"
+        )
+
+    return (
+        typecode.decode(),
+        'little' if byteorder == b'<' else 'big',
+        length
+    )
+
+
+class MappedArray:
+    """Instantiates an Array-like view of a memory-mapped Array file
+
+Parameters
+    path (str|PathLike) - The file, written by `Array.save` or an
+        ArrayFile
+    mode='r' (str) - 'r' to map read-only, 'r+' to write changes
+        through to the file, 'c' to keep changes private (copy on
+        write)
+
+Example
+    with Array.open_mmap('values.bin') as values:
+        total = sum(values)
+
+Explanation
+    The items are not read from the file: the operating system maps
+    the file into memory and loads pages on first access, and
+    processes mapping the same file share those pages. The items are
+    exposed through `view`, a memoryview cast to the Array typecode,
+    so indexing and slicing do not copy either (slices are
+    memoryviews too). Use `to_array` to copy the items into an Array.
+
+    Files must have the byte order of the machine they are mapped on
+    ('u' Arrays cannot be mapped either); `Array.load` handles both.
+"""
+
+    _ACCESS = {
+        'r': _mmap.ACCESS_READ,
+        'r+': _mmap.ACCESS_WRITE,
+        'c': _mmap.ACCESS_COPY,
+    }
+
+    def __init__(self, path, mode: str = 'r') -> NoneType:
+        if mode not in self._ACCESS:
+            raise ValueError(f"mode must be one of {tuple(self._ACCESS)}")
+
+        with open(path, 'r+b' if mode == 'r+' else 'rb') as file:
+            typecode, byteorder, length = _read_array_header(file)
+
+            if typecode == 'u' or byteorder != _sys.byteorder:
+                raise ValueError(
+                    f"'{path}' cannot be mapped, use 'Array.load' instead"
+                )
+
+            end = _ARRAY_HEADER.size + length * _Array(typecode).itemsize
+
+            if _os.fstat(file.fileno()).st_size < end:
+                raise ValueError(f"'{path}' is truncated")
+
+            self._mmap = _mmap.mmap(
+                file.fileno(), 0, access=self._ACCESS[mode]
+            )
+
+        self.path = path
+        self.mode = mode
+        self.view = memoryview(self._mmap)[_ARRAY_HEADER.size:end].cast(
+            typecode
+        )
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'MappedArray({self.path!r}, {self.mode!r})'
+
+    def __len__(self) -> int:
+        return len(self.view)
+
     def __iter__(self):
-        return iter(self.elements)
-    
-    def __hash__(self) -> int:
-        return hash((self.head, *self.elements))
-    
-    def __contains__(self, element) -> bool:
-        return element in self.elements
-    
-    def __getitem__(self, index) -> Node:
-        return self.elements[index]
-    
-    def __setitem__(self, index, element) -> NoneType:
-        self.elements[index] = element
-        
-        if isinstance(index, int):
-            if index > 0:
-                self.elements[index-1].next_ = self.elements[index]
-        
+        return iter(self.view)
+
+    def __getitem__(self, index):
+        return self.view[index]
+
+    def __setitem__(self, index, value) -> NoneType:
+        self.view[index] = value
+
         return None
-    
-    def __add__(self, sllist) -> SinglyLinkedList:
-        if not isinstance(sllist, SinglyLinkedList):
-            raise TypeError(f"'{sllist}' must be of type 'SinglyLinkedList'")
-        
-        return SinglyLinkedList(self.head, self.elements+sllist.elements)
-    
-    def __iadd__(self, sllist) -> NoneType:
-        if not isinstance(sllist, SinglyLinkedList):
-            raise TypeError(f"'{sllist}' must be of type 'SinglyLinkedList'")
-        
-        self.elements.extend(sllist.elements)
-        
+
+    def __enter__(self) -> MappedArray:
+        return self
+
+    def __exit__(self, *exc_info) -> NoneType:
+        self.close()
+
         return None
-    
+
     @property
-    def head(self) -> Node:
-        return self._head
-    
-    @head.setter
-    def head(self, head) -> NoneType:
-        self._head = head
-        
-        if isinstance(head, Node):
-            self._head.next_ = self.elements[0]
-        
-        return None
-    
+    def typecode(self) -> str:
+        return self.view.format
+
     @property
-    def elements(self) -> typing.Union[
-        typing.List[Node], typing.Tuple[Node], typing.Set[Node]
-    ]:
-        return self._elements
-    
-    @elements.setter
-    def elements(self, elements) -> NoneType:
-        for element in self:
-            element.next_ = None
-        
-        self._elements = []
-        
-        for i, element in enumerate(elements := list(elements)):
-            if not isinstance(element, Node):
-                raise TypeError(f"'{element}' must be of type 'Node'")
-            
-            if i < len(elements) - 1:
-                element.next_ = elements[i+1]
-            
-            self._elements.append(element)
-        
+    def itemsize(self) -> int:
+        return self.view.itemsize
+
+    def tolist(self) -> list:
+        return self.view.tolist()
+
+    def to_array(self) -> Array:
+        """Returns a new Array with a copy of the items"""
+
+        array = Array(self.typecode)
+        array.frombytes(self.view.cast('B'))
+
+        return array
+
+    def flush(self) -> NoneType:
+        """Writes changes (in 'r+' mode) back to the file"""
+
+        self._mmap.flush()
+
+        return None
+
+    def close(self) -> NoneType:
+        """Releases the view and unmaps the file
+
+Slices taken from the MappedArray must be released first
+"""
+
+        self.view.release()
+        self._mmap.close()
+
+        return None
+
+
+class ArrayFile:
+    """Instantiates a growable, append-only Array file
+
+Parameters
+    path (str|PathLike) - The file to append to (created if missing)
+    typecode=None (str) - The typecode of the items (required when
+        creating the file, checked against the file otherwise)
+    buffersize=65536 (int) - The no. of items kept in memory before
+        they are written to the file
+
+Example
+    with ArrayFile('events.bin', 'q') as events:
+        events.extend(range(10))
+
+    with Array.open_mmap('events.bin') as values:
+        ...
+
+Explanation
+    Items are appended to an in-memory Array and written to the end of
+    the file (with the length in the header updated) whenever
+    *buffersize* items are waiting, on `flush` and on `close`. The
+    file uses the format of `Array.save`, so it can be read with
+    `Array.load` or mapped with `Array.open_mmap`; readers see the
+    items flushed before they opened the file.
+"""
+
+    def __init__(
+        self, path, typecode: typing.Union[str, NoneType] = None,
+        buffersize: int = 65536
+    ) -> NoneType:
+        self.path = path
+        self.buffersize = buffersize
+
+        if _os.path.exists(path):
+            self._file = open(path, 'r+b')
+
+            try:
+                filetypecode, byteorder, self._length = _read_array_header(
+                    self._file
+                )
+
+                if typecode not in (None, filetypecode):
+                    raise ValueError(
+                        f"'{path}' holds '{filetypecode}' items, "
+                        f"not '{typecode}'"
+                    )
+
+                if byteorder != _sys.byteorder:
+                    raise ValueError(
+                        f"'{path}' has a foreign byte order"
+                    )
+
+            except ValueError:
+                self._file.close()
+
+                raise
+
+            typecode = filetypecode
+
+        elif typecode is None:
+            raise TypeError("'typecode' is required to create an ArrayFile")
+
+        else:
+            self._file = open(path, 'w+b')
+            self._length = 0
+
+        self._pending = Array(typecode)
+        self._file.truncate(
+            _ARRAY_HEADER.size + self._length * self._pending.itemsize
+        )
+        self._write_header()
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'ArrayFile({self.path!r}, {self.typecode!r})'
+
+    def __len__(self) -> int:
+        return self._length + len(self._pending)
+
+    def __enter__(self) -> ArrayFile:
+        return self
+
+    def __exit__(self, *exc_info) -> NoneType:
+        self.close()
+
+        return None
+
+    def _write_header(self) -> NoneType:
+        self._file.seek(0)
+        self._file.write(_ARRAY_HEADER.pack(
+            _ARRAY_MAGIC, _ARRAY_VERSION, self.typecode.encode(),
+            _BYTEORDERS[_sys.byteorder], self._length
+        ))
+
+        return None
+
+    @property
+    def typecode(self) -> str:
+        return self._pending.typecode
+
+    def append(self, value) -> NoneType:
+        self._pending.append(value)
+
+        if len(self._pending) >= self.buffersize:
+            self.flush()
+
+        return None
+
+    def extend(self, iterable: typing.Iterable) -> NoneType:
+        self._pending.extend(iterable)
+
+        if len(self._pending) >= self.buffersize:
+            self.flush()
+
+        return None
+
+    def flush(self) -> NoneType:
+        """Writes the waiting items to the end of the file \
+and updates its header
+"""
+
+        if self._pending:
+            self._file.seek(0, _os.SEEK_END)
+            self._pending.tofile(self._file)
+            self._length += len(self._pending)
+            del self._pending[:]
+
+        self._write_header()
+        self._file.flush()
+
+        return None
+
+    def close(self) -> NoneType:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+        return None
+
+    def open_mmap(self, mode: str = 'r') -> MappedArray:
+        """Flushes the file and returns a MappedArray over it"""
+
+        self.flush()
+
+        return MappedArray(self.path, mode)
+
+
+class SharedArray:
+    """Instantiates an Array-like object in shared memory
+
+Parameters
+    typecode (str) - The typecode of the items (see Array)
+    initializer=() (iterable) - The initial items
+    capacity=None (int) - The maximum no. of items (defaults to the
+        no. of initial items); shared memory cannot grow
+    name=None (str) - The name of the shared memory block (a random
+        one is picked by default)
+    lock=None (Lock) - An optional (multiprocessing) lock held while
+        appending, so several processes can append safely
+
+Example
+    shared = SharedArray('q', range(10**6))
+    with multiprocessing.Pool() as pool:
+        pool.starmap(work, [(shared, 0, 500_000), (shared, 500_000, 10**6)])
+    shared.unlink()
+
+Explanation
+    The items live in a `multiprocessing.shared_memory` block, after a
+    small header holding the typecode, length and capacity, so every
+    process that attaches to the block (by name, with
+    `SharedArray.attach`) sees the same items and appends without
+    copying anything. Pickling a SharedArray (e.g., to send it to a
+    Pool worker) only pickles its name (and lock), and unpickling
+    attaches to the block. Locks can only be passed to processes when
+    they are started (as Process arguments or a Pool initializer).
+
+    Every process calls `close` when it is done with the block, and
+    the creating process (the 'owner') calls `unlink` to free it;
+    using a SharedArray as a context manager does both.
+"""
+
+    def __init__(
+        self, typecode: str, initializer: typing.Iterable = (),
+        capacity: typing.Union[int, NoneType] = None,
+        name: typing.Union[str, NoneType] = None, lock = None
+    ) -> NoneType:
+        from multiprocessing import shared_memory
+
+        items = Array(typecode, initializer)
+        capacity = len(items) if capacity is None else capacity
+
+        if capacity < len(items):
+            raise ValueError("'capacity' is smaller than the initializer")
+
+        self._memory = shared_memory.SharedMemory(
+            name, create=True,
+            size=max(_SHARED_HEADER.size + capacity * items.itemsize, 1)
+        )
+        _SHARED_HEADER.pack_into(
+            self._memory.buf, 0, typecode.encode(), len(items), capacity
+        )
+        self._setup(lock, owner=True)
+        self._items[:len(items)] = items
+
+        return None
+
+    @classmethod
+    def attach(cls, name: str, lock = None) -> SharedArray:
+        """Returns a SharedArray over the existing shared memory block \
+*name*, without copying it
+"""
+
+        from multiprocessing import shared_memory
+
+        shared = cls.__new__(cls)
+
+        if _sys.version_info >= (3, 13):
+            shared._memory = shared_memory.SharedMemory(name, track=False)
+
+        else:
+            shared._memory = shared_memory.SharedMemory(name)
+
+            # Only the owner may unlink the block, but before Python 3.13
+            # every attaching process registers it with the resource
+            # tracker, which unlinks it when that process exits
+            shared._track(False)
+
+        shared._setup(lock, owner=False)
+
+        return shared
+
+    def _setup(self, lock, owner: bool) -> NoneType:
+        typecode, _, capacity = _SHARED_HEADER.unpack_from(
+            self._memory.buf
+        )
+        end = _SHARED_HEADER.size + capacity * _Array(
+            typecode.decode()
+        ).itemsize
+
+        self.lock = lock
+        self.owner = owner
+        self._items = self._memory.buf[_SHARED_HEADER.size:end].cast(
+            typecode.decode()
+        )
+
+        return None
+
+    def __reduce__(self):
+        return (type(self).attach, (self.name, self.lock))
+
+    def __repr__(self) -> str:
+        return f'SharedArray({self.name!r}, {self.typecode!r}, {len(self)})'
+
+    def __len__(self) -> int:
+        return _SHARED_HEADER.unpack_from(self._memory.buf)[1]
+
+    def __iter__(self):
+        return iter(self.view)
+
+    def __getitem__(self, index):
+        return self.view[index]
+
+    def __setitem__(self, index, value) -> NoneType:
+        self.view[index] = value
+
+        return None
+
+    def __enter__(self) -> SharedArray:
+        return self
+
+    def __exit__(self, *exc_info) -> NoneType:
+        self.close()
+
+        if self.owner:
+            self.unlink()
+
+        return None
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def typecode(self) -> str:
+        return self._items.format
+
+    @property
+    def itemsize(self) -> int:
+        return self._items.itemsize
+
+    @property
+    def capacity(self) -> int:
+        return len(self._items)
+
+    @property
+    def view(self) -> memoryview:
+        """Returns a memoryview of the (current) items, \
+without copying them
+"""
+
+        return self._items[:len(self)]
+
+    def _set_length(self, length: int) -> NoneType:
+        _SHARED_HEADER.pack_into(
+            self._memory.buf, 0, self.typecode.encode(), length,
+            self.capacity
+        )
+
+        return None
+
+    def append(self, value) -> NoneType:
+        self.extend((value,))
+
+        return None
+
+    def extend(self, iterable: typing.Iterable) -> NoneType:
+        """Appends the items of *iterable* (under the lock, if any)
+
+Raises OverflowError, appending nothing, if they do not fit
+"""
+
+        items = Array(self.typecode, iterable)
+
+        if self.lock is not None:
+            with self.lock:
+                self._extend(items)
+
+        else:
+            self._extend(items)
+
+        return None
+
+    def _extend(self, items: Array) -> NoneType:
+        length = len(self)
+
+        if length + len(items) > self.capacity:
+            raise OverflowError("the SharedArray is full")
+
+        self._items[length:length + len(items)] = items
+        self._set_length(length + len(items))
+
+        return None
+
+    def tolist(self) -> list:
+        return self.view.tolist()
+
+    def to_array(self) -> Array:
+        """Returns a new Array with a copy of the items"""
+
+        array = Array(self.typecode)
+        array.frombytes(self.view.cast('B'))
+
+        return array
+
+    def close(self) -> NoneType:
+        """Detaches the current process from the shared memory block
+
+Views and slices taken from the SharedArray must be released first
+"""
+
+        self._items.release()
+        self._memory.close()
+
+        return None
+
+    def unlink(self) -> NoneType:
+        """Frees the shared memory block (once every process \
+has closed it); only the owner should call this
+"""
+
+        # An attached process may have unregistered the block from a
+        # resource tracker it shares with the owner (see `attach`)
+        self._track(True)
+        self._memory.unlink()
+
+        return None
+
+    def _track(self, track: bool) -> NoneType:
+        if _sys.version_info < (3, 13) and _os.name == 'posix':
+            from multiprocessing import resource_tracker
+
+            (resource_tracker.register if track
+             else resource_tracker.unregister)(
+                self._memory._name, 'shared_memory'
+            )
+
+        return None
+
+
+class SinglyLinkedList:
+    """Instantiates a Singly Linked List object
+
+Parameters
+    head=None (Node) - A head node object (at index = 0)
+    elements=[] (list|tuple|set) - A default list of node objects
+    indexed=False (bool) - Keeps a hash index of the node objects
+
+Example
+    sllist = SinglyLinkedList()
+    lru = SinglyLinkedList(indexed=True)
+
+Explanation
+    A linked list is a linear collection of data elements, whose
+    order is not given by their physical placement in memory,
+    instead, each element points to the next. It is a data
+    structure consisting of a collection of nodes which together
+    represent a sequence. In its most basic form, each node contains:
+    data, and a reference (in other words, a link) to the next node
+    in the sequence. This structure allows for efficient insertion or
+    removal of elements from any position in the sequence during
+    iteration. More complex variants add additional links, allowing
+    more efficient insertion or removal of nodes at arbitrary
+    positions. A drawback of linked lists is that access time is
+    linear (and difficult to pipeline). Faster access, such as random
+    access, is not feasible. Arrays have better cache locality
+    compared to linked lists.
+
+    Linked lists are among the simplest and most common data structures
+    They can be used to implement several other common abstract data
+    types, including lists, stacks, queues, associative arrays, and
+    S-expressions, though it is not uncommon to implement those data
+    structures directly without using a linked list as the basis.
+
+    The principal benefit of a linked list over a conventional array
+    is that the list elements can be easily inserted or removed
+    without reallocation or reorganization of the entire structure
+    because the data items need not be stored contiguously in memory
+    or on disk, while restructuring an array at run-time is a much
+    more expensive operation. Linked lists allow insertion and
+    removal of nodes at any point in the list, and allow doing so
+    with a constant number of operations by keeping the link previous
+    to the link being added or removed in memory during list traversal.
+
+    On the other hand, since simple linked lists by themselves do not
+    allow random access to the data or any form of efficient indexing,
+    many basic operations—such as obtaining the last node of the list,
+    finding a node that contains a given datum, or locating the place
+    where a new node should be inserted—may require iterating through
+    most or all of the list elements. The advantages and disadvantages
+    of using linked lists are given below. Linked list are dynamic, so
+    the length of list can increase or decrease as necessary. Each
+    node does not necessarily follow the previous one physically
+    in the memory.
+
+    An indexed list also keeps a dict of its node objects by id, and
+    one by data, so `in`, `index`, `remove` and `move_to_front` find a
+    node object in O(1) instead of comparing it with every element.
+    Its order is kept by the links (from `_first` to `_last`) alone,
+    so removing or moving a node object takes O(1) too, and the list
+    of elements (and of their positions) is only rebuilt, in O(n),
+    when it is next read. A node object can be in an indexed list
+    only once, and its data must not change while it is in it. Node
+    objects with unhashable data (e.g., a list) are only indexed by
+    id, so finding them by value compares the value with every such
+    node object.
+"""
+
+    def __init__(
+        self,
+        head: typing.Union[Node, NoneType] = None,
+        elements: typing.Union[
+            typing.List[Node],
+            typing.Tuple[Node],
+            typing.Set[Node]
+        ] = [],
+        indexed: bool = False
+    ) -> NoneType:
+        if not isinstance(head, (Node, NoneType)):
+            raise TypeError("'head' must be 'None' or of type 'Node'")
+        
+        if not isinstance(elements, (list, tuple, set)):
+            raise TypeError("'elements' \
+must be a list|tuple|set of 'Node' objects")
+
+        self._head = head
+        self._elements = []
+        self._index = {} if indexed else None
+        self._reset()
+
+        self.extend(elements)
+        
+        return None
+    
+    def __repr__(self) -> str:
+        return f'SinglyLL({self.head}, {self.elements})'
+    
+    def __eq__(self, sllist) -> bool:
+        if isinstance(sllist, SinglyLinkedList):
+            return (
+                self.head == sllist.head and
+                self.elements == sllist.elements
+            )
+        
+        return False
+    
+    def __bool__(self) -> bool:
+        return bool(len(self))
+    
+    def __len__(self) -> int:
+        if self._index is not None:
+            return self._length
+
+        return len(self._elements)
+    
+    def __iter__(self):
+        return iter(self.elements)
+    
+    def __hash__(self) -> int:
+        return hash((self.head, *self.elements))
+    
+    def __contains__(self, element) -> bool:
+        return self._find(element) is not None
+    
+    def __getitem__(self, index) -> Node:
+        return self.elements[index]
+    
+    def __setitem__(self, index, element) -> NoneType:
+        if not isinstance(index, int):
+            elements = list(self.elements)
+            elements[index] = element
+            self.elements = elements
+
+            return None
+
+        if not isinstance(element, Node):
+            raise TypeError(f"'{element}' must be of type 'Node'")
+
+        old = self.elements[index]
+
+        if old is element:
+            return None
+
+        if self._index is not None:
+            self._add_to_index((element,))
+            self._remove_from_index(old)
+
+            if old is self._first:
+                self._first = element
+
+            if old is self._last:
+                self._last = element
+
+            if self._positions is not None:
+                self._positions[id(element)] = self._positions.pop(id(old))
+
+        previous, next_ = old._previous, old._next
+        old._previous = old._next = None
+        element._previous, element._next = previous, next_
+
+        if previous is not None:
+            previous._next = element
+
+        if next_ is not None:
+            next_._previous = element
+
+        self._elements[index] = element
+        
+        return None
+    
+    def __add__(self, sllist) -> SinglyLinkedList:
+        if not isinstance(sllist, SinglyLinkedList):
+            raise TypeError(f"'{sllist}' must be of type 'SinglyLinkedList'")
+        
+        return SinglyLinkedList(self.head, self.elements+sllist.elements,
+                                self.indexed)
+    
+    def __iadd__(self, sllist) -> SinglyLinkedList:
+        if not isinstance(sllist, SinglyLinkedList):
+            raise TypeError(f"'{sllist}' must be of type 'SinglyLinkedList'")
+        
+        self.extend(sllist.elements)
+        
+        return self
+    
+    @property
+    def head(self) -> Node:
+        return self._head
+    
+    @head.setter
+    def head(self, head) -> NoneType:
+        self._head = head
+        
+        if isinstance(head, Node):
+            self._head.next_ = self.elements[0]
+        
+        return None
+    
+    @property
+    def elements(self) -> typing.Union[
+        typing.List[Node], typing.Tuple[Node], typing.Set[Node]
+    ]:
+        if self._elements is None:
+            self._elements = []
+            node = self._first
+
+            while node is not None:
+                self._elements.append(node)
+                node = node._next
+
+        return self._elements
+    
+    @elements.setter
+    def elements(self, elements) -> NoneType:
+        for element in self:
+            element._previous = element._next = None
+        
+        self._elements = []
+        self._reset()
+        
+        self.extend(elements)
+        
+        return None
+
+    @property
+    def first(self) -> typing.Union[Node, NoneType]:
+        """The first node object (None if the list is empty), in O(1)"""
+
+        if self._index is not None:
+            return self._first
+
+        return self._elements[0] if self._elements else None
+
+    @property
+    def last(self) -> typing.Union[Node, NoneType]:
+        """The last node object (None if the list is empty), in O(1)"""
+
+        if self._index is not None:
+            return self._last
+
+        return self._elements[-1] if self._elements else None
+
+    @property
+    def indexed(self) -> bool:
+        """True if the list keeps a hash index of its node objects"""
+
+        return self._index is not None
+
+    def _reset(self) -> NoneType:
+        """Empties the hash index (of an indexed list)"""
+
+        if self._index is not None:
+            self._index.clear()
+
+        self._nodes = {}
+        self._unhashable = {}
+        self._positions = None
+        self._first = self._last = None
+        self._length = 0
+
+        return None
+
+    def _relinked(self) -> NoneType:
+        """Updates the hash index after `_elements` was reordered"""
+
+        if self._index is not None:
+            self._positions = None
+            self._first = self._elements[0] if self._elements else None
+            self._last = self._elements[-1] if self._elements else None
+
+        return None
+
+    def _add_to_index(self, elements: typing.List[Node]) -> NoneType:
+        if len(elements) > 1 and (
+            len({id(element) for element in elements}) != len(elements)
+        ):
+            raise ValueError("'elements' must be distinct node objects")
+
+        for element in elements:
+            if id(element) in self._nodes:
+                raise ValueError(f"'{element}' is already in the list")
+
+        for element in elements:
+            self._nodes[id(element)] = element
+
+            try:
+                nodes = self._index.setdefault(element.data, {})
+
+            except TypeError:
+                self._unhashable[id(element)] = element
+
+            else:
+                nodes[id(element)] = element
+
+        return None
+
+    def _remove_from_index(self, element: Node) -> NoneType:
+        del self._nodes[id(element)]
+
+        if self._unhashable.pop(id(element), None) is not None:
+            return None
+
+        nodes = self._index[element.data]
+        del nodes[id(element)]
+
+        if not nodes:
+            del self._index[element.data]
+
+        return None
+
+    def _find(self, element) -> typing.Union[Node, NoneType]:
+        """Returns the node object *element*, if it is in the list, \
+else the first one equal to it, or None
+
+A value that is not a Node matches the node objects whose data equals
+it (or a Data object holding it). In an indexed list, this takes O(1)
+and the "first" node object is the one added first.
+"""
+
+        if isinstance(element, Node):
+            if self._index is not None and id(element) in self._nodes:
+                return element
+
+            data = element.data
+
+        else:
+            data = element if isinstance(element, Data) else Data(element)
+
+        if self._index is None:
+            for node in self._elements:
+                if node is element or (
+                    node == element if isinstance(element, Node)
+                    else node.data == data
+                ):
+                    return node
+
+            return None
+
+        try:
+            nodes = self._index.get(data, {})
+
+        except TypeError:
+            nodes = {
+                key: node for key, node in self._unhashable.items()
+                if node.data == data
+            }
+
+        for node in nodes.values():
+            if not isinstance(element, Node) or node == element:
+                return node
+
+        return None
+
+    def _unlink(self, node: Node) -> NoneType:
+        """Takes the node object *node* (in the list) out of the list, \
+without removing it from the hash index
+"""
+
+        previous, next_ = node._previous, node._next
+        node._previous = node._next = None
+
+        if previous is not None:
+            previous._next = next_
+
+        if next_ is not None:
+            next_._previous = previous
+
+        if self._index is None:
+            elements = self._elements
+
+            # The ends (`pop` and `popleft`) are checked before scanning
+            if elements[-1] is node:
+                elements.pop()
+
+            elif elements[0] is node:
+                del elements[0]
+
+            else:
+                for position, element in enumerate(elements):
+                    if element is node:
+                        del elements[position]
+
+                        break
+
+            return None
+
+        if node is self._last:
+            self._last = None if node is self._first else previous
+
+        if node is self._first:
+            self._first = next_
+
+        self._length -= 1
+
+        if (
+            self._elements is not None and self._elements
+            and self._elements[-1] is node
+        ):
+            self._elements.pop()
+
+        else:
+            self._elements = self._positions = None
+
+        return None
+
+    def _remove(self, node: Node) -> NoneType:
+        self._unlink(node)
+
+        if self._index is not None:
+            self._remove_from_index(node)
+
+        return None
+
+    def _link_first(self, node: Node) -> NoneType:
+        """Links the (unlinked) node object *node* in as the first one"""
+
+        first = self.first
+
+        if isinstance(self._head, Node):
+            _link(self._head, node)
+
+        else:
+            node._previous = None
+
+        if first is not None:
+            _link(node, first)
+
+        else:
+            node._next = None
+
+        if self._index is None:
+            self._elements.insert(0, node)
+
+            return None
+
+        self._first = node
+
+        if self._last is None:
+            self._last = node
+
+        self._length += 1
+        self._elements = self._positions = None
+
+        return None
+
+    def extend(self, elements: typing.Iterable[Node]) -> NoneType:
+        """Appends all node objects of *elements*, in O(len(elements))
+
+The nodes are linked to each other (and the current last node, or
+the head) directly, without going through the validating `next_`,
+`previous` and `parent` setters of Node
+"""
+
+        elements = list(elements)
+
+        for element in elements:
+            if not isinstance(element, Node):
+                raise TypeError(f"'{element}' must be of type 'Node'")
+
+        if not elements:
+            return None
+
+        if self._index is not None:
+            self._add_to_index(elements)
+            last = self._last
+
+        else:
+            last = self._elements[-1] if self._elements else None
+
+        if last is not None:
+            _link(last, elements[0])
+
+        elif isinstance(self._head, Node):
+            _link(self._head, elements[0])
+
+        else:
+            elements[0]._previous = None
+
+        for previous, next_ in zip(elements, elements[1:]):
+            _link(previous, next_)
+
+        elements[-1]._next = None
+
+        if self._index is not None:
+            if self._first is None:
+                self._first = elements[0]
+
+            self._last = elements[-1]
+
+            if self._positions is not None:
+                self._positions.update(
+                    (id(element), self._length + position)
+                    for position, element in enumerate(elements)
+                )
+
+            self._length += len(elements)
+
+            if self._elements is None:
+                return None
+
+        self._elements.extend(elements)
+
+        return None
+
+    def append(self, element: Node) -> NoneType:
+        """Appends the node object *element*"""
+
+        self.extend((element,))
+
+        return None
+
+    def appendleft(self, element: Node) -> NoneType:
+        """Inserts the node object *element* before the first one"""
+
+        if not isinstance(element, Node):
+            raise TypeError(f"'{element}' must be of type 'Node'")
+
+        if self._index is not None:
+            self._add_to_index((element,))
+
+        self._link_first(element)
+
+        return None
+
+    def pop(self) -> Node:
+        """Removes and returns the last node object, in O(1)"""
+
+        if not self:
+            raise IndexError('pop from empty SinglyLinkedList')
+
+        node = self.last
+        self._remove(node)
+
+        return node
+
+    def popleft(self) -> Node:
+        """Removes and returns the first node object
+
+Takes O(1) in an indexed list, O(n) otherwise (the list of elements is
+shifted, without comparing them)
+"""
+
+        if not self:
+            raise IndexError('pop from empty SinglyLinkedList')
+
+        node = self.first
+        self._remove(node)
+
+        return node
+
+    def index(self, element) -> int:
+        """Returns the index of *element* (see `remove`)
+
+In an indexed list this takes O(1), unless the list was reordered
+(other than at its end) since the last call, which rebuilds the
+positions in O(n) once
+"""
+
+        node = self._find(element)
+
+        if node is None:
+            raise ValueError(f"'{element}' is not in the list")
+
+        if self._index is None:
+            for position, other in enumerate(self._elements):
+                if other is node:
+                    return position
+
+        if self._positions is None:
+            self._positions = {
+                id(element): position
+                for position, element in enumerate(self.elements)
+            }
+
+        return self._positions[id(node)]
+
+    def remove(self, element) -> NoneType:
+        """Removes *element* (the node object itself, if it is in the \
+list, else the first node object equal to it, or holding it as data)
+
+Takes O(1) in an indexed list, O(n) otherwise
+"""
+
+        node = self._find(element)
+
+        if node is None:
+            raise ValueError(f"'{element}' is not in the list")
+
+        self._remove(node)
+
+        return None
+
+    def move_to_front(self, element) -> NoneType:
+        """Moves *element* (see `remove`) before the first node object
+
+Takes O(1) in an indexed list, which makes it an LRU ordering: move
+an entry to the front when it is used, and `pop` the least recently
+used one from the end
+"""
+
+        node = self._find(element)
+
+        if node is None:
+            raise ValueError(f"'{element}' is not in the list")
+
+        if node is not self.first:
+            self._unlink(node)
+            self._link_first(node)
+
+        return None
+
+    @classmethod
+    def from_iterable(
+        cls, iterable: typing.Iterable,
+        head: typing.Union[Node, NoneType] = None, indexed: bool = False
+    ) -> SinglyLinkedList:
+        """Returns a new SinglyLinkedList of the values in *iterable*, \
+in O(n)
+
+Node objects are linked as they are, any other value is wrapped in a
+new Node object first (in a Data object, unless it already is one)
+"""
+
+        sllist = cls(head, indexed=indexed)
+        sllist.extend(map(_as_node, iterable))
+
+        return sllist
+
+
+# Header of streams written by `dump`: magic, format version, kind (b'T'
+# for a tree, b'L' for a SinglyLinkedList), byte order ('<' or '>') and
+# whether the list was indexed
+_STREAM_HEADER = _Struct('<4sBcc?xx')
+_STREAM_MAGIC = b'DSAS'
+_STREAM_VERSION = 1
+
+# Header of every chunk of a stream: typecode of the structure codes,
+# encoding of the payloads (b'q' or b'd' for an Array of single int or
+# float args, b'p' for a pickled table), padding, no. of node objects
+# and the sizes (in bytes) of the structure, payload and action parts.
+# A chunk of 0 node objects ends the stream
+_CHUNK_HEADER = _Struct('<ccxxxxxxQQQQ')
+
+# Typecodes for structure codes (no. of children), smallest first
+_COUNT_TYPECODES = (('B', 0xFF), ('H', 0xFFFF), ('I', 0xFFFFFFFF),
+                    ('Q', 0xFFFFFFFFFFFFFFFF))
+
+
+def _encode_payloads(datas: list) -> typing.Tuple[bytes, bytes]:
+    """Returns the encoding and the bytes of the payload table \
+of *datas*
+
+When every item is a Data object holding a single int (that fits in
+64 bits) or a single float, the table is an Array of those numbers;
+else it is a pickled list of rows: (args, kwargs) for a Data object,
+None for the empty default one and (object,) for anything else
+"""
+
+    values = []
+
+    for data in datas:
+        if type(data) is not Data or data._kwargs or len(data._args) != 1:
+            break
+
+        values.append(data._args[0])
+
+    else:
+        kinds = set(map(type, values))
+
+        if kinds == {float}:
+            return b'd', Array('d', values).tobytes()
+
+        if kinds == {int}:
+            try:
+                return b'q', Array('q', values).tobytes()
+
+            except OverflowError:
+                pass
+
+    import pickle
+
+    rows = [
+        (data._args, data._kwargs) if type(data) is Data
+        else None if data is _EMPTY_DATA else (data,)
+        for data in datas
+    ]
+
+    return b'p', pickle.dumps(rows, pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_payloads(encoding: bytes, payload: bytes,
+                     byteorder: str) -> typing.Iterator:
+    """Returns an iterator of the Data objects (or other objects) \
+encoded by `_encode_payloads`, building them as they are read
+"""
+
+    if encoding in (b'q', b'd'):
+        values = Array(encoding.decode())
+        values.frombytes(payload)
+
+        if byteorder != _sys.byteorder:
+            values.byteswap()
+
+        return map(Data, values)
+
+    import pickle
+
+    return (
+        _EMPTY_DATA if row is None
+        else Data(*row[0], **row[1]) if len(row) == 2 else row[0]
+        for row in pickle.loads(payload)
+    )
+
+
+def _write_chunk(file, counts: typing.Union[Array, NoneType], datas: list,
+                 actions: list) -> NoneType:
+    """Writes a chunk of node objects: their structure codes \
+(*counts*, None for a list), payload table and actions
+"""
+
+    if counts is None:
+        typecode, structure = b'B', b''
+
+    else:
+        highest = max(counts)
+        typecode = next(
+            code for code, limit in _COUNT_TYPECODES if highest <= limit
+        )
+        structure = Array(typecode, counts).tobytes()
+        typecode = typecode.encode()
+
+    encoding, payload = _encode_payloads(datas)
+
+    if any(action is not None for action in actions):
+        import pickle
+
+        actions = pickle.dumps(actions, pickle.HIGHEST_PROTOCOL)
+
+    else:
+        actions = b''
+
+    file.write(_CHUNK_HEADER.pack(
+        typecode, encoding, len(datas), len(structure), len(payload),
+        len(actions)
+    ))
+    file.write(structure)
+    file.write(payload)
+    file.write(actions)
+
+    return None
+
+
+def _read_exactly(file, size: int) -> bytes:
+    """Reads *size* bytes from *file*, raising ValueError if it ends \
+before
+"""
+
+    chunk = file.read(size)
+
+    if len(chunk) != size:
+        raise ValueError('the dsalgos stream ends unexpectedly')
+
+    return chunk
+
+
+@_contextmanager
+def _gc_paused():
+    """Disables the garbage collector (if enabled) until the end \
+of the with block
+
+Building or encoding many objects at once otherwise makes it scan all
+the (tracked) objects built so far again and again
+"""
+
+    enabled = _gc.isenabled()
+    _gc.disable()
+
+    try:
+        yield None
+
+    finally:
+        if enabled:
+            _gc.enable()
+
+
+def _open_stream(file, mode: str):
+    """Returns a context manager giving a binary file object: *file* \
+itself if it is one, else the file at path *file* opened in *mode*
+"""
+
+    if hasattr(file, 'read' if mode == 'rb' else 'write'):
+        return _nullcontext(file)
+
+    return open(file, mode)
+
+
+def dump(structure: typing.Union[Node, SinglyLinkedList], file,
+         chunk_size: int = 16384) -> NoneType:
+    """Writes the tree of *structure* (a root Node object) or its node \
+objects (a SinglyLinkedList) to *file* (a path or a binary file object)
+
+The stream can be read back with `load`, or node object by node object
+with `iter_load` (see `iter_load` for the format). The garbage
+collector is paused while writing. Of a SinglyLinkedList, only the
+node objects and the indexed flag are written, not its `head`.
+"""
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("'chunk_size' must be a positive integer")
+
+    if isinstance(structure, Node):
+        kind, indexed = b'T', False
+        stack = [structure]
+
+    elif isinstance(structure, SinglyLinkedList):
+        kind, indexed = b'L', structure.indexed
+        stack = None
+
+    else:
+        raise TypeError(
+            f"'{structure}' must be of type 'Node' or 'SinglyLinkedList'"
+        )
+
+    with _gc_paused(), _open_stream(file, 'wb') as file:
+        file.write(_STREAM_HEADER.pack(
+            _STREAM_MAGIC, _STREAM_VERSION, kind,
+            _BYTEORDERS[_sys.byteorder], indexed
+        ))
+
+        if stack is None:
+            elements = structure.elements
+
+            for start in range(0, len(elements), chunk_size):
+                nodes = elements[start:start + chunk_size]
+                _write_chunk(
+                    file, None, [node.data for node in nodes],
+                    [node.action for node in nodes]
+                )
+
+        while stack:
+            counts, datas, actions = Array('Q'), [], []
+
+            while stack and len(datas) < chunk_size:
+                node = stack.pop()
+                children = node._children
+                datas.append(node.data)
+                actions.append(node.action)
+
+                if children:
+                    counts.append(len(children))
+                    stack.extend(reversed(children))
+
+                else:
+                    counts.append(0)
+
+            _write_chunk(file, counts, datas, actions)
+
+        file.write(_CHUNK_HEADER.pack(b'B', b'p', 0, 0, 0, 0))
+
+    return None
+
+
+def _iter_stream(file) -> typing.Generator:
+    """Yields the header fields (kind, byte order and indexed) of the \
+stream in *file*, then its chunks as (counts, datas, actions) tuples
+"""
+
+    header = file.read(_STREAM_HEADER.size)
+
+    if len(header) != _STREAM_HEADER.size:
+        raise ValueError('not a dsalgos stream')
+
+    magic, version, kind, byteorder, indexed = _STREAM_HEADER.unpack(header)
+
+    if magic != _STREAM_MAGIC or kind not in (b'T', b'L') \
+            or byteorder not in (b'<', b'>'):
+        raise ValueError('not a dsalgos stream')
+
+    if version != _STREAM_VERSION:
+        raise ValueError(f'unsupported dsalgos stream version ({version})')
+
+    byteorder = 'little' if byteorder == b'<' else 'big'
+    yield kind, indexed
+
+    while True:
+        typecode, encoding, length, *sizes = _CHUNK_HEADER.unpack(
+            _read_exactly(file, _CHUNK_HEADER.size)
+        )
+
+        if not length:
+            return None
+
+        structure, payload, actions = (
+            _read_exactly(file, size) for size in sizes
+        )
+        counts = Array(typecode.decode())
+        counts.frombytes(structure)
+
+        if byteorder != _sys.byteorder:
+            counts.byteswap()
+
+        if actions:
+            import pickle
+
+            actions = pickle.loads(actions)
+
+        else:
+            actions = _repeat(None, length)
+
+        yield counts, _decode_payloads(encoding, payload, byteorder), actions
+
+
+def iter_load(file) -> typing.Generator:
+    """Yields the node objects of the stream in *file* (a path or a \
+binary file object), written by `dump`, as (depth, data, action) tuples
+in pre-order (list elements all have depth 0), without building them
+
+Explanation
+    A stream is a header followed by chunks of up to `chunk_size`
+    node objects. Each chunk holds the structure codes of its node
+    objects (their no. of children, in pre-order, in the smallest
+    Array typecode that fits), their payload table (an Array of
+    numbers when every data is a Data object of a single int or
+    float, else a pickled list of args and kwargs) and their actions
+    (pickled, or nothing when they are all None).
+
+    Only one chunk is read at a time, and the depth of every node
+    object follows from the structure codes with a stack of the
+    children left to read at every level, so memory use is bounded
+    by the chunk size and the height of the tree, and nothing is
+    ever done recursively.
+
+    Never read untrusted files: the pickled payload tables and actions
+    are unpickled (`pickle.loads`), which can run arbitrary code.
+"""
+
+    with _open_stream(file, 'rb') as file:
+        chunks = _iter_stream(file)
+        kind, _ = next(chunks)
+        left = []
+
+        for counts, datas, actions in chunks:
+            # List chunks have no structure codes, and every element
+            # is a leaf
+            if kind == b'L':
+                counts = _repeat(0)
+
+            for count, data, action in zip(counts, datas, actions):
+                yield len(left), data, action
+
+                if left:
+                    left[-1] -= 1
+
+                if count:
+                    left.append(count)
+
+                else:
+                    while left and not left[-1]:
+                        left.pop()
+
+    return None
+
+
+def load(file) -> typing.Union[Node, SinglyLinkedList]:
+    """Returns the root Node object of the tree (or the \
+SinglyLinkedList) in *file* (a path or a binary file object), written by
+`dump`
+
+The node objects are linked directly (children, siblings, depths and
+roots), without running the Node setters, and the garbage collector is
+paused meanwhile. A SinglyLinkedList is loaded without a `head` (it is
+not written).
+
+Never load untrusted files: payloads other than numbers, and actions,
+are unpickled (`pickle.loads`), which can run arbitrary code
+"""
+
+    with _gc_paused(), _open_stream(file, 'rb') as file:
+        return _load_chunks(_iter_stream(file))
+
+
+def _load_chunks(chunks: typing.Generator) -> typing.Union[
+    Node, SinglyLinkedList
+]:
+    """Returns the tree or the SinglyLinkedList of the stream read by \
+*chunks* (an `_iter_stream` generator)
+"""
+
+    kind, indexed = next(chunks)
+
+    if kind == b'L':
+        return SinglyLinkedList.from_iterable(
+            (
+                Node(data, action=action)
+                for _, datas, actions in chunks
+                for data, action in zip(datas, actions)
+            ),
+            indexed=indexed
+        )
+
+    root = None
+    parents, left = [], []
+
+    for counts, datas, actions in chunks:
+        for count, data, action in zip(counts, datas, actions):
+            node = Node(data, action=action)
+
+            if parents:
+                parent = parents[-1]
+                node._parent = parent
+                node._depth = len(parents)
+                node._root = root
+
+                if parent._children:
+                    _link(parent._children[-1], node)
+                    parent._children.append(node)
+
+                else:
+                    parent._children = [node]
+
+                left[-1] -= 1
+
+            else:
+                root = node
+
+            if count:
+                parents.append(node)
+                left.append(count)
+
+            else:
+                while left and not left[-1]:
+                    left.pop()
+                    parents.pop()
+
+    return root
+
+
+class ArrayLinkedList:
+    """Instantiates an array-backed Linked List object
+
+Parameters
+    iterable=() (iterable) - Values to append, in order
+
+Example
+    allist = ArrayLinkedList(range(10))
+    handle = allist.append(10)
+    allist.insert_after(handle, 11)
+
+Explanation
+    Instead of one Node object per element, the links are kept in
+    parallel `Array('q')` buffers of slot indices ('next' and
+    'previous') next to a plain list of values, so an element costs
+    two machine words and one list slot. Every element lives in a
+    slot whose index (a 'handle') stays valid until that element is
+    removed, which makes insertion and removal after/at a handle O(1)
+    and lets the ends be pushed and popped in O(1). Slots freed by
+    removals are chained into a free-list and reused before the
+    buffers grow. Node objects are only created on demand, through
+    `node`, `nodes` and `to_singly_linked_list`.
+"""
+
+    __slots__ = ('_next', '_previous', '_values', '_head', '_tail',
+                 '_free', '_length')
+
+    def __init__(self, iterable: typing.Iterable = ()) -> NoneType:
+        self._next = Array('q')
+        self._previous = Array('q')
+        self._values = []
+        self._head = -1
+        self._tail = -1
+        self._free = -1
+        self._length = 0
+
+        self.extend(iterable)
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'ArrayLL({list(self)})'
+
+    def __eq__(self, allist) -> bool:
+        if isinstance(allist, ArrayLinkedList):
+            return (
+                len(self) == len(allist)
+                and all(a == b for a, b in zip(self, allist))
+            )
+
+        return False
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        next_, values = self._next, self._values
+        slot = self._head
+
+        while slot != -1:
+            yield values[slot]
+            slot = next_[slot]
+
+    def __reversed__(self):
+        previous, values = self._previous, self._values
+        slot = self._tail
+
+        while slot != -1:
+            yield values[slot]
+            slot = previous[slot]
+
+    def __contains__(self, value) -> bool:
+        return any(value == element for element in self)
+
+    def _allocate(self, value) -> int:
+        slot = self._free
+
+        if slot != -1:
+            self._free = self._next[slot]
+            self._values[slot] = value
+
+        else:
+            slot = len(self._values)
+            self._next.append(-1)
+            self._previous.append(-1)
+            self._values.append(value)
+
+        self._length += 1
+
+        return slot
+
+    def _release(self, slot: int):
+        value = self._values[slot]
+        self._values[slot] = None
+        self._previous[slot] = -1
+        self._next[slot] = self._free
+        self._free = slot
+        self._length -= 1
+
+        return value
+
+    def _check(self, handle: int) -> int:
+        if not isinstance(handle, int):
+            raise TypeError(f"'{handle}' must be of type 'int'")
+
+        if not (
+            0 <= handle < len(self._values)
+            and (self._previous[handle] != -1 or self._head == handle)
+        ):
+            raise KeyError(f"'{handle}' is not a live handle")
+
+        return handle
+
+    def _unlink(self, slot: int):
+        next_, previous = self._next, self._previous
+        after, before = next_[slot], previous[slot]
+
+        if before == -1:
+            self._head = after
+
+        else:
+            next_[before] = after
+
+        if after == -1:
+            self._tail = before
+
+        else:
+            previous[after] = before
+
+        return self._release(slot)
+
+    @property
+    def head(self) -> typing.Union[int, NoneType]:
+        """Returns the handle of the first element (None if empty)"""
+
+        return None if self._head == -1 else self._head
+
+    @property
+    def tail(self) -> typing.Union[int, NoneType]:
+        """Returns the handle of the last element (None if empty)"""
+
+        return None if self._tail == -1 else self._tail
+
+    def get(self, handle: int):
+        """Returns the value stored at *handle*"""
+
+        return self._values[self._check(handle)]
+
+    def set(self, handle: int, value) -> NoneType:
+        """Replaces the value stored at *handle*"""
+
+        self._values[self._check(handle)] = value
+
+        return None
+
+    def next_of(self, handle: int) -> typing.Union[int, NoneType]:
+        """Returns the handle after *handle* (None at the tail)"""
+
+        slot = self._next[self._check(handle)]
+
+        return None if slot == -1 else slot
+
+    def previous_of(self, handle: int) -> typing.Union[int, NoneType]:
+        """Returns the handle before *handle* (None at the head)"""
+
+        slot = self._previous[self._check(handle)]
+
+        return None if slot == -1 else slot
+
+    def handles(self):
+        """Yields the handles of all elements, from head to tail"""
+
+        next_ = self._next
+        slot = self._head
+
+        while slot != -1:
+            yield slot
+            slot = next_[slot]
+
+    def append(self, value) -> int:
+        """Appends *value* at the tail and returns its handle, in O(1)"""
+
+        slot = self._allocate(value)
+
+        if self._tail == -1:
+            self._head = slot
+
+        else:
+            self._next[self._tail] = slot
+            self._previous[slot] = self._tail
+
+        self._next[slot] = -1
+        self._tail = slot
+
+        return slot
+
+    def appendleft(self, value) -> int:
+        """Prepends *value* at the head and returns its handle, in O(1)"""
+
+        slot = self._allocate(value)
+
+        if self._head == -1:
+            self._tail = slot
+            self._next[slot] = -1
+
+        else:
+            self._previous[self._head] = slot
+            self._next[slot] = self._head
+
+        self._previous[slot] = -1
+        self._head = slot
+
+        return slot
+
+    def extend(self, iterable: typing.Iterable) -> NoneType:
+        """Appends every value of *iterable* at the tail"""
+
+        append = self.append
+
+        for value in iterable:
+            append(value)
+
+        return None
+
+    def insert_after(self, handle: int, value) -> int:
+        """Inserts *value* after *handle* and returns its handle, in O(1)"""
+
+        after = self._next[self._check(handle)]
+
+        if after == -1:
+            return self.append(value)
+
+        slot = self._allocate(value)
+        self._next[handle] = slot
+        self._previous[slot] = handle
+        self._next[slot] = after
+        self._previous[after] = slot
+
+        return slot
+
+    def remove(self, handle: int):
+        """Removes the element at *handle* and returns its value, in O(1)"""
+
+        return self._unlink(self._check(handle))
+
+    def remove_after(self, handle: int):
+        """Removes the element after *handle* and returns its value, \
+in O(1)
+"""
+
+        after = self._next[self._check(handle)]
+
+        if after == -1:
+            raise IndexError(f"'{handle}' is the tail handle")
+
+        return self._unlink(after)
+
+    def pop(self):
+        """Removes and returns the last value, in O(1)"""
+
+        if self._tail == -1:
+            raise IndexError('pop from empty ArrayLinkedList')
+
+        return self._unlink(self._tail)
+
+    def popleft(self):
+        """Removes and returns the first value, in O(1)"""
+
+        if self._head == -1:
+            raise IndexError('pop from empty ArrayLinkedList')
+
+        return self._unlink(self._head)
+
+    def clear(self) -> NoneType:
+        """Removes all elements and releases the buffers"""
+
+        self.__init__()
+
+        return None
+
+    def node(self, handle: int) -> Node:
+        """Returns a new, unlinked Node view of the element at *handle*
+
+The Node is a snapshot: changing it does not change the list
+"""
+
+        return _as_node(self.get(handle))
+
+    def nodes(self):
+        """Yields an unlinked Node view of every element, in order"""
+
+        for value in self:
+            yield _as_node(value)
+
+    def to_singly_linked_list(self) -> SinglyLinkedList:
+        """Returns a SinglyLinkedList of (new) Node views of the elements"""
+
+        return SinglyLinkedList(elements=list(self.nodes()))
+
+    @classmethod
+    def from_nodes(cls, nodes: typing.Iterable[Node]) -> ArrayLinkedList:
+        """Returns an ArrayLinkedList holding the `data` of each Node"""
+
+        return cls(node.data for node in nodes)
+
+
+class _Chunk:
+    """A chunk of an UnrolledList: an Array of values, linked to the \
+chunks before and after it
+"""
+
+    __slots__ = ('items', 'previous', 'next_')
+
+    def __init__(self, items: Array) -> NoneType:
+        self.items = items
+        self.previous = None
+        self.next_ = None
+
+        return None
+
+
+class UnrolledList:
+    """Instantiates an unrolled linked list of typed values
+
+Parameters
+    typecode='q' (str) - The Array typecode of the values
+    items=() (iterable) - Values to append, in order
+    capacity=256 (int) - The maximum no. of values in a chunk
+
+Example
+    ulist = UnrolledList('d', range(10))
+    ulist.insert(5, 4.5)
+    total = sum(sum(chunk) for chunk in ulist.chunks())
+
+Explanation
+    An unrolled linked list is a linked list whose nodes ('chunks')
+    each hold up to *capacity* values in an Array, instead of one
+    value per Node and Data object. The values of a chunk sit next
+    to each other in memory, so scans run over whole buffers (and
+    `chunks` hands them out as memoryview objects, without copying),
+    while inserting or removing a value only moves the values of
+    one chunk.
+
+    Appended values fill the last chunk before a new one is linked.
+    Inserting into a full chunk first splits it in two halves, and a
+    chunk left less than half full by a removal is merged with a
+    neighbour when their values fit in one chunk, so chunks stay
+    between half full and full (except at the ends).
+
+    Indexing walks the chunks from the nearest of the first chunk,
+    the last chunk and the chunk found by the previous lookup, in
+    O(n / capacity) steps (O(√n) with a capacity close to √n), and
+    sequential access stays O(1) per value.
+
+    A chunk cannot be resized while a memoryview of it is alive, so
+    release the views from `chunks` (or let them go) before changing
+    the list; Array raises BufferError otherwise.
+"""
+
+    __slots__ = ('_typecode', '_capacity', '_head', '_tail', '_length',
+                 '_chunk_count', '_finger', '_finger_start')
+
+    def __init__(self, typecode: str = 'q', items: typing.Iterable = (),
+                 capacity: int = 256) -> NoneType:
+        Array(typecode)
+
+        if not isinstance(capacity, int) or capacity < 2:
+            raise ValueError("'capacity' must be an integer of at least 2")
+
+        self._typecode = typecode
+        self._capacity = capacity
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._chunk_count = 0
+        self._finger = None
+        self._finger_start = 0
+
+        self.extend(items)
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'UnrolledList({self._typecode!r}, {list(self)})'
+
+    def __eq__(self, ulist) -> bool:
+        if isinstance(ulist, UnrolledList):
+            return (
+                len(self) == len(ulist)
+                and self.to_array() == ulist.to_array()
+            )
+
+        return False
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return _chain.from_iterable(
+            chunk.items for chunk in self._iter_chunks(self._head)
+        )
+
+    def __reversed__(self):
+        chunk = self._tail
+
+        while chunk is not None:
+            yield from reversed(chunk.items)
+            chunk = chunk.previous
+
+    def __contains__(self, value) -> bool:
+        return any(
+            value in chunk.items for chunk in self._iter_chunks(self._head)
+        )
+
+    def __getitem__(self, index) -> typing.Union[int, float, str, Array]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+
+            if step < 0 or start >= stop:
+                return self.to_array()[index]
+
+            chunk, offset = self._locate(start)
+            values = _chain(
+                chunk.items[offset:],
+                _chain.from_iterable(
+                    chunk.items for chunk in self._iter_chunks(chunk.next_)
+                )
+            )
+
+            return Array(
+                self._typecode, _islice(values, 0, stop - start, step)
+            )
+
+        chunk, offset = self._locate(index)
+
+        return chunk.items[offset]
+
+    def __setitem__(self, index: int, value) -> NoneType:
+        chunk, offset = self._locate(index)
+        chunk.items[offset] = value
+
+        return None
+
+    def __delitem__(self, index: int) -> NoneType:
+        self.pop(index)
+
+        return None
+
+    def _iter_chunks(self, chunk: typing.Union[_Chunk, NoneType]):
+        """Yields the chunks from *chunk* to the last one"""
+
+        while chunk is not None:
+            yield chunk
+            chunk = chunk.next_
+
+    def _locate(self, index: int) -> typing.Tuple[_Chunk, int]:
+        """Returns the chunk holding the value at *index* and the \
+offset of the value in it, and remembers the chunk for the next lookup
+"""
+
+        if not isinstance(index, int):
+            raise TypeError("UnrolledList indices must be integers")
+
+        length = self._length
+
+        if index < 0:
+            index += length
+
+        if not 0 <= index < length:
+            raise IndexError('UnrolledList index out of range')
+
+        if index <= length - index:
+            chunk, start, distance = self._head, 0, index
+
+        else:
+            chunk = self._tail
+            start = length - len(chunk.items)
+            distance = length - index
+
+        if (
+            self._finger is not None
+            and abs(index - self._finger_start) < distance
+        ):
+            chunk, start = self._finger, self._finger_start
+
+        while index < start:
+            chunk = chunk.previous
+            start -= len(chunk.items)
+
+        while index >= start + len(chunk.items):
+            start += len(chunk.items)
+            chunk = chunk.next_
+
+        self._finger, self._finger_start = chunk, start
+
+        return chunk, index - start
+
+    def _link_after(self, chunk: typing.Union[_Chunk, NoneType],
+                    items: Array) -> _Chunk:
+        """Links a new chunk of *items* after *chunk* (or as the \
+first chunk, if it is None) and returns it
+"""
+
+        new = _Chunk(items)
+        new.previous = chunk
+        new.next_ = self._head if chunk is None else chunk.next_
+
+        if new.previous is None:
+            self._head = new
+
+        else:
+            new.previous.next_ = new
+
+        if new.next_ is None:
+            self._tail = new
+
+        else:
+            new.next_.previous = new
+
+        self._chunk_count += 1
+
+        return new
+
+    def _unlink(self, chunk: _Chunk) -> NoneType:
+        """Unlinks *chunk* from the chunks before and after it"""
+
+        previous, next_ = chunk.previous, chunk.next_
+
+        if previous is None:
+            self._head = next_
+
+        else:
+            previous.next_ = next_
+
+        if next_ is None:
+            self._tail = previous
+
+        else:
+            next_.previous = previous
+
+        chunk.previous = chunk.next_ = None
+        self._chunk_count -= 1
+
+        if self._finger is chunk:
+            self._finger = None
+
+        return None
+
+    def _rebalance(self, chunk: _Chunk) -> NoneType:
+        """Unlinks *chunk* if it is empty, or merges it with a \
+neighbour if it is less than half full and their values fit in one
+chunk
+"""
+
+        size = len(chunk.items)
+
+        if not size:
+            self._unlink(chunk)
+
+            return None
+
+        if size >= self._capacity // 2:
+            return None
+
+        next_, previous = chunk.next_, chunk.previous
+
+        if next_ is not None and size + len(next_.items) <= self._capacity:
+            chunk.items.extend(next_.items)
+            self._unlink(next_)
+
+        elif (
+            previous is not None
+            and size + len(previous.items) <= self._capacity
+        ):
+            if self._finger is chunk:
+                self._finger = previous
+                self._finger_start -= len(previous.items)
+
+            previous.items.extend(chunk.items)
+            self._unlink(chunk)
+
+        return None
+
+    @property
+    def typecode(self) -> str:
+        """The Array typecode of the values"""
+
+        return self._typecode
+
+    @property
+    def capacity(self) -> int:
+        """The maximum no. of values in a chunk"""
+
+        return self._capacity
+
+    @property
+    def chunk_count(self) -> int:
+        """The no. of chunks"""
+
+        return self._chunk_count
+
+    def chunks(self) -> typing.Iterator[memoryview]:
+        """Yields a memoryview of the values of every chunk, in order, \
+without copying them
+"""
+
+        for chunk in self._iter_chunks(self._head):
+            yield memoryview(chunk.items)
+
+    def append(self, value) -> NoneType:
+        """Appends *value* at the end, in O(1)"""
+
+        tail = self._tail
+
+        if tail is None or len(tail.items) >= self._capacity:
+            self._link_after(tail, Array(self._typecode, (value,)))
+
+        else:
+            tail.items.append(value)
+
+        self._length += 1
+
+        return None
+
+    def extend(self, items: typing.Iterable) -> NoneType:
+        """Appends the values of *items*, in order, filling the last \
+chunk and then new, full ones (copying Arrays of the same typecode in
+bulk)
+"""
+
+        if not (
+            isinstance(items, _Array) and items.typecode == self._typecode
+        ):
+            items = Array(self._typecode, items)
+
+        capacity, start = self._capacity, 0
+        tail = self._tail
+
+        if tail is not None and len(tail.items) < capacity:
+            start = capacity - len(tail.items)
+            tail.items.extend(items[:start])
+
+        for start in range(start, len(items), capacity):
+            tail = self._link_after(
+                tail, Array(self._typecode, items[start:start + capacity])
+            )
+
+        self._length += len(items)
+
+        return None
+
+    def insert(self, index: int, value) -> NoneType:
+        """Inserts *value* before *index*, moving the values of one \
+chunk (which is split in two halves first, if full)
+"""
+
+        if not isinstance(index, int):
+            raise TypeError("UnrolledList indices must be integers")
+
+        if index < 0:
+            index = max(index + self._length, 0)
+
+        if index >= self._length:
+            return self.append(value)
+
+        chunk, offset = self._locate(index)
+        items = chunk.items
+
+        if len(items) >= self._capacity:
+            half = len(items) // 2
+            new = self._link_after(chunk, items[half:])
+            del items[half:]
+
+            if offset > half:
+                chunk, offset = new, offset - half
+                self._finger, self._finger_start = (
+                    new, self._finger_start + half
+                )
+
+        chunk.items.insert(offset, value)
+        self._length += 1
+
+        return None
+
+    def pop(self, index: int = -1):
+        """Removes and returns the value at *index* (the last one \
+by default), merging its chunk with a neighbour if it gets less than
+half full
+"""
+
+        if not self._length:
+            raise IndexError('pop from empty UnrolledList')
+
+        chunk, offset = self._locate(index)
+        value = chunk.items.pop(offset)
+        self._length -= 1
+        self._rebalance(chunk)
+
+        return value
+
+    def remove(self, value) -> NoneType:
+        """Removes the first occurrence of *value*"""
+
+        del self[self.index(value)]
+
+        return None
+
+    def index(self, value) -> int:
+        """Returns the index of the first occurrence of *value*, \
+searching chunk by chunk
+"""
+
+        start = 0
+
+        for chunk in self._iter_chunks(self._head):
+            try:
+                return start + chunk.items.index(value)
+
+            except ValueError:
+                start += len(chunk.items)
+
+        raise ValueError(f"'{value}' is not in the UnrolledList")
+
+    def count(self, value) -> int:
+        """Returns the no. of occurrences of *value*"""
+
+        return sum(
+            chunk.items.count(value)
+            for chunk in self._iter_chunks(self._head)
+        )
+
+    def clear(self) -> NoneType:
+        """Removes all the values"""
+
+        self._head = self._tail = self._finger = None
+        self._length = self._chunk_count = self._finger_start = 0
+
+        return None
+
+    def to_array(self) -> Array:
+        """Returns a new Array of all the values, in order"""
+
+        array = Array(self._typecode)
+
+        for chunk in self._iter_chunks(self._head):
+            array.extend(chunk.items)
+
+        return array
+
+
+class DaryHeap:
+    """Instantiates a min-heap of (hashable, distinct) *items*, each \
+with a priority, in which every parent has *d* children
+
+Parameters
+    items=() (iterable) - (item, priority) pairs to heapify
+    d=4 (int) - The number of children of every parent (2 or more)
+    typecode='d' (str) - The Array typecode of the priorities
+
+Example
+    heap = DaryHeap([('a', 3), ('b', 1)])
+    heap.push('c', 2)
+    heap.decrease_key('a', 0)
+    heap.pop()  # ('a', 0.0)
+
+Explanation
+    The heap is a complete d-ary tree laid out level by level, with
+    the priorities in an Array and the items in a list beside it.
+    A dict from every item to its position (the position index)
+    lets `decrease_key` find an item in O(1), then move it up in
+    O(log_d(n)) steps. A wider tree is shallower, so pushes and
+    decreases (which move up) get cheaper while pops (which compare
+    all *d* children at each level) get dearer; *d* = 4 usually wins
+    for Dijkstra-like mixes, with many more decreases than pops.
+"""
+
+    def __init__(self, items: typing.Iterable[tuple] = (), d: int = 4,
+                 typecode: str = 'd') -> NoneType:
+        if d < 2:
+            raise ValueError("'d' must be 2 or more")
+
+        self.d = d
+        self._items = []
+        self._priorities = Array(typecode)
+        self._positions = {}
+
+        for item, priority in items:
+            if item in self._positions:
+                raise ValueError(f"'{item}' is already in the heap")
+
+            self._positions[item] = len(self._items)
+            self._items.append(item)
+            self._priorities.append(priority)
+
+        for position in reversed(range((len(self._items) + d - 2) // d)):
+            self._sift_down(position)
+
+        return None
+
+    @classmethod
+    def heapify(cls, items: typing.Iterable[tuple], d: int = 4,
+                typecode: str = 'd') -> DaryHeap:
+        """Returns a DaryHeap of the (item, priority) pairs *items*, \
+built bottom-up in O(n) steps (instead of O(n log(n)) pushes)
+"""
+
+        return cls(items, d, typecode)
+
+    def __repr__(self) -> str:
+        return f'<DaryHeap of {len(self)} items (d={self.d})>'
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._positions
+
+    def _sift_up(self, position: int) -> NoneType:
+        items, priorities, positions = (
+            self._items, self._priorities, self._positions
+        )
+        item, priority = items[position], priorities[position]
+
+        while position:
+            parent = (position - 1) // self.d
+
+            if priorities[parent] <= priority:
+                break
+
+            items[position] = items[parent]
+            priorities[position] = priorities[parent]
+            positions[items[position]] = position
+            position = parent
+
+        items[position] = item
+        priorities[position] = priority
+        positions[item] = position
+
+        return None
+
+    def _sift_down(self, position: int) -> NoneType:
+        items, priorities, positions = (
+            self._items, self._priorities, self._positions
+        )
+        item, priority = items[position], priorities[position]
+        length = len(items)
+
+        while True:
+            first = self.d * position + 1
+
+            if first >= length:
+                break
+
+            child, lowest = first, priorities[first]
+
+            for other in range(first + 1, min(first + self.d, length)):
+                if priorities[other] < lowest:
+                    child, lowest = other, priorities[other]
+
+            if lowest >= priority:
+                break
+
+            items[position] = items[child]
+            priorities[position] = lowest
+            positions[items[position]] = position
+            position = child
+
+        items[position] = item
+        priorities[position] = priority
+        positions[item] = position
+
+        return None
+
+    def push(self, item, priority) -> NoneType:
+        """Adds *item* with *priority*"""
+
+        if item in self._positions:
+            raise ValueError(f"'{item}' is already in the heap")
+
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._sift_up(len(self._items) - 1)
+
+        return None
+
+    def peek(self) -> tuple:
+        """Returns the (item, priority) pair with the lowest priority"""
+
+        if not self._items:
+            raise IndexError('peek from empty heap')
+
+        return self._items[0], self._priorities[0]
+
+    def pop(self) -> tuple:
+        """Removes and returns the (item, priority) pair with the \
+lowest priority
+"""
+
+        if not self._items:
+            raise IndexError('pop from empty heap')
+
+        item, priority = self._items[0], self._priorities[0]
+        last, last_priority = self._items.pop(), self._priorities.pop()
+        del self._positions[item]
+
+        if self._items:
+            self._items[0], self._priorities[0] = last, last_priority
+            self._sift_down(0)
+
+        return item, priority
+
+    def priority(self, item):
+        """Returns the priority of *item*"""
+
+        return self._priorities[self._positions[item]]
+
+    def decrease_key(self, item, priority) -> NoneType:
+        """Lowers the priority of *item* to *priority*"""
+
+        position = self._positions[item]
+
+        if priority > self._priorities[position]:
+            raise ValueError(f"'{priority}' is greater than the priority "
+                             f"of '{item}'")
+
+        self._priorities[position] = priority
+        self._sift_up(position)
+
+        return None
+
+
+class _PairingNode:
+    """A node of a PairingHeap: its first child, and its next and \
+previous siblings (the previous one of a first child is its parent)
+"""
+    __slots__ = ('item', 'priority', 'child', 'next', 'previous')
+
+    def __init__(self, item, priority) -> NoneType:
+        self.item = item
+        self.priority = priority
+        self.child = None
+        self.next = None
+        self.previous = None
+
+
+def _meld(this: _PairingNode, that: _PairingNode) -> _PairingNode:
+    """Makes the root with the greater priority the first child of \
+the other one, and returns the other one
+"""
+
+    if that.priority < this.priority:
+        this, that = that, this
+
+    that.previous = this
+    that.next = this.child
+
+    if this.child is not None:
+        this.child.previous = that
+
+    this.child = that
+
+    return this
+
+
+class PairingHeap:
+    """Instantiates a min-heap of (hashable, distinct) *items*, each \
+with a priority, as a pairing heap
+
+Parameters
+    items=() (iterable) - (item, priority) pairs to add
+
+Example
+    heap = PairingHeap([('a', 3), ('b', 1)])
+    heap.decrease_key('a', 0)
+    heap.pop()  # ('a', 0)
+
+Explanation
+    A tree of linked nodes (each with links to its first child and to
+    its siblings, like Node objects) in which every parent has a
+    lower priority than its children. Pushing, merging heaps and
+    decreasing a priority each just link two trees, in O(1); popping
+    removes the root and pairs up its children, left to right, then
+    merges the pairs right to left, in O(log(n)) amortized steps.
+"""
+
+    def __init__(self, items: typing.Iterable[tuple] = ()) -> NoneType:
+        self._root = None
+        self._nodes = {}
+
+        for item, priority in items:
+            self.push(item, priority)
+
+        return None
+
+    @classmethod
+    def heapify(cls, items: typing.Iterable[tuple]) -> PairingHeap:
+        """Returns a PairingHeap of the (item, priority) pairs \
+*items*, in O(n) steps
+"""
+
+        return cls(items)
+
+    def __repr__(self) -> str:
+        return f'<PairingHeap of {len(self)} items>'
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, item) -> bool:
+        return item in self._nodes
+
+    def push(self, item, priority) -> NoneType:
+        """Adds *item* with *priority*"""
+
+        if item in self._nodes:
+            raise ValueError(f"'{item}' is already in the heap")
+
+        node = self._nodes[item] = _PairingNode(item, priority)
+        self._root = node if self._root is None else _meld(self._root, node)
+
+        return None
+
+    def peek(self) -> tuple:
+        """Returns the (item, priority) pair with the lowest priority"""
+
+        if self._root is None:
+            raise IndexError('peek from empty heap')
+
+        return self._root.item, self._root.priority
+
+    def pop(self) -> tuple:
+        """Removes and returns the (item, priority) pair with the \
+lowest priority
+"""
+
+        root = self._root
+
+        if root is None:
+            raise IndexError('pop from empty heap')
+
+        del self._nodes[root.item]
+        pairs = []
+        node = root.child
+
+        while node is not None:
+            this, that = node, node.next
+            this.next = this.previous = None
+
+            if that is None:
+                node = None
+
+            else:
+                node = that.next
+                that.next = that.previous = None
+                this = _meld(this, that)
+
+            pairs.append(this)
+
+        root.child = None
+        self._root = pairs.pop() if pairs else None
+
+        while pairs:
+            self._root = _meld(pairs.pop(), self._root)
+
+        return root.item, root.priority
+
+    def priority(self, item):
+        """Returns the priority of *item*"""
+
+        return self._nodes[item].priority
+
+    def decrease_key(self, item, priority) -> NoneType:
+        """Lowers the priority of *item* to *priority*, in O(1)"""
+
+        node = self._nodes[item]
+
+        if priority > node.priority:
+            raise ValueError(f"'{priority}' is greater than the priority "
+                             f"of '{item}'")
+
+        node.priority = priority
+
+        if node is self._root:
+            return None
+
+        if node.previous.child is node:
+            node.previous.child = node.next
+
+        else:
+            node.previous.next = node.next
+
+        if node.next is not None:
+            node.next.previous = node.previous
+
+        node.next = node.previous = None
+        self._root = _meld(self._root, node)
+
+        return None
+
+    def meld(self, other: PairingHeap) -> NoneType:
+        """Moves all the items of *other* (which must not share any \
+with this heap) into this heap, in O(1) plus the cost of merging the
+position indices
+"""
+
+        if not isinstance(other, PairingHeap):
+            raise TypeError(f"'{other}' must be of type 'PairingHeap'")
+
+        if not self._nodes.keys().isdisjoint(other._nodes):
+            raise ValueError("the heaps must not share items")
+
+        if other._root is not None:
+            self._nodes.update(other._nodes)
+            self._root = (
+                other._root if self._root is None
+                else _meld(self._root, other._root)
+            )
+            other._root, other._nodes = None, {}
+
+        return None
+
+
+def merge(*iterables: typing.Iterable, key: typing.Callable = None,
+          reverse: bool = False):
+    """Lazily yields the items of all the sorted *iterables*, sorted
+
+Parameters
+    *iterables - The iterables, each sorted (by *key*, if given)
+    key=None (callable) - Returns the value to compare an item by
+    reverse=False (bool) - True if the iterables are sorted descending
+
+Explanation
+    Delegates to `heapq.merge`, which keeps the next item of every
+    iterable in a binary heap, and repeatedly yields the smallest one
+    and replaces it with the next item of its iterable. Only one item
+    per iterable is held at a time, so iterables far larger than
+    memory (e.g., files) can be merged in O(n log(k)) steps. Items
+    that compare equal are yielded in the order of their iterables
+    (the merge is stable).
+"""
+
+    return _heapq.merge(*iterables, key=key, reverse=reverse)
+
+
+# Marks a missing cache entry, and separates positional from keyword
+# arguments in memoized call keys
+_MISSING = object()
+_KWARGS = object()
+
+
+def _call_key(args: tuple, kwargs: dict):
+    """Returns a hashable key for a call with *args* and *kwargs*"""
+
+    if not kwargs:
+        if len(args) == 1 and type(args[0]) in (int, str):
+            return args[0]
+
+        return args
+
+    return (*args, _KWARGS, *kwargs.items())
+
+
+class _Cache:
+    """The shared interface of the caches
+
+Subclasses implement `__len__`, `_lookup`, `_store`, `_discard` and
+`_clear`, which run under the lock (if any) and count evictions
+"""
+
+    def __init__(self, lock = None) -> NoneType:
+        self.lock = lock
+        self._lock = _nullcontext() if lock is None else lock
+        self.hits = self.misses = self.evictions = 0
+
+        return None
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} of {len(self)} items (hits='
+            f'{self.hits}, misses={self.misses}, evictions={self.evictions})>'
+        )
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return self._lookup(key, False) is not _MISSING
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key, value) -> NoneType:
+        with self._lock:
+            self._store(key, value)
+
+        return None
+
+    def __delitem__(self, key) -> NoneType:
+        with self._lock:
+            if not self._discard(key):
+                raise KeyError(key)
+
+        return None
+
+    def get(self, key, default = None):
+        """Returns the value of *key* (counting a hit), or *default* \
+(counting a miss)
+"""
+
+        with self._lock:
+            value = self._lookup(key, True)
+
+            if value is _MISSING:
+                self.misses += 1
+
+                return default
+
+            self.hits += 1
+
+            return value
+
+    def clear(self) -> NoneType:
+        """Removes all entries (the counters are kept)"""
+
+        with self._lock:
+            self._clear()
+
+        return None
+
+    def memoize(self, function: typing.Callable) -> typing.Callable:
+        """Returns *function* wrapped to look its results up in the \
+cache, by its (hashable) arguments, before calling it
+
+The wrapper's `cache` attribute is the cache. Like
+`functools.lru_cache`, the function itself runs outside the lock, so
+two threads may both compute a missing value
+"""
+
+        @_wraps(function)
+        def memoized(*args, **kwargs):
+            key = _call_key(args, kwargs)
+            value = self.get(key, _MISSING)
+
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                self[key] = value
+
+            return value
+
+        memoized.cache = self
+
+        return memoized
+
+
+class LRUCache(_Cache):
+    """Instantiates a cache of up to *maxsize* entries that evicts the \
+least recently used one first
+
+Parameters
+    maxsize=128 (int) - The maximum number of entries
+    lock=None (Lock) - An optional lock (e.g., a `threading.RLock`)
+        held during every operation, to share the cache between threads
+
+Example
+    cache = LRUCache(1000)
+    cache['key'] = 'value'
+    cache.get('key')
+
+    @memoize(LRUCache(1000))
+    def function(argument): ...
+
+Explanation
+    Every entry has a Node object (holding its key) in an indexed
+    SinglyLinkedList, most recently used first, and a dict maps every
+    key to its node object and value. A lookup moves the node object
+    to the front of the list and an insertion into a full cache pops
+    the node object at its end, all in O(1).
+
+    `hits`, `misses` and `evictions` count the lookups that found a
+    value, those that did not, and the entries evicted to make room.
+"""
+
+    def __init__(self, maxsize: int = 128, lock = None) -> NoneType:
+        if maxsize < 0:
+            raise ValueError("'maxsize' must not be negative")
+
+        super().__init__(lock)
+        self.maxsize = maxsize
+        self._entries = {}
+        self._order = SinglyLinkedList(indexed=True)
+
+        return None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key, touch: bool):
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return _MISSING
+
+        if touch:
+            self._order.move_to_front(entry[0])
+
+        return entry[1]
+
+    def _store(self, key, value) -> NoneType:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            node = Node(Data(key))
+            self._entries[key] = [node, value]
+            self._order.appendleft(node)
+
+        else:
+            entry[1] = value
+            self._order.move_to_front(entry[0])
+
+        while self._full():
+            self._evict()
+
+        return None
+
+    def _full(self) -> bool:
+        return len(self._entries) > self.maxsize
+
+    def _evict(self):
+        key = self._order.pop().data[0]
+        del self._entries[key]
+        self.evictions += 1
+
+        return key
+
+    def _discard(self, key) -> bool:
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return False
+
+        self._order.remove(entry[0])
+
+        return True
+
+    def _clear(self) -> NoneType:
+        self._entries.clear()
+        self._order = SinglyLinkedList(indexed=True)
+
+        return None
+
+
+class SizedCache(LRUCache):
+    """Instantiates a least recently used cache whose values take up \
+to *maxbytes* bytes in total
+
+Parameters
+    maxbytes (int) - The maximum total size of the values
+    sizeof=sys.getsizeof (callable) - Returns the size of a value
+    lock=None (Lock) - An optional lock held during every operation
+
+Explanation
+    Works like an LRUCache, but evicts the least recently used entries
+    until the sizes (as returned by *sizeof*) of the remaining values
+    add up to at most *maxbytes*. A value larger than *maxbytes* on
+    its own is not stored at all. `sys.getsizeof` does not follow
+    references, so pass a deeper *sizeof* for containers.
+"""
+
+    def __init__(self, maxbytes: int, sizeof: typing.Callable = _sys.getsizeof,
+                 lock = None) -> NoneType:
+        super().__init__(0, lock)
+        self.maxsize = None
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.currbytes = 0
+        self._sizes = {}
+
+        return None
+
+    def _store(self, key, value) -> NoneType:
+        size = self.sizeof(value)
+
+        if size > self.maxbytes:
+            self._discard(key)
+
+            return None
+
+        self.currbytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+        return super()._store(key, value)
+
+    def _full(self) -> bool:
+        return self.currbytes > self.maxbytes
+
+    def _evict(self):
+        key = super()._evict()
+        self.currbytes -= self._sizes.pop(key)
+
+        return key
+
+    def _discard(self, key) -> bool:
+        if not super()._discard(key):
+            return False
+
+        self.currbytes -= self._sizes.pop(key)
+
+        return True
+
+    def _clear(self) -> NoneType:
+        super()._clear()
+        self._sizes.clear()
+        self.currbytes = 0
+
+        return None
+
+
+class LFUCache(_Cache):
+    """Instantiates a cache of up to *maxsize* entries that evicts the \
+least frequently used one first
+
+Parameters
+    maxsize=128 (int) - The maximum number of entries
+    lock=None (Lock) - An optional lock held during every operation
+
+Explanation
+    Every entry counts its lookups (and updates), and the node objects
+    of the entries with the same count are kept in an indexed
+    SinglyLinkedList of their own (a frequency bucket), most recently
+    used first. A lookup moves the entry's node object from its bucket
+    to the next one, and an insertion into a full cache evicts the
+    least recently used entry of the lowest bucket (whose count is
+    tracked), so both take O(1). Ties between equally frequent
+    entries are broken by recency, and a new entry starts at 1, so a
+    one-off scan over many keys only ever evicts other one-off keys.
+"""
+
+    def __init__(self, maxsize: int = 128, lock = None) -> NoneType:
+        if maxsize < 0:
+            raise ValueError("'maxsize' must not be negative")
+
+        super().__init__(lock)
+        self.maxsize = maxsize
+        self._entries = {}
+        self._buckets = {}
+        self._lowest = 0
+
+        return None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _bucket(self, count: int) -> SinglyLinkedList:
+        bucket = self._buckets.get(count)
+
+        if bucket is None:
+            bucket = self._buckets[count] = SinglyLinkedList(indexed=True)
+
+        return bucket
+
+    def _unbucket(self, node: Node, count: int) -> NoneType:
+        bucket = self._buckets[count]
+        bucket.remove(node)
+
+        if not bucket:
+            del self._buckets[count]
+
+            if self._lowest == count:
+                self._lowest = min(self._buckets, default=0)
+
+        return None
+
+    def _touch(self, entry: list) -> NoneType:
+        node, count = entry[0], entry[2]
+        bucket = self._buckets[count]
+        bucket.remove(node)
+        self._bucket(count + 1).appendleft(node)
+        entry[2] = count + 1
+
+        if not bucket:
+            del self._buckets[count]
+
+            if self._lowest == count:
+                self._lowest = count + 1
+
+        return None
+
+    def _lookup(self, key, touch: bool):
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return _MISSING
+
+        if touch:
+            self._touch(entry)
+
+        return entry[1]
+
+    def _store(self, key, value) -> NoneType:
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            entry[1] = value
+            self._touch(entry)
+
+            return None
+
+        if not self.maxsize:
+            return None
+
+        if len(self._entries) >= self.maxsize:
+            bucket = self._buckets[self._lowest]
+            del self._entries[bucket.last.data[0]]
+            self._unbucket(bucket.last, self._lowest)
+            self.evictions += 1
+
+        node = Node(Data(key))
+        self._entries[key] = [node, value, 1]
+        self._bucket(1).appendleft(node)
+        self._lowest = 1
+
+        return None
+
+    def _discard(self, key) -> bool:
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return False
+
+        self._unbucket(entry[0], entry[2])
+
+        return True
+
+    def _clear(self) -> NoneType:
+        self._entries.clear()
+        self._buckets.clear()
+        self._lowest = 0
+
+        return None
+
+
+class TTLCache(_Cache):
+    """Instantiates a cache of up to *maxsize* entries that expire \
+*ttl* seconds after they were stored
+
+Parameters
+    maxsize=128 (int) - The maximum number of entries
+    ttl=60.0 (float) - The number of seconds an entry stays valid
+    timer=time.monotonic (callable) - Returns the current time
+    lock=None (Lock) - An optional lock held during every operation
+
+Explanation
+    The node objects of the entries are kept in an indexed
+    SinglyLinkedList, most recently stored first. As every entry lives
+    for the same *ttl*, that is also the order they expire in: the
+    expired entries are always at the end of the list, so `expire`
+    (which runs before every insertion) pops them in O(1) each, and a
+    full cache evicts the entry closest to expiring. An expired entry
+    is never returned (its lookup is a miss) and counts as evicted.
+"""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 60.0,
+                 timer: typing.Callable = _monotonic,
+                 lock = None) -> NoneType:
+        if maxsize < 0:
+            raise ValueError("'maxsize' must not be negative")
+
+        super().__init__(lock)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._entries = {}
+        self._order = SinglyLinkedList(indexed=True)
+
+        return None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def expire(self) -> int:
+        """Removes the expired entries, and returns how many there were"""
+
+        with self._lock:
+            return self._expire(self.timer())
+
+    def _expire(self, now: float) -> int:
+        count = 0
+
+        while self._order and self._entries[
+            self._order.last.data[0]
+        ][2] <= now:
+            del self._entries[self._order.pop().data[0]]
+            count += 1
+
+        self.evictions += count
+
+        return count
+
+    def _lookup(self, key, touch: bool):
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return _MISSING
+
+        if entry[2] <= self.timer():
+            self._discard(key)
+            self.evictions += 1
+
+            return _MISSING
+
+        return entry[1]
+
+    def _store(self, key, value) -> NoneType:
+        now = self.timer()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            entry[1], entry[2] = value, now + self.ttl
+            self._order.move_to_front(entry[0])
+
+            return None
+
+        self._expire(now)
+
+        if not self.maxsize:
+            return None
+
+        if len(self._entries) >= self.maxsize:
+            del self._entries[self._order.pop().data[0]]
+            self.evictions += 1
+
+        node = Node(Data(key))
+        self._entries[key] = [node, value, now + self.ttl]
+        self._order.appendleft(node)
+
+        return None
+
+    def _discard(self, key) -> bool:
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return False
+
+        self._order.remove(entry[0])
+
+        return True
+
+    def _clear(self) -> NoneType:
+        self._entries.clear()
+        self._order = SinglyLinkedList(indexed=True)
+
+        return None
+
+
+def memoize(cache = None) -> typing.Callable:
+    """Returns a decorator that memoizes a function in *cache* (a new \
+`LRUCache(128)` by default)
+
+Example
+    @memoize
+    def function(argument): ...
+
+    @memoize(LFUCache(1000, lock=threading.RLock()))
+    def other_function(argument): ...
+
+    function.cache.hits
+"""
+
+    if callable(cache) and not isinstance(cache, _Cache):
+        return LRUCache().memoize(cache)
+
+    def decorator(function: typing.Callable) -> typing.Callable:
+        return (LRUCache() if cache is None else cache).memoize(function)
+
+    return decorator
+
+
+class Queue:
+    """Instantiates a thread-safe FIFO queue of up to *maxsize* items \
+(0 for no limit)
+
+Parameters
+    maxsize=0 (int) - The maximum number of items (0 for no limit)
+
+Example
+    queue = Queue()
+    queue.put(1)
+    queue.get()  # blocks until an item is available
+
+Explanation
+    A two-lock (Michael-Scott) queue: the items are Node objects linked
+    from a dummy node object (`_head`) to the last one (`_tail`).
+    Producers only take the tail lock, to link a new node object after
+    the tail, and consumers only take the head lock, to make the node
+    object after the dummy the new dummy (and return its item), so a
+    producer and a consumer never wait for each other. A consumer of
+    an empty queue (or a producer of a full one) waits on a condition
+    of its own side's lock, and is only notified by the other side
+    when some thread is waiting.
+
+    The interface matches `queue.Queue` (raising `queue.Empty` and
+    `queue.Full`). Task tracking (`task_done`/`join`) counts the
+    unfinished items under a third lock, so it does not couple the
+    producers and the consumers either.
+"""
+
+    def __init__(self, maxsize: int = 0) -> NoneType:
+        self.maxsize = maxsize
+        self._head = self._tail = Node()
+        self._head_lock = _threading.Lock()
+        self._tail_lock = _threading.Lock()
+        self._not_empty = _threading.Condition(self._head_lock)
+        self._not_full = _threading.Condition(self._tail_lock)
+        self._puts = self._gets = 0
+        self._waiting_getters = self._waiting_putters = 0
+        self._all_tasks_done = _threading.Condition(_threading.Lock())
+        self._unfinished = 0
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'<Queue of {len(self)} items>'
+
+    def __len__(self) -> int:
+        return self._puts - self._gets
+
+    def qsize(self) -> int:
+        """Returns the (approximate) number of items"""
+
+        return len(self)
+
+    def empty(self) -> bool:
+        """Returns True if the queue is (approximately) empty"""
+
+        return self._head._next is None
+
+    def full(self) -> bool:
+        """Returns True if the queue is (approximately) full"""
+
+        return 0 < self.maxsize <= len(self)
+
+    def put(self, item, block: bool = True,
+            timeout: typing.Union[float, NoneType] = None) -> NoneType:
+        """Adds *item* at the end, waiting (if *block*, for up to \
+*timeout* seconds) for a free slot in a full queue, else raising
+`queue.Full`
+"""
+
+        node = Node(Data(item))
+
+        with self._tail_lock:
+            if self.maxsize and len(self) >= self.maxsize:
+                if not block:
+                    raise _Full
+
+                self._waiting_putters += 1
+
+                try:
+                    if not self._not_full.wait_for(
+                        lambda: len(self) < self.maxsize, timeout
+                    ):
+                        raise _Full
+
+                finally:
+                    self._waiting_putters -= 1
+
+            self._tail._next = node
+            self._tail = node
+            self._puts += 1
+
+        with self._all_tasks_done:
+            self._unfinished += 1
+
+        if self._waiting_getters:
+            with self._head_lock:
+                self._not_empty.notify()
+
+        return None
+
+    def get(self, block: bool = True,
+            timeout: typing.Union[float, NoneType] = None):
+        """Removes and returns the first item, waiting (if *block*, \
+for up to *timeout* seconds) for one in an empty queue, else raising
+`queue.Empty`
+"""
+
+        with self._head_lock:
+            if self._head._next is None:
+                if not block:
+                    raise _Empty
+
+                self._waiting_getters += 1
+
+                try:
+                    if not self._not_empty.wait_for(
+                        lambda: self._head._next is not None, timeout
+                    ):
+                        raise _Empty
+
+                finally:
+                    self._waiting_getters -= 1
+
+            node = self._head = self._head._next
+            item = node.data.args[0]
+            node.data = _EMPTY_DATA
+            self._gets += 1
+
+        if self._waiting_putters:
+            with self._tail_lock:
+                self._not_full.notify()
+
+        return item
+
+    def put_nowait(self, item) -> NoneType:
+        """Adds *item* at the end, or raises `queue.Full`"""
+
+        return self.put(item, False)
+
+    def get_nowait(self):
+        """Removes and returns the first item, or raises `queue.Empty`"""
+
+        return self.get(False)
+
+    def task_done(self) -> NoneType:
+        """Marks the processing of an item (one that was put) \
+as done, raising ValueError if every item already was
+"""
+
+        with self._all_tasks_done:
+            if not self._unfinished:
+                raise ValueError('task_done() called too many times')
+
+            self._unfinished -= 1
+
+            if not self._unfinished:
+                self._all_tasks_done.notify_all()
+
+        return None
+
+    def join(self) -> NoneType:
+        """Waits until every item that was put is marked done \
+(see `task_done`)
+"""
+
+        with self._all_tasks_done:
+            self._all_tasks_done.wait_for(lambda: not self._unfinished)
+
+        return None
+
+
+class Stack:
+    """Instantiates a thread-safe LIFO stack of up to *maxsize* items \
+(0 for no limit)
+
+Parameters
+    maxsize=0 (int) - The maximum number of items (0 for no limit)
+
+Example
+    stack = Stack()
+    stack.push(1)
+    stack.pop()  # blocks until an item is available
+
+Explanation
+    The items are Node objects, each linked to the one pushed before
+    it, from the top one. Both ends of a stack are the same, so a
+    single lock guards it, with a condition each for consumers of an
+    empty and producers of a full stack.
+"""
+
+    def __init__(self, maxsize: int = 0) -> NoneType:
+        self.maxsize = maxsize
+        self._top = None
+        self._length = 0
+        self._lock = _threading.Lock()
+        self._not_empty = _threading.Condition(self._lock)
+        self._not_full = _threading.Condition(self._lock)
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'<Stack of {len(self)} items>'
+
+    def __len__(self) -> int:
+        return self._length
+
+    def push(self, item, block: bool = True,
+             timeout: typing.Union[float, NoneType] = None) -> NoneType:
+        """Adds *item* on top, waiting (if *block*, for up to \
+*timeout* seconds) for a free slot in a full stack, else raising
+`queue.Full`
+"""
+
+        node = Node(Data(item))
+
+        with self._lock:
+            if self.maxsize and not self._not_full.wait_for(
+                lambda: self._length < self.maxsize,
+                timeout if block else 0
+            ):
+                raise _Full
+
+            node._next = self._top
+            self._top = node
+            self._length += 1
+            self._not_empty.notify()
+
+        return None
+
+    def pop(self, block: bool = True,
+            timeout: typing.Union[float, NoneType] = None):
+        """Removes and returns the top item, waiting (if *block*, for \
+up to *timeout* seconds) for one in an empty stack, else raising
+`queue.Empty`
+"""
+
+        with self._lock:
+            if not self._not_empty.wait_for(
+                lambda: self._top is not None, timeout if block else 0
+            ):
+                raise _Empty
+
+            node = self._top
+            self._top, node._next = node._next, None
+            self._length -= 1
+            self._not_full.notify()
+
+        return node.data.args[0]
+
+    def peek(self):
+        """Returns the top item (without removing it), or raises \
+`queue.Empty`
+"""
+
+        node = self._top
+
+        if node is None:
+            raise _Empty
+
+        return node.data.args[0]
+
+
+class _Ring:
+    """A growable ring buffer of items, in a list or (with a \
+*typecode*) an Array
+"""
+    __slots__ = ('_items', '_start', '_length', '_typecode')
+
+    def __init__(self, typecode: typing.Union[str, NoneType] = None,
+                 capacity: int = 16) -> NoneType:
+        self._typecode = typecode
+        self._items = self._buffer(max(capacity, 1))
+        self._start = self._length = 0
+
+    def _buffer(self, capacity: int):
+        if self._typecode is None:
+            return [None] * capacity
+
+        return Array(self._typecode, _repeat(0, capacity))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        items, capacity = self._items, len(self._items)
+
+        for offset in range(self._length):
+            yield items[(self._start + offset) % capacity]
+
+    def _grow(self) -> NoneType:
+        items = self._buffer(2 * len(self._items))
+
+        for index, item in enumerate(self):
+            items[index] = item
+
+        self._items, self._start = items, 0
+
+    def append(self, item) -> NoneType:
+        if self._length == len(self._items):
+            self._grow()
+
+        self._items[(self._start + self._length) % len(self._items)] = item
+        self._length += 1
+
+    def appendleft(self, item) -> NoneType:
+        if self._length == len(self._items):
+            self._grow()
+
+        self._start = (self._start - 1) % len(self._items)
+        self._items[self._start] = item
+        self._length += 1
+
+    def pop(self):
+        self._length -= 1
+        index = (self._start + self._length) % len(self._items)
+        item = self._items[index]
+
+        if self._typecode is None:
+            self._items[index] = None
+
+        return item
+
+    def popleft(self):
+        item = self._items[self._start]
+
+        if self._typecode is None:
+            self._items[self._start] = None
+
+        self._start = (self._start + 1) % len(self._items)
+        self._length -= 1
+
+        return item
+
+
+class Deque:
+    """Instantiates a thread-safe double-ended queue of up to \
+*maxsize* items (0 for no limit)
+
+Parameters
+    maxsize=0 (int) - The maximum number of items (0 for no limit)
+    typecode=None (str) - Stores the items in an Array of this
+        typecode, instead of a list
+
+Example
+    deque = Deque(1000, 'q')
+    deque.append(1)
+    deque.popleft()  # blocks until an item is available
+
+Explanation
+    The items are kept in a ring buffer: a list (or, for numbers, an
+    Array) used circularly from a start index, which doubles in size
+    when it is full (a bounded deque allocates *maxsize* slots once).
+    A single lock guards it, with a condition each for consumers of
+    an empty and producers of a full deque.
+"""
+
+    def __init__(self, maxsize: int = 0,
+                 typecode: typing.Union[str, NoneType] = None) -> NoneType:
+        self.maxsize = maxsize
+        self._ring = _Ring(typecode, maxsize or 16)
+        self._lock = _threading.Lock()
+        self._not_empty = _threading.Condition(self._lock)
+        self._not_full = _threading.Condition(self._lock)
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'<Deque of {len(self)} items>'
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def _put(self, item, left: bool, block: bool,
+             timeout: typing.Union[float, NoneType]) -> NoneType:
+        with self._lock:
+            if self.maxsize and not self._not_full.wait_for(
+                lambda: len(self._ring) < self.maxsize,
+                timeout if block else 0
+            ):
+                raise _Full
+
+            if left:
+                self._ring.appendleft(item)
+
+            else:
+                self._ring.append(item)
+
+            self._not_empty.notify()
+
+        return None
+
+    def _get(self, left: bool, block: bool,
+             timeout: typing.Union[float, NoneType]):
+        with self._lock:
+            if not self._not_empty.wait_for(
+                self._ring.__len__, timeout if block else 0
+            ):
+                raise _Empty
+
+            item = self._ring.popleft() if left else self._ring.pop()
+            self._not_full.notify()
+
+        return item
+
+    def append(self, item, block: bool = True,
+               timeout: typing.Union[float, NoneType] = None) -> NoneType:
+        """Adds *item* at the right end, waiting (if *block*, for up \
+to *timeout* seconds) for a free slot in a full deque, else raising
+`queue.Full`
+"""
+
+        return self._put(item, False, block, timeout)
+
+    def appendleft(self, item, block: bool = True,
+                   timeout: typing.Union[float, NoneType] = None
+                   ) -> NoneType:
+        """Adds *item* at the left end (see `append`)"""
+
+        return self._put(item, True, block, timeout)
+
+    def pop(self, block: bool = True,
+            timeout: typing.Union[float, NoneType] = None):
+        """Removes and returns the item at the right end, waiting (if \
+*block*, for up to *timeout* seconds) for one in an empty deque, else
+raising `queue.Empty`
+"""
+
+        return self._get(False, block, timeout)
+
+    def popleft(self, block: bool = True,
+                timeout: typing.Union[float, NoneType] = None):
+        """Removes and returns the item at the left end (see `pop`)"""
+
+        return self._get(True, block, timeout)
+
+
+class _AsyncContainer:
+    """The shared implementation of the asyncio containers: a ring \
+buffer, and the futures of the coroutines waiting for an item (or for
+a free slot)
+
+Like the `asyncio` queues, the containers are not thread-safe: use
+them from the coroutines of a single event loop
+"""
+
+    def __init__(self, maxsize: int = 0,
+                 typecode: typing.Union[str, NoneType] = None) -> NoneType:
+        self.maxsize = maxsize
+        self._ring = _Ring(typecode, maxsize or 16)
+        self._getters = _Deque()
+        self._putters = _Deque()
+        self._joiners = _Deque()
+        self._unfinished = 0
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} of {len(self)} items>'
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def qsize(self) -> int:
+        """Returns the number of items"""
+
+        return len(self._ring)
+
+    def empty(self) -> bool:
+        """Returns True if the container is empty"""
+
+        return not self._ring
+
+    def full(self) -> bool:
+        """Returns True if the container is full"""
+
+        return 0 < self.maxsize <= len(self._ring)
+
+    def task_done(self) -> NoneType:
+        """Marks the processing of an item (one that was put) \
+as done, raising ValueError if every item already was
+"""
+
+        if not self._unfinished:
+            raise ValueError('task_done() called too many times')
+
+        self._unfinished -= 1
+
+        if not self._unfinished:
+            while self._joiners:
+                future = self._joiners.popleft()
+
+                if not future.done():
+                    future.set_result(None)
+
+        return None
+
+    async def join(self) -> NoneType:
+        """Waits until every item that was put is marked done \
+(see `task_done`)
+"""
+
+        while self._unfinished:
+            await self._wait(self._joiners)
+
+        return None
+
+    @staticmethod
+    def _wake(waiters: _Deque) -> NoneType:
+        while waiters:
+            future = waiters.popleft()
+
+            if not future.done():
+                future.set_result(None)
+
+                break
+
+        return None
+
+    async def _wait(self, waiters: _Deque) -> NoneType:
+        import asyncio
+
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+
+        try:
+            await future
+
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Woken, but cancelled before running: wake another one
+                self._wake(waiters)
+
+            else:
+                future.cancel()
+
+                if future in waiters:
+                    waiters.remove(future)
+
+            raise
+
+        return None
+
+    def _put_nowait(self, item, left: bool) -> NoneType:
+        if self.full():
+            import asyncio
+
+            raise asyncio.QueueFull
+
+        if left:
+            self._ring.appendleft(item)
+
+        else:
+            self._ring.append(item)
+
+        self._unfinished += 1
+        self._wake(self._getters)
+
+        return None
+
+    def _get_nowait(self, left: bool):
+        if not self._ring:
+            import asyncio
+
+            raise asyncio.QueueEmpty
+
+        item = self._ring.popleft() if left else self._ring.pop()
+        self._wake(self._putters)
+
+        return item
+
+    async def _put(self, item, left: bool) -> NoneType:
+        while self.full():
+            await self._wait(self._putters)
+
+        return self._put_nowait(item, left)
+
+    async def _get(self, left: bool):
+        while not self._ring:
+            await self._wait(self._getters)
+
+        return self._get_nowait(left)
+
+
+class AsyncQueue(_AsyncContainer):
+    """Instantiates an asyncio FIFO queue of up to *maxsize* items \
+(0 for no limit)
+
+Parameters
+    maxsize=0 (int) - The maximum number of items (0 for no limit)
+    typecode=None (str) - Stores the items in an Array of this
+        typecode, instead of a list
+
+Example
+    queue = AsyncQueue()
+    await queue.put(1)
+    await queue.get()  # waits until an item is available
+
+Explanation
+    The coroutine counterpart of Queue (with the interface of
+    `asyncio.Queue`: `put`, `get`, their `_nowait` forms, which raise
+    `asyncio.QueueFull`/`asyncio.QueueEmpty`, `qsize`, `empty`,
+    `full`, `task_done` and `join`): the items are kept in a ring
+    buffer, and a coroutine that has to wait awaits a future that the
+    next coroutine to change the queue resolves. AsyncStack and
+    AsyncDeque share all but `put` and `get`.
+"""
+
+    async def put(self, item) -> NoneType:
+        """Adds *item* at the end, waiting for a free slot if full"""
+
+        return await self._put(item, False)
+
+    async def get(self):
+        """Removes and returns the first item, waiting for one if empty"""
+
+        return await self._get(True)
+
+    def put_nowait(self, item) -> NoneType:
+        """Adds *item* at the end, or raises `asyncio.QueueFull`"""
+
+        return self._put_nowait(item, False)
+
+    def get_nowait(self):
+        """Removes and returns the first item, or raises \
+`asyncio.QueueEmpty`
+"""
+
+        return self._get_nowait(True)
+
+
+class AsyncStack(_AsyncContainer):
+    """Instantiates an asyncio LIFO stack of up to *maxsize* items \
+(0 for no limit), the coroutine counterpart of Stack (see AsyncQueue)
+"""
+
+    async def push(self, item) -> NoneType:
+        """Adds *item* on top, waiting for a free slot if full"""
+
+        return await self._put(item, False)
+
+    async def pop(self):
+        """Removes and returns the top item, waiting for one if empty"""
+
+        return await self._get(False)
+
+    def push_nowait(self, item) -> NoneType:
+        """Adds *item* on top, or raises `asyncio.QueueFull`"""
+
+        return self._put_nowait(item, False)
+
+    def pop_nowait(self):
+        """Removes and returns the top item, or raises \
+`asyncio.QueueEmpty`
+"""
+
+        return self._get_nowait(False)
+
+
+class AsyncDeque(_AsyncContainer):
+    """Instantiates an asyncio double-ended queue of up to *maxsize* \
+items (0 for no limit), the coroutine counterpart of Deque (see
+AsyncQueue)
+"""
+
+    async def append(self, item) -> NoneType:
+        """Adds *item* at the right end, waiting for a free slot if full"""
+
+        return await self._put(item, False)
+
+    async def appendleft(self, item) -> NoneType:
+        """Adds *item* at the left end, waiting for a free slot if full"""
+
+        return await self._put(item, True)
+
+    async def pop(self):
+        """Removes and returns the item at the right end, waiting for \
+one if empty
+"""
+
+        return await self._get(False)
+
+    async def popleft(self):
+        """Removes and returns the item at the left end, waiting for \
+one if empty
+"""
+
+        return await self._get(True)
+
+
+class _Leaf:
+    """A leaf of a B+ tree: sorted keys (and their values, for a map), \
+linked to the leaves before and after it
+"""
+
+    __slots__ = ('keys', 'values', 'previous', 'next_')
+
+    def __init__(self, keys: list,
+                 values: typing.Union[list, NoneType] = None) -> NoneType:
+        self.keys = keys
+        self.values = values
+        self.previous = None
+        self.next_ = None
+
+        return None
+
+
+class _Branch:
+    """An inner node of a B+ tree: its children, the keys separating \
+them and the no. of keys under every child
+"""
+
+    __slots__ = ('keys', 'children', 'counts')
+
+    def __init__(self, keys: list, children: list, counts: list) -> NoneType:
+        self.keys = keys
+        self.children = children
+        self.counts = counts
+
+        return None
+
+
+def _node_size(node: typing.Union[_Leaf, _Branch]) -> int:
+    """Returns the no. of keys of a leaf, or of children of a branch"""
+
+    return len(node.keys if type(node) is _Leaf else node.children)
+
+
+def _even_groups(length: int, size: int) -> typing.Iterator[
+    typing.Tuple[int, int]
+]:
+    """Yields (start, end) ranges splitting *length* items into as few \
+groups of at most *size* items as possible, of (almost) equal sizes
+"""
+
+    groups = -(-length // size)
+    small, large = divmod(length, groups)
+    start = 0
+
+    for group in range(groups):
+        end = start + small + (group < large)
+
+        yield start, end
+
+        start = end
+
+
+class _BTree:
+    """The shared implementation of BTreeMap and BTreeSet
+
+Subclasses set `_keeps_values`, which decides whether the leaves keep
+a list of values next to their keys
+"""
+
+    __slots__ = ('_root', '_first', '_last', '_fanout', '_length')
+
+    _keeps_values = False
+
+    def __init__(self, fanout: int = 128) -> NoneType:
+        if not isinstance(fanout, int) or fanout < 4:
+            raise ValueError("'fanout' must be an integer of at least 4")
+
+        self._fanout = fanout
+        self.clear()
+
+        return None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __iter__(self):
+        return _chain.from_iterable(leaf.keys for leaf in self._leaves())
+
+    def __reversed__(self):
+        leaf = self._last
+
+        while leaf is not None:
+            yield from reversed(leaf.keys)
+            leaf = leaf.previous
+
+    def __contains__(self, key) -> bool:
+        keys = self._leaf(key).keys
+        index = _bisect_left(keys, key)
+
+        return index < len(keys) and keys[index] == key
+
+    def __eq__(self, tree) -> bool:
+        if type(tree) is type(self):
+            return (
+                len(self) == len(tree)
+                and list(self._items()) == list(tree._items())
+            )
+
+        return False
+
+    def _leaves(self) -> typing.Iterator[_Leaf]:
+        """Yields the leaves, from the first one to the last one"""
+
+        leaf = self._first
+
+        while leaf is not None:
+            yield leaf
+            leaf = leaf.next_
+
+    def _items(self) -> typing.Iterator:
+        """Yields the keys, or the (key, value) pairs of a map, in order"""
+
+        if not self._keeps_values:
+            return iter(self)
+
+        return _chain.from_iterable(
+            zip(leaf.keys, leaf.values) for leaf in self._leaves()
+        )
+
+    def _leaf(self, key) -> _Leaf:
+        """Returns the leaf where *key* is (or would be)"""
+
+        node = self._root
+
+        while type(node) is _Branch:
+            node = node.children[_bisect_right(node.keys, key)]
+
+        return node
+
+    def _path(self, key) -> typing.Tuple[
+        _Leaf, typing.List[typing.Tuple[_Branch, int]]
+    ]:
+        """Returns the leaf where *key* is (or would be) and the \
+(branch, child index) pairs on the way to it, from the root
+"""
+
+        node, path = self._root, []
+
+        while type(node) is _Branch:
+            index = _bisect_right(node.keys, key)
+            path.append((node, index))
+            node = node.children[index]
+
+        return node, path
+
+    def _insert(self, key, value) -> bool:
+        """Inserts *key* (with *value*, for a map) or replaces its value, \
+returning True if the key is new
+"""
+
+        leaf, path = self._path(key)
+        keys = leaf.keys
+        index = _bisect_left(keys, key)
+
+        if index < len(keys) and keys[index] == key:
+            if leaf.values is not None:
+                leaf.values[index] = value
+
+            return False
+
+        keys.insert(index, key)
+
+        if leaf.values is not None:
+            leaf.values.insert(index, value)
+
+        self._length += 1
+
+        for branch, child in path:
+            branch.counts[child] += 1
+
+        if len(keys) > self._fanout:
+            self._split(leaf, path)
+
+        return True
+
+    def _split(self, node: typing.Union[_Leaf, _Branch],
+               path: list) -> NoneType:
+        """Splits the overfull *node* in two halves, then its ancestors \
+on *path* as long as they overflow too
+"""
+
+        fanout = self._fanout
+
+        while True:
+            if type(node) is _Leaf:
+                if len(node.keys) <= fanout:
+                    return None
+
+                half = len(node.keys) // 2
+                right = _Leaf(
+                    node.keys[half:],
+                    None if node.values is None else node.values[half:]
+                )
+                del node.keys[half:]
+
+                if node.values is not None:
+                    del node.values[half:]
+
+                right.previous, right.next_ = node, node.next_
+
+                if node.next_ is None:
+                    self._last = right
+
+                else:
+                    node.next_.previous = right
+
+                node.next_ = right
+                separator = right.keys[0]
+                sizes = [len(node.keys), len(right.keys)]
+
+            else:
+                if len(node.children) <= fanout:
+                    return None
+
+                half = len(node.children) // 2
+                right = _Branch(
+                    node.keys[half:], node.children[half:],
+                    node.counts[half:]
+                )
+                separator = node.keys[half - 1]
+                del node.keys[half - 1:]
+                del node.children[half:]
+                del node.counts[half:]
+                sizes = [sum(node.counts), sum(right.counts)]
+
+            if not path:
+                self._root = _Branch([separator], [node, right], sizes)
+
+                return None
+
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, right)
+            parent.counts[index:index + 1] = sizes
+            node = parent
+
+    def _delete(self, key):
+        """Removes *key*, returning its value (None for a set), or \
+raises KeyError
+"""
+
+        leaf, path = self._path(key)
+        keys = leaf.keys
+        index = _bisect_left(keys, key)
+
+        if index == len(keys) or keys[index] != key:
+            raise KeyError(key)
+
+        del keys[index]
+        value = None if leaf.values is None else leaf.values.pop(index)
+        self._length -= 1
+
+        for branch, child in path:
+            branch.counts[child] -= 1
+
+        self._rebalance(leaf, path)
+
+        return value
+
+    def _rebalance(self, node: typing.Union[_Leaf, _Branch],
+                   path: list) -> NoneType:
+        """Refills the underfull *node* from a sibling (or merges it \
+with one), then its ancestors on *path* as long as they underflow too
+"""
+
+        minimum = self._fanout // 2
+
+        while path:
+            if _node_size(node) >= minimum:
+                return None
+
+            parent, index = path.pop()
+            siblings = parent.children
+
+            if (
+                index + 1 < len(siblings)
+                and _node_size(siblings[index + 1]) > minimum
+            ):
+                self._shift_left(parent, index)
+
+            elif index and _node_size(siblings[index - 1]) > minimum:
+                self._shift_right(parent, index - 1)
+
+            elif index + 1 < len(siblings):
+                self._merge(parent, index)
+
+            else:
+                self._merge(parent, index - 1)
+
+            node = parent
+
+        while type(self._root) is _Branch and len(self._root.children) == 1:
+            self._root = self._root.children[0]
+
+        return None
+
+    def _shift_left(self, parent: _Branch, index: int) -> NoneType:
+        """Moves the first entry of child *index* + 1 of *parent* \
+to the end of child *index*
+"""
+
+        left, right = parent.children[index], parent.children[index + 1]
+
+        if type(left) is _Leaf:
+            left.keys.append(right.keys.pop(0))
+
+            if left.values is not None:
+                left.values.append(right.values.pop(0))
+
+            parent.keys[index] = right.keys[0]
+            moved = 1
+
+        else:
+            left.keys.append(parent.keys[index])
+            parent.keys[index] = right.keys.pop(0)
+            left.children.append(right.children.pop(0))
+            moved = right.counts.pop(0)
+            left.counts.append(moved)
+
+        parent.counts[index] += moved
+        parent.counts[index + 1] -= moved
+
+        return None
+
+    def _shift_right(self, parent: _Branch, index: int) -> NoneType:
+        """Moves the last entry of child *index* of *parent* \
+to the front of child *index* + 1
+"""
+
+        left, right = parent.children[index], parent.children[index + 1]
+
+        if type(left) is _Leaf:
+            right.keys.insert(0, left.keys.pop())
+
+            if left.values is not None:
+                right.values.insert(0, left.values.pop())
+
+            parent.keys[index] = right.keys[0]
+            moved = 1
+
+        else:
+            right.keys.insert(0, parent.keys[index])
+            parent.keys[index] = left.keys.pop()
+            right.children.insert(0, left.children.pop())
+            moved = left.counts.pop()
+            right.counts.insert(0, moved)
+
+        parent.counts[index] -= moved
+        parent.counts[index + 1] += moved
+
+        return None
+
+    def _merge(self, parent: _Branch, index: int) -> NoneType:
+        """Merges child *index* + 1 of *parent* into child *index*"""
+
+        left, right = parent.children[index], parent.children[index + 1]
+
+        if type(left) is _Leaf:
+            left.keys.extend(right.keys)
+
+            if left.values is not None:
+                left.values.extend(right.values)
+
+            left.next_ = right.next_
+
+            if right.next_ is None:
+                self._last = left
+
+            else:
+                right.next_.previous = left
+
+        else:
+            left.keys.append(parent.keys[index])
+            left.keys.extend(right.keys)
+            left.children.extend(right.children)
+            left.counts.extend(right.counts)
+
+        del parent.keys[index]
+        del parent.children[index + 1]
+        parent.counts[index] += parent.counts.pop(index + 1)
+
+        return None
+
+    def _build(self, keys: list,
+               values: typing.Union[list, NoneType]) -> NoneType:
+        """Replaces the contents with the sorted, distinct *keys* (and \
+*values*), building full levels bottom-up, in O(n) (with the garbage
+collector paused)
+"""
+
+        self.clear()
+
+        if not keys:
+            return None
+
+        fanout = self._fanout
+        level, counts, lows = [], [], []
+
+        with _gc_paused():
+            for start, end in _even_groups(len(keys), fanout):
+                leaf = _Leaf(
+                    keys[start:end],
+                    None if values is None else values[start:end]
+                )
+
+                if level:
+                    leaf.previous = level[-1]
+                    level[-1].next_ = leaf
+
+                level.append(leaf)
+                counts.append(end - start)
+                lows.append(keys[start])
+
+            self._first, self._last = level[0], level[-1]
+
+            while len(level) > 1:
+                branches, branch_counts, branch_lows = [], [], []
+
+                for start, end in _even_groups(len(level), fanout):
+                    branches.append(_Branch(
+                        lows[start + 1:end], level[start:end],
+                        counts[start:end]
+                    ))
+                    branch_counts.append(sum(counts[start:end]))
+                    branch_lows.append(lows[start])
+
+                level, counts, lows = branches, branch_counts, branch_lows
+
+        self._root = level[0]
+        self._length = len(keys)
+
+        return None
+
+    def _check_sorted(self, keys: list) -> NoneType:
+        """Raises ValueError unless *keys* are strictly increasing"""
+
+        if any(map(_operator.ge, keys, _islice(keys, 1, None))):
+            raise ValueError("keys must be sorted and distinct")
+
+        return None
+
+    def _slices(self, start, stop, reverse: bool) -> typing.Iterator[
+        typing.Tuple[_Leaf, int, int]
+    ]:
+        """Yields (leaf, begin, end) for the runs of keys in \
+[*start*, *stop*) of every leaf, in order (or in reverse order)
+"""
+
+        if not reverse:
+            leaf = self._first if start is None else self._leaf(start)
+            begin = 0 if start is None else _bisect_left(leaf.keys, start)
+
+            while leaf is not None:
+                keys = leaf.keys
+                end = len(keys) if stop is None else _bisect_left(keys, stop)
+
+                if begin < end:
+                    yield leaf, begin, end
+
+                if end < len(keys):
+                    return None
+
+                leaf, begin = leaf.next_, 0
+
+            return None
+
+        leaf = self._last if stop is None else self._leaf(stop)
+        end = len(leaf.keys) if stop is None else _bisect_left(
+            leaf.keys, stop
+        )
+
+        while leaf is not None:
+            begin = 0 if start is None else _bisect_left(leaf.keys, start)
+
+            if begin < end:
+                yield leaf, begin, end
+
+            if begin:
+                return None
+
+            leaf = leaf.previous
+            end = 0 if leaf is None else len(leaf.keys)
+
+        return None
+
+    @property
+    def fanout(self) -> int:
+        """The maximum no. of keys in a leaf (and of children \
+of a branch)
+"""
+
+        return self._fanout
+
+    def clear(self) -> NoneType:
+        """Removes all the keys"""
+
+        self._root = self._first = self._last = _Leaf(
+            [], [] if self._keeps_values else None
+        )
+        self._length = 0
+
+        return None
+
+    def irange(self, start = None, stop = None,
+               reverse: bool = False) -> typing.Iterator:
+        """Yields the keys from *start* (included) to *stop* \
+(excluded), in order (or in reverse order), leaf by leaf
+
+None leaves a side open. The keys are found in O(log n), then read
+lazily along the linked leaves; do not change the tree meanwhile.
+"""
+
+        for leaf, begin, end in self._slices(start, stop, reverse):
+            keys = leaf.keys[begin:end]
+
+            yield from reversed(keys) if reverse else keys
+
+    def rank(self, key) -> int:
+        """Returns the no. of keys less than *key*, in O(log n)"""
+
+        node, rank = self._root, 0
+
+        while type(node) is _Branch:
+            index = _bisect_right(node.keys, key)
+            rank += sum(node.counts[:index])
+            node = node.children[index]
+
+        return rank + _bisect_left(node.keys, key)
+
+    def _select(self, index: int) -> typing.Tuple[_Leaf, int]:
+        """Returns the leaf of the key at *index* (in sorted order) \
+and its position in the leaf
+"""
+
+        if not isinstance(index, int):
+            raise TypeError(f"'{index}' must be of type 'int'")
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError(f'{type(self).__name__} index out of range')
+
+        node = self._root
+
+        while type(node) is _Branch:
+            for child, count in enumerate(node.counts):
+                if index < count:
+                    break
+
+                index -= count
+
+            node = node.children[child]
+
+        return node, index
+
+    def select(self, index: int):
+        """Returns the key at *index* in sorted order (negative indices \
+count from the end), in O(log n)
+"""
+
+        leaf, index = self._select(index)
+
+        return leaf.keys[index]
+
+
+class BTreeMap(_BTree):
+    """Instantiates an ordered map kept in a B+ tree
+
+Parameters
+    items=() (dict|iterable) - A mapping or (key, value) pairs
+    fanout=128 (int) - The maximum no. of keys in a leaf and of
+    children of a branch
+
+Example
+    bmap = BTreeMap({3: 'c', 1: 'a'})
+    bmap[2] = 'b'
+    list(bmap.items(1, 3))  # [(1, 'a'), (2, 'b')]
+    bmap.rank(3), bmap.select(0)  # 2, 1
+
+Explanation
+    A B+ tree keeps all the keys (and their values) in leaves of
+    between *fanout* / 2 and *fanout* sorted keys, linked to each
+    other like node objects (by `previous` and `next_`), under
+    branches of between *fanout* / 2 and *fanout* children, which
+    hold the keys separating their children and the no. of keys
+    under each of them. All the leaves are at the same depth, so
+    finding, inserting or removing a key takes O(log n) steps, each
+    a binary search (bisect) in a short list.
+
+    A full leaf or branch is split in two halves, and one left less
+    than half full borrows an entry from a sibling or is merged with
+    it. Range scans find their first key in O(log n), then read the
+    linked leaves lazily; the counts answer `rank` (the position of a
+    key) and `select` (the key at a position) in O(log n) too.
+
+    `from_sorted` builds the tree from sorted items bottom-up in O(n),
+    instead of inserting them one by one. Keys must be comparable
+    with each other (and must not change while in the map).
+"""
+
+    __slots__ = ()
+
+    _keeps_values = True
+
+    def __init__(self, items: typing.Union[dict, typing.Iterable] = (),
+                 fanout: int = 128) -> NoneType:
+        super().__init__(fanout)
+
+        if items:
+            items = sorted(
+                dict(items).items(), key=_operator.itemgetter(0)
+            )
+            self._build(
+                [key for key, _ in items], [value for _, value in items]
+            )
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'BTreeMap({dict(self.items())})'
+
+    def __getitem__(self, key):
+        leaf = self._leaf(key)
+        keys = leaf.keys
+        index = _bisect_left(keys, key)
+
+        if index < len(keys) and keys[index] == key:
+            return leaf.values[index]
+
+        raise KeyError(key)
+
+    def __setitem__(self, key, value) -> NoneType:
+        self._insert(key, value)
+
+        return None
+
+    def __delitem__(self, key) -> NoneType:
+        self._delete(key)
+
+        return None
+
+    @classmethod
+    def from_sorted(cls, items: typing.Iterable,
+                    fanout: int = 128) -> BTreeMap:
+        """Returns a new BTreeMap of the (key, value) pairs in *items*, \
+sorted by strictly increasing keys, built in O(n)
+"""
+
+        keys, values = [], []
+
+        for key, value in items:
+            keys.append(key)
+            values.append(value)
+
+        bmap = cls(fanout=fanout)
+        bmap._check_sorted(keys)
+        bmap._build(keys, values)
+
+        return bmap
+
+    def get(self, key, default = None):
+        """Returns the value of *key*, or *default* if it is missing"""
+
+        leaf = self._leaf(key)
+        keys = leaf.keys
+        index = _bisect_left(keys, key)
+
+        if index < len(keys) and keys[index] == key:
+            return leaf.values[index]
+
+        return default
+
+    def pop(self, key, default = _MISSING):
+        """Removes *key* and returns its value, or *default* if it is \
+missing (raising KeyError without a default)
+"""
+
+        try:
+            return self._delete(key)
+
+        except KeyError:
+            if default is _MISSING:
+                raise
+
+            return default
+
+    def update(self, items: typing.Union[dict, typing.Iterable]) -> NoneType:
+        """Inserts (or replaces) the (key, value) pairs of *items*"""
+
+        if isinstance(items, dict):
+            items = items.items()
+
+        for key, value in items:
+            self._insert(key, value)
+
+        return None
+
+    def keys(self, start = None, stop = None,
+             reverse: bool = False) -> typing.Iterator:
+        """Yields the keys from *start* (included) to *stop* (excluded), \
+lazily (see `irange`)
+"""
+
+        return self.irange(start, stop, reverse)
+
+    def values(self, start = None, stop = None,
+               reverse: bool = False) -> typing.Iterator:
+        """Yields the values of the keys from *start* (included) to \
+*stop* (excluded), lazily (see `irange`)
+"""
+
+        for leaf, begin, end in self._slices(start, stop, reverse):
+            values = leaf.values[begin:end]
+
+            yield from reversed(values) if reverse else values
+
+    def items(self, start = None, stop = None,
+              reverse: bool = False) -> typing.Iterator:
+        """Yields the (key, value) pairs of the keys from *start* \
+(included) to *stop* (excluded), lazily (see `irange`)
+"""
+
+        for leaf, begin, end in self._slices(start, stop, reverse):
+            items = list(zip(
+                leaf.keys[begin:end], leaf.values[begin:end]
+            ))
+
+            yield from reversed(items) if reverse else items
+
+    def peekitem(self, index: int = -1) -> tuple:
+        """Returns the (key, value) pair at *index* in sorted order \
+(the last one by default), in O(log n)
+"""
+
+        leaf, index = self._select(index)
+
+        return leaf.keys[index], leaf.values[index]
+
+
+class BTreeSet(_BTree):
+    """Instantiates an ordered set kept in a B+ tree
+
+Parameters
+    items=() (iterable) - The keys
+    fanout=128 (int) - The maximum no. of keys in a leaf and of
+    children of a branch
+
+Example
+    bset = BTreeSet([5, 1, 3])
+    bset.add(4)
+    list(bset.irange(2, 5))  # [3, 4]
+
+Explanation
+    A BTreeSet is a BTreeMap without values (its leaves only keep
+    keys), see BTreeMap.
+"""
+
+    __slots__ = ()
+
+    def __init__(self, items: typing.Iterable = (),
+                 fanout: int = 128) -> NoneType:
+        super().__init__(fanout)
+
+        if items:
+            self._build(sorted(set(items)), None)
+
+        return None
+
+    def __repr__(self) -> str:
+        return f'BTreeSet({list(self)})'
+
+    @classmethod
+    def from_sorted(cls, items: typing.Iterable,
+                    fanout: int = 128) -> BTreeSet:
+        """Returns a new BTreeSet of the strictly increasing keys \
+in *items*, built in O(n)
+"""
+
+        keys = list(items)
+        bset = cls(fanout=fanout)
+        bset._check_sorted(keys)
+        bset._build(keys, None)
+
+        return bset
+
+    def add(self, key) -> NoneType:
+        """Adds *key*, in O(log n)"""
+
+        self._insert(key, None)
+
+        return None
+
+    def discard(self, key) -> NoneType:
+        """Removes *key* if it is in the set, in O(log n)"""
+
+        try:
+            self._delete(key)
+
+        except KeyError:
+            pass
+
+        return None
+
+    def remove(self, key) -> NoneType:
+        """Removes *key*, or raises KeyError if it is missing"""
+
+        self._delete(key)
+
         return None
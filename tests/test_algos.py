@@ -1 +1,229 @@
+import random
+
 import dsalgos.algos
+import dsalgos.dstructs
+
+
+def test_sort():
+    Array = dsalgos.dstructs.Array
+    use_numpy = Array.use_numpy
+    
+    try:
+        for Array.use_numpy in (False, True):
+            for typecode in 'bBhHiIlLqQfd':
+                if typecode in 'fd':
+                    items = [random.uniform(-1e9, 1e9) for _ in range(500)]
+                    items += [0.0, -0.0, float('inf'), float('-inf')]
+                
+                elif typecode in 'bhilq':
+                    items = [random.randint(-100, 100) for _ in range(500)]
+                
+                else:
+                    items = [random.randint(0, 200) for _ in range(500)]
+                
+                array = Array(typecode, items)
+                items = list(array)
+                
+                assert (
+                    list(dsalgos.algos.sort(array)) == sorted(items)
+                    and list(dsalgos.algos.sort(array, reverse=True))
+                    == sorted(items, reverse=True)
+                    and list(dsalgos.algos.radix_sort(array)) == sorted(items)
+                    and list(dsalgos.algos.radix_sort(array, 'msd'))
+                    == sorted(items)
+                ), f"'{typecode}' Arrays must be sorted"
+                
+                assert (
+                    type(dsalgos.algos.sort(array)) is Array
+                    and array == Array(typecode, items)
+                ), "Sorting an Array must return a new Array"
+    
+    finally:
+        Array.use_numpy = use_numpy
+    
+    assert (
+        dsalgos.algos.counting_sort(Array('q', [3, -1, 3, 2**40]))
+        == Array('q', [-1, 3, 3, 2**40])
+    ), "'counting_sort' must handle any integer Array"
+    
+    assert (
+        dsalgos.algos.sort([3, 1, 2], key=lambda item: -item) == [3, 2, 1]
+    ), "Other sequences must be sorted with 'sorted'"
+
+
+def test_linked_list_merge_sort():
+    values = [random.randrange(50) for _ in range(1000)]
+    head = dsalgos.dstructs.Node()
+    sllist = dsalgos.dstructs.SinglyLinkedList.from_iterable(values, head)
+    nodes = list(sllist)
+    
+    assert (
+        dsalgos.algos.sort(sllist) is sllist
+        and [node.data[0] for node in sllist] == sorted(values)
+    ), "'SinglyLinkedList' objects must be sorted in place"
+    
+    assert (
+        sorted(map(id, sllist)) == sorted(map(id, nodes))
+    ), "Sorting must relink the same nodes"
+    
+    assert (
+        head.next_ is sllist[0] and sllist[0].previous is head
+        and sllist[-1].next_ is None
+        and all(
+            sllist[i].next_ is sllist[i+1]
+            and sllist[i+1].previous is sllist[i]
+            for i in range(len(sllist) - 1)
+        )
+    ), "The links must follow the sorted order"
+    
+    dsalgos.algos.linked_list_merge_sort(
+        sllist, key=lambda node: node.data[0] % 7, reverse=True
+    )
+    
+    assert (
+        [node.data[0] for node in sllist]
+        == sorted(sorted(values), key=lambda value: value % 7, reverse=True)
+    ), "'key' and 'reverse' must work like 'sorted' (stably)"
+    
+    calls = []
+    dsalgos.algos.linked_list_merge_sort(
+        sllist, key=lambda node: calls.append(node) or node.data[0]
+    )
+    
+    assert (
+        len(calls) == len(values)
+    ), "'key' must be called once per node object"
+
+
+def test_external_sort(tmp_path):
+    Array = dsalgos.dstructs.Array
+    items = [random.randrange(-10**6, 10**6) for _ in range(5000)]
+    Array('q', items).save(tmp_path / 'source.bin')
+    
+    dsalgos.algos.external_sort(
+        tmp_path / 'source.bin', tmp_path / 'sorted.bin',
+        memory=8 * 200, fanin=4, tempdir=tmp_path
+    )
+    
+    with Array.open_mmap(tmp_path / 'sorted.bin') as values:
+        assert (
+            values.tolist() == sorted(items)
+        ), "'external_sort' must write the sorted items (multi-pass merge)"
+    
+    dsalgos.algos.external_sort(
+        tmp_path / 'source.bin', tmp_path / 'parallel.bin',
+        memory=8 * 2000, processes=2
+    )
+    
+    assert (
+        list(Array.load(tmp_path / 'parallel.bin')) == sorted(items)
+    ), "'external_sort' must sort runs in worker processes"
+    
+    dsalgos.algos.external_sort(
+        tmp_path / 'source.bin', tmp_path / 'sorted.bin', memory=8 * 2000
+    )
+    
+    assert (
+        list(Array.load(tmp_path / 'sorted.bin')) == sorted(items)
+        and sorted(path.name for path in tmp_path.glob('*.bin'))
+        == ['parallel.bin', 'sorted.bin', 'source.bin']
+    ), "'external_sort' must overwrite an existing destination"
+
+
+def test_search_and_select():
+    Array = dsalgos.dstructs.Array
+    items = sorted(random.randrange(-50, 50) for _ in range(500))
+    array = Array('q', items)
+    
+    for value in range(-55, 55, 3):
+        assert (
+            dsalgos.algos.exponential_search(array, value, 100)
+            == dsalgos.algos.lower_bound(array, value, 100)
+        ), "'exponential_search' must agree with 'lower_bound'"
+        assert (
+            dsalgos.algos.exponential_search(array, value, side='right')
+            == dsalgos.algos.upper_bound(array, value)
+        ), "'exponential_search' must agree with 'upper_bound'"
+    
+    queries = [random.randrange(-60, 60) for _ in range(200)]
+    
+    for Array.use_numpy in (False, True):
+        assert (
+            list(dsalgos.algos.batch_search(array, queries, 'right'))
+            == [dsalgos.algos.upper_bound(items, value) for value in queries]
+        ), "'batch_search' must answer every query (in the given order)"
+        assert (
+            list(dsalgos.algos.batch_search(array, queries))
+            == [dsalgos.algos.lower_bound(items, value) for value in queries]
+        ), "'batch_search' must answer every query (in the given order)"
+    
+    for select in (dsalgos.algos.introselect, dsalgos.algos.median_of_medians):
+        values = Array('q', random.sample(items, len(items)))
+        
+        assert (
+            select(values, 321) == items[321]
+            and max(values[:321]) <= values[321] <= min(values[321:])
+        ), f"'{select.__name__}' must partition around the k-th item"
+
+
+def test_Graph():
+    Node = dsalgos.dstructs.Node
+    Graph = dsalgos.algos.Graph
+    edges = [(0, 1, 4.0), (0, 2, 1.0), (2, 1, 2.0), (1, 3, 1.0), (4, 5, 1.0)]
+    
+    for dsalgos.dstructs.Array.use_numpy in (False, True):
+        graph = Graph.from_edges(edges)
+        
+        assert (
+            len(graph) == 6 and list(graph.neighbors(0)) == [1, 2]
+            and list(graph.edge_weights(2)) == [2.0]
+        ), "'Graph.from_edges' must bucket the edges by source, in order"
+        assert (
+            list(dsalgos.algos.breadth_first_search(graph, 0))
+            == [0, 1, 1, 2, -1, -1]
+        ), "'breadth_first_search' must count edges on shortest paths"
+        for heap in ('binary', 'dary', 'pairing'):
+            assert (
+                list(dsalgos.algos.dijkstra(graph, 0, heap))
+                == [0.0, 3.0, 1.0, 4.0, float('inf'), float('inf')]
+            ), f"'dijkstra' must find the lightest paths ({heap} heap)"
+        assert (
+            list(dsalgos.algos.topological_sort(graph)) == [0, 4, 2, 5, 1, 3]
+        ), "'topological_sort' must order every edge's source first"
+        assert (
+            list(dsalgos.algos.connected_components(graph))
+            == [0, 0, 0, 0, 1, 1]
+        ), "'connected_components' must label (weakly) connected vertices"
+        
+        ranks = dsalgos.algos.pagerank(graph)
+        
+        assert (
+            abs(sum(ranks) - 1.0) < 1e-9 and ranks[3] == max(ranks)
+        ), "'pagerank' must distribute a total rank of 1"
+        
+        for sources, targets, count in (
+            ([0, -1], [1, 0], None), ([0, 1], [1, 2], 2), ([0], [5], 3)
+        ):
+            try:
+                Graph.from_arrays(sources, targets, count=count)
+            except ValueError:
+                pass
+            else:
+                assert False, "'Graph.from_arrays' must reject bad vertices"
+    
+    try:
+        dsalgos.algos.topological_sort(Graph.from_edges([(0, 1), (1, 0)]))
+    except ValueError:
+        pass
+    else:
+        assert False, "'topological_sort' must reject cycles"
+    
+    root = Node()
+    child = Node(parent=root)
+    Node(parent=child)
+    Node(parent=root)
+    tree = Graph.from_node(root, directed=False)
+    
+    assert (
+        tree.nodes[1] is child and list(tree.neighbors(1)) == [2, 0]
+    ), "'Graph.from_node' must number node objects in pre-order"
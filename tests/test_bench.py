@@ -0,0 +1,56 @@
+import json
+
+import dsalgos.bench
+import dsalgos.bench.__main__
+import dsalgos.dstructs
+
+
+def test_instrument():
+    Node = dsalgos.dstructs.Node
+    nodes = [Node() for _ in range(10)]
+    
+    with dsalgos.bench.instrument() as counts:
+        for previous, next_ in zip(nodes, nodes[1:]):
+            previous.next_ = next_
+        
+        Node() == Node()
+    
+    assert (
+        counts['Node.next_='] == 9 and counts['Node()'] == 2
+        and counts['Node.__eq__'] == 1
+    ), "'instrument' must count setter, '__init__' and '__eq__' calls"
+    
+    nodes[0].next_ = nodes[2]
+    
+    assert (
+        counts['Node.next_='] == 9 and 'next_' in vars(Node)
+        and vars(Node)['next_'].fset.__name__ == 'next_'
+    ), "'instrument' must restore the classes afterwards"
+
+
+def test_run(tmp_path):
+    results = dsalgos.bench.run([10, 20], 'Node.*', repeat=1, counts=True)
+    
+    assert (
+        {result['case'] for result in results}
+        == {'Node.next_', 'Node.parent', 'Node.preorder', 'Node.depth'}
+        and all(
+            result['seconds'] > 0 and result['peak_bytes'] > 0
+            for result in results
+        )
+        and results[0]['counts']['Node.next_='] == 9 / 10
+    ), "'run' must measure every matching case at every size"
+    
+    path = str(tmp_path / 'results.json')
+    dsalgos.bench.__main__.main(
+        ['-s', '10', '-k', 'Deque', '-r', '1', '--json', path]
+    )
+    
+    with open(path) as file:
+        results = json.load(file)['results']
+    
+    assert (
+        [(result['case'], result['size']) for result in results]
+        == [('Deque', 10)]
+        and dsalgos.bench.compare(results, results)[0]['ratio'] == 1.0
+    ), "The command line interface must write (comparable) JSON results"
@@ -1,3 +1,8 @@
+import io
+import random
+import sys
+import tracemalloc
+
 import dsalgos.dstructs
 
 
@@ -79,3 +84,1038 @@ def test_Data():
         },
         "'Data(0, ..., 4, 5=5, ..., 9=9)' must have `{0: 0, ..., 4: 4, '5': 5, ..., '9': 9}` as 'data'"
     )
+
+
+def test_Data_cache():
+    data = dsalgos.dstructs.Data(1, 2, a=3)
+    
+    assert data.data is data.data, "'Data.data' must be cached"
+    
+    assert not hasattr(data, '__dict__'), "'Data' must use '__slots__'"
+    
+    assert (
+        hash(data) == hash(dsalgos.dstructs.Data(1, 2, a=3))
+    ), "Equal 'Data' objects must have equal hashes"
+    
+    data['b'] = 4
+    
+    assert (
+        data.data == {0: 1, 1: 2, 'a': 3, 'b': 4}
+    ), "'Data.__setitem__' must update the cached 'data'"
+    
+    view = data.data
+    data += dsalgos.dstructs.Data(5, c=6)
+    
+    assert (
+        data.data == {0: 1, 1: 2, 2: 5, 'a': 3, 'b': 4, 'c': 6}
+        and data.data is not view
+    ), "'Data.__iadd__' must return the Data and refresh 'data'"
+    
+    assert (
+        (data + dsalgos.dstructs.Data(7)).data[3] == 7
+    ), "'Data.__add__' must merge both args"
+    
+    assert (
+        not dsalgos.dstructs.Data() and data
+    ), "Only an empty 'Data' must be falsy"
+
+
+def test_ArrayLinkedList():
+    allist = dsalgos.dstructs.ArrayLinkedList(range(5))
+    
+    assert list(allist) == [0, 1, 2, 3, 4], "Elements must keep their order"
+    
+    head = allist.appendleft(-1)
+    tail = allist.append(5)
+    
+    assert (
+        allist.head == head and allist.tail == tail
+        and list(reversed(allist)) == [5, 4, 3, 2, 1, 0, -1]
+    ), "'appendleft'/'append' must move the head/tail handles"
+    
+    middle = allist.insert_after(head, 'x')
+    
+    assert (
+        allist.get(middle) == 'x' and allist.remove_after(head) == 'x'
+    ), "'insert_after'/'remove_after' must link after the handle"
+    
+    assert (
+        allist.pop() == 5 and allist.popleft() == -1 and len(allist) == 5
+    ), "'pop'/'popleft' must remove the tail/head values"
+    
+    reused = allist.append(6)
+    
+    assert reused in (head, tail, middle), "Freed slots must be reused"
+    
+    try:
+        allist.get(middle)
+    
+    except KeyError:
+        pass
+    
+    else:
+        assert False, "Removed handles must not stay accessible"
+    
+    assert (
+        [node.data for node in allist.nodes()]
+        == [dsalgos.dstructs.Data(i) for i in (0, 1, 2, 3, 4, 6)]
+    ), "'nodes' must produce Node views of the values"
+
+
+def test_SinglyLinkedList():
+    sllist = dsalgos.dstructs.SinglyLinkedList.from_iterable(range(3))
+    
+    assert (
+        [node.data for node in sllist]
+        == [dsalgos.dstructs.Data(i) for i in range(3)]
+    ), "'from_iterable' must wrap values in Node objects, in order"
+    
+    assert all(
+        sllist[i].next_ is sllist[i+1] and sllist[i+1].previous is sllist[i]
+        for i in range(2)
+    ), "Consecutive nodes must be linked"
+    
+    sllist += dsalgos.dstructs.SinglyLinkedList.from_iterable((3, 4))
+    
+    assert (
+        isinstance(sllist, dsalgos.dstructs.SinglyLinkedList)
+        and len(sllist) == 5 and sllist[2].next_ is sllist[3]
+    ), "'__iadd__' must link the new nodes and return the list"
+    
+    head = dsalgos.dstructs.Node()
+    nodes = [dsalgos.dstructs.Node(dsalgos.dstructs.Data(i)) for i in range(3)]
+    sllist = dsalgos.dstructs.SinglyLinkedList(head, nodes)
+    
+    assert (
+        head.next_ is nodes[0] and nodes[1].next_ is nodes[2]
+    ), "'__init__' must link the head and the elements"
+    
+    sllist.elements = nodes[:1]
+    
+    assert (
+        nodes[0].next_ is None and nodes[2].previous is None
+    ), "Setting 'elements' must unlink the old nodes"
+
+
+def test_Node_links():
+    parent = dsalgos.dstructs.Node(dsalgos.dstructs.Data('parent'))
+    children = [
+        dsalgos.dstructs.Node(dsalgos.dstructs.Data(i), parent=parent)
+        for i in range(3)
+    ]
+    
+    assert (
+        parent.children == children and parent.children[0] is children[0]
+        and children[0].next_ is children[1]
+        and children[2].previous is children[1]
+    ), "Children must be attached once and linked as siblings"
+    
+    children[1].parent = None
+    
+    assert (
+        parent.children == [children[0], children[2]]
+        and children[0].next_ is children[2]
+        and children[1].previous is None and children[1] not in parent
+    ), "Detaching a child must relink its siblings"
+    
+    chain = [dsalgos.dstructs.Node() for _ in range(10_000)]
+    
+    for previous, next_ in zip(chain, chain[1:]):
+        next_.previous = previous
+    
+    assert (
+        chain[0].next_ is chain[1] and chain[-1].previous is chain[-2]
+    ), "Linking long chains must not recurse"
+    
+    assert (
+        chain[0] == chain[-1] and chain[0].equals(dsalgos.dstructs.Node())
+        and not parent.equals(children[0])
+    ), "'equals' must compare data, action and children by value"
+
+
+def test_Node_memory():
+    import copy
+    import pickle
+    
+    node = dsalgos.dstructs.Node()
+    
+    assert not hasattr(node, '__dict__'), "'Node' must use '__slots__'"
+    
+    assert (
+        node._children is None and len(node) == 0 and list(node) == []
+    ), "A leaf 'Node' must not allocate a children list"
+    
+    assert (
+        node.data is dsalgos.dstructs.Node().data
+    ), "Nodes must share the empty default 'Data'"
+    
+    try:
+        node.data['key'] = 'value'
+    
+    except TypeError:
+        pass
+    
+    else:
+        assert False, "The empty default 'Data' must be immutable"
+    
+    data = node.data
+    data += dsalgos.dstructs.Data(1)
+    
+    assert (
+        data == dsalgos.dstructs.Data(1) and not node.data
+    ), "'+=' on the empty default 'Data' must return a new 'Data'"
+    
+    assert (
+        pickle.loads(pickle.dumps(node)).data is node.data
+        and copy.deepcopy(node).data is node.data
+        and copy.copy(node).data is node.data
+    ), "Copies of nodes must share the empty default 'Data'"
+    
+    assert (
+        sys.getsizeof(node) <= 96
+    ), "A 'Node' must not be bigger than its slots"
+    
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    nodes = [dsalgos.dstructs.Node() for _ in range(10_000)]
+    size = (tracemalloc.get_traced_memory()[0] - start) / len(nodes)
+    tracemalloc.stop()
+    
+    assert size < 128, f"A leaf 'Node' must take < 128 bytes (took {size})"
+    
+    nodes[0].parent = nodes[1]
+    
+    assert (
+        nodes[1]._children == [nodes[0]]
+    ), "The children list must be created when a child is attached"
+
+
+def test_Node_ancestors():
+    Node = dsalgos.dstructs.Node
+    root = Node(dsalgos.dstructs.Data('root'))
+    left, right = Node(parent=root), Node(parent=root)
+    leaves = [Node(parent=left), Node(parent=left), Node(parent=right)]
+    
+    assert (
+        root.depth == 0 and left.depth == 1 and leaves[0].depth == 2
+        and leaves[2].root is root and root.root is root
+    ), "'depth' and 'root' must follow the parent links"
+    
+    assert (
+        list(leaves[0].ancestors()) == [left, root]
+    ), "'ancestors' must yield from the parent up to the root"
+    
+    subtree = Node(children=[Node(children=[Node()])])
+    grandchild = subtree.children[0].children[0]
+    
+    assert grandchild.depth == 2, "Building bottom-up must keep depths right"
+    
+    subtree.parent = leaves[2]
+    
+    assert (
+        grandchild.depth == 5 and grandchild.root is root
+    ), "Re-parenting must update the depth and root of the subtree"
+    
+    assert (
+        root.is_ancestor_of(grandchild) and not left.is_ancestor_of(right)
+        and not left.is_ancestor_of(left)
+    ), "'is_ancestor_of' must only be True for proper ancestors"
+    
+    for child, parent in ((left, leaves[0]), (root, grandchild), (left, left)):
+        try:
+            child.parent = parent
+        
+        except ValueError:
+            pass
+        
+        else:
+            assert False, "A node object must not become its own ancestor"
+    
+    assert (
+        left.parent is root and root.children[0] is left
+    ), "A rejected parent must leave the tree unchanged"
+    
+    assert (
+        leaves[0].lowest_common_ancestor(leaves[1]) is left
+        and leaves[0].lowest_common_ancestor(grandchild) is root
+        and left.lowest_common_ancestor(Node()) is None
+    ), "'lowest_common_ancestor' must find the deepest shared ancestor"
+    
+    index = dsalgos.dstructs.AncestorIndex(root)
+    
+    assert (
+        len(index) == 9 and index.depth(grandchild) == 5
+        and index.is_ancestor(right, grandchild)
+        and not index.is_ancestor(left, grandchild)
+    ), "'AncestorIndex.is_ancestor' must match the tree"
+    
+    assert (
+        list(index.lowest_common_ancestors(
+            [(leaves[0], leaves[1]), (grandchild, leaves[2]), (left, root)]
+        )) == [left, leaves[2], root]
+        and index.lowest_common_ancestors([(leaves[0], grandchild)])
+        .__next__() is root
+    ), "'AncestorIndex' must find the same lowest common ancestors"
+
+
+def test_Node_siblings():
+    parent = dsalgos.dstructs.Node()
+    children = [
+        dsalgos.dstructs.Node(dsalgos.dstructs.Data(i), parent=parent)
+        for i in range(3)
+    ]
+    
+    assert (
+        children[1].siblings == (children[0], children[2])
+        and children[1].siblings == (children[0], children[2])
+    ), "'siblings' must exclude the node and be repeatable"
+    
+    assert (
+        parent.children == children and len(parent) == 3
+    ), "'siblings' must not change the parent's children"
+    
+    assert (
+        list(children[0].iter_siblings(include_self=True)) == children
+        and children[0].sibling_count == 2 and parent.sibling_count == 0
+    ), "'iter_siblings'/'sibling_count' must cover all siblings"
+    
+    assert (
+        children[1].next_sibling is children[2]
+        and children[1].previous_sibling is children[0]
+        and children[2].next_sibling is None
+        and children[0].previous_sibling is None
+        and parent.next_sibling is None
+    ), "'next_sibling'/'previous_sibling' must follow the sibling links"
+
+
+def test_Node_traversals():
+    Node, Data = dsalgos.dstructs.Node, dsalgos.dstructs.Data
+    root = Node(Data('r'), children=[
+        Node(Data('a'), children=[Node(Data('c')), Node(Data('d'))]),
+        Node(Data('b'), children=[Node(Data('e'))]),
+    ])
+    
+    def names(nodes):
+        return ''.join(node.data[0] for node in nodes)
+    
+    assert names(root.preorder()) == 'racdbe', "Wrong pre-order"
+    assert names(root.postorder()) == 'cdaebr', "Wrong post-order"
+    assert names(root.breadth_first()) == 'rabcde', "Wrong breadth-first order"
+    
+    assert (
+        [names(level) for level in root.levels()] == ['r', 'ab', 'cde']
+    ), "'levels' must yield one list per level"
+    
+    def prune(node):
+        return node.data[0] == 'a'
+    
+    assert (
+        names(root.preorder(prune)) == 'rabe'
+        and names(root.postorder(prune)) == 'aebr'
+        and names(root.breadth_first(prune)) == 'rabe'
+        and [names(level) for level in root.levels(prune)] == ['r', 'ab', 'e']
+    ), "'prune' must skip the descendants of matching nodes"
+    
+    assert (
+        names(root.preorder(max_depth=1)) == 'rab'
+        and names(root.postorder(max_depth=1)) == 'abr'
+        and names(root.breadth_first(max_depth=0)) == 'r'
+        and len(list(root.levels(max_depth=1))) == 2
+    ), "'max_depth' must limit the levels walked"
+    
+    chain = Node()
+    
+    for _ in range(10_000):
+        chain = Node(children=[chain])
+    
+    assert (
+        sum(1 for _ in chain.preorder()) == 10_001
+        and sum(1 for _ in chain.postorder()) == 10_001
+    ), "Traversals must not recurse on deep trees"
+
+
+def test_TreeSnapshot():
+    Node, Data = dsalgos.dstructs.Node, dsalgos.dstructs.Data
+    root = Node(Data('r'), children=[
+        Node(Data('a'), children=[Node(Data('c')), Node(Data('d'))]),
+        Node(Data('b'), children=[Node(Data('e'), action='e')]),
+    ])
+    snapshot = root.freeze()
+    
+    assert (
+        [data[0] for data in snapshot.data] == list('racdbe')
+        and list(snapshot.parent) == [-1, 0, 1, 1, 0, 4]
+        and list(snapshot.size) == [6, 3, 1, 1, 2, 1]
+        and list(snapshot.depth) == [0, 1, 2, 2, 1, 2]
+    ), "Columns must be in pre-order"
+    
+    assert (
+        list(snapshot.children(0)) == [1, 4] and list(snapshot.children(2)) == []
+        and list(snapshot.descendants(1)) == [2, 3]
+    ), "'children'/'descendants' must follow the columns"
+    
+    assert (
+        snapshot.is_descendant(3, 1) and not snapshot.is_descendant(5, 1)
+        and not snapshot.is_descendant(1, 1)
+    ), "'is_descendant' must only be True for proper descendants"
+    
+    assert (
+        snapshot.depth_histogram() == [1, 2, 3]
+        and list(snapshot.level(2)) == [2, 3, 5]
+        and list(snapshot.leaves()) == [2, 3, 5]
+    ), "Histogram and level slices must match the tree"
+    
+    copy = snapshot.to_node()
+    
+    assert (
+        copy == root and copy is not root and copy.freeze() == snapshot
+        and copy.children[1].children[0].action == 'e'
+    ), "'to_node' must rebuild an equal tree"
+
+
+def test_Array_files(tmp_path):
+    Array = dsalgos.dstructs.Array
+    path = tmp_path / 'values.bin'
+    Array('q', range(100)).save(path)
+    
+    assert (
+        Array.load(path) == Array('q', range(100))
+    ), "'Array.load' must read back what 'Array.save' wrote"
+    
+    with Array.open_mmap(path) as values:
+        assert (
+            len(values) == 100 and values[10] == 10
+            and values[-1] == 99 and sum(values) == sum(range(100))
+            and values.typecode == 'q'
+        ), "'Array.open_mmap' must map the saved items"
+        
+        assert (
+            isinstance(values[:10], memoryview)
+            and values.to_array() == Array('q', range(100))
+        ), "Slices of a MappedArray must not copy"
+    
+    with Array.open_mmap(path, 'r+') as values:
+        values[0] = -1
+    
+    with Array.open_mmap(path, 'c') as values:
+        values[1] = -1
+    
+    assert (
+        Array.load(path)[:2] == Array('q', [-1, 1])
+    ), "Only 'r+' mode must write changes back to the file"
+    
+    path = tmp_path / 'events.bin'
+    
+    with dsalgos.dstructs.ArrayFile(path, 'd', buffersize=4) as events:
+        events.extend([0.5, 1.5, 2.5])
+        events.append(3.5)
+        events.append(4.5)
+        
+        assert len(events) == 5, "'ArrayFile' must count waiting items"
+    
+    with dsalgos.dstructs.ArrayFile(path) as events:
+        events.append(5.5)
+        
+        with events.open_mmap() as values:
+            assert (
+                values.tolist() == [0.5, 1.5, 2.5, 3.5, 4.5, 5.5]
+            ), "'ArrayFile' must keep growing the same file"
+
+
+def test_Array_operations():
+    Array = dsalgos.dstructs.Array
+    chunksize, use_numpy = Array.chunksize, Array.use_numpy
+    Array.chunksize = 3
+    
+    try:
+        inf = float('inf')
+        
+        for Array.use_numpy in (False, True):
+            values = Array('q', [5, 1, 4, 1, 3, 9, 2])
+        
+            assert (
+                values.add(1) == Array('q', [6, 2, 5, 2, 4, 10, 3])
+                and values.subtract(values) == Array('q', [0] * 7)
+                and values.multiply(range(7)) == Array('q', [0, 1, 8, 3, 12, 45, 12])
+                and values.divide(2) == Array('d', [2.5, 0.5, 2, 0.5, 1.5, 4.5, 1])
+            ), "Arithmetic must work elementwise, across chunks"
+        
+            copy = Array('q', values)
+        
+            assert (
+                copy.multiply(2, inplace=True) is copy
+                and copy == Array('q', [10, 2, 8, 2, 6, 18, 4])
+            ), "'inplace' must update the Array itself"
+        
+            mask = values.compare('>', 2)
+        
+            assert (
+                mask == Array('B', [1, 0, 1, 0, 1, 1, 0])
+                and values.select(mask) == Array('q', [5, 4, 3, 9])
+            ), "'compare'/'select' must build and apply masks"
+        
+            assert (
+                (values.sum(), values.min(), values.max()) == (25, 1, 9)
+                and (values.argmin(), values.argmax()) == (1, 5)
+            ), "Reductions must match the builtins"
+        
+            nan = float('nan')
+            floats = Array('d', [1.0, nan, -2.0, nan])
+        
+            assert (
+                Array('q', [2**62] * 4).sum() == 2**64
+                and Array('Q', [2**64 - 1] * 2).sum() == 2**65 - 2
+                and abs(Array('f', [0.1] * 1000).sum() - 100.0) < 1e-5
+                and Array('d').sum() == 0.0 and type(Array('d').sum()) is float
+            ), "Sums must not wrap around or lose float precision"
+            assert (
+                floats.min() != floats.min() and floats.max() != floats.max()
+                and (floats.argmin(), floats.argmax()) == (1, 1)
+                and Array('d', [3.0, -1.0]).argmin() == 1
+                and Array('d', [3.0, -1.0]).argmax() == 0
+            ), "NaN items must be the smallest and the largest item"
+            assert (
+                Array('Q', [5]).add(Array('q', [-1])) == Array('Q', [4])
+                and Array('q', [5]).add(Array('Q', [1])) == Array('q', [6])
+                and Array('B', [5]).add(-1) == Array('B', [4])
+            ), "Mixed 64 bit and out-of-range operands must be exact"
+        
+            ordered = Array('q', [1, 2, 2, 2, 5])
+        
+            assert (
+                ordered.searchsorted(2) == 1
+                and ordered.searchsorted(2, side='right') == 4
+                and ordered.searchsorted([0, 3, 9]) == Array('q', [0, 4, 5])
+            ), "'searchsorted' must return insertion points"
+        
+            try:
+                values.add([1, 2])
+        
+            except ValueError:
+                pass
+        
+            else:
+                assert False, "Operands of different lengths must be rejected"
+        
+            copy = Array('q', [2**62, 1])
+        
+            for operation, operand, error in (
+                (copy.divide, 0, ZeroDivisionError),
+                (copy.divide, [1, 0], ZeroDivisionError),
+                (copy.multiply, 4, OverflowError),
+                (Array('b', [100]).add, 100, OverflowError),
+                (Array('B', [0]).subtract, 1, OverflowError),
+            ):
+                try:
+                    operation(operand, inplace=operation != copy.divide)
+        
+                except error:
+                    pass
+        
+                else:
+                    assert False, "Both backends must raise the same errors"
+        
+            assert (
+                copy == Array('q', [2**62, 1])
+                and Array('d', [1e308]).multiply(10) == Array('d', [inf])
+            ), "Failed operations must leave the Array unchanged"
+    
+    finally:
+        Array.chunksize, Array.use_numpy = chunksize, use_numpy
+
+
+def test_SharedArray():
+    import pickle
+    
+    with dsalgos.dstructs.SharedArray('q', range(5), capacity=8) as shared:
+        assert (
+            len(shared) == 5 and shared.capacity == 8 and shared.owner
+            and shared.tolist() == [0, 1, 2, 3, 4]
+        ), "'SharedArray' must hold the initial items"
+        
+        attached = pickle.loads(pickle.dumps(shared))
+        
+        assert (
+            len(pickle.dumps(shared)) < 200 and attached.name == shared.name
+            and not attached.owner
+        ), "Pickling a 'SharedArray' must only pickle its name"
+        
+        attached.extend([5, 6])
+        attached[0] = -1
+        
+        assert (
+            shared.tolist() == [-1, 1, 2, 3, 4, 5, 6]
+            and shared.to_array() == dsalgos.dstructs.Array('q', attached)
+        ), "Attached 'SharedArray' objects must share items and length"
+        
+        try:
+            shared.extend([7, 8])
+        
+        except OverflowError:
+            pass
+        
+        else:
+            assert False, "Appending past the capacity must fail"
+        
+        attached.close()
+
+
+def test_heaps():
+    import random
+    
+    for Heap in (dsalgos.dstructs.DaryHeap, dsalgos.dstructs.PairingHeap):
+        priorities = {item: random.randrange(1000) for item in range(300)}
+        heap = Heap.heapify(list(priorities.items())[:200])
+        
+        for item in range(200, 300):
+            heap.push(item, priorities[item])
+        
+        for item in random.sample(range(300), 100):
+            priorities[item] -= random.randrange(500)
+            heap.decrease_key(item, priorities[item])
+        
+        popped = [heap.pop() for _ in range(len(heap))]
+        
+        assert (
+            [priority for item, priority in popped]
+            == sorted(priorities.values())
+            and dict(popped) == priorities
+        ), f"'{Heap.__name__}' must pop items by (decreased) priority"
+        
+        try:
+            heap.pop()
+        except IndexError:
+            pass
+        else:
+            assert False, f"'{Heap.__name__}.pop' must fail when empty"
+    
+    heap = dsalgos.dstructs.PairingHeap([('a', 2)])
+    heap.meld(dsalgos.dstructs.PairingHeap([('b', 1), ('c', 3)]))
+    
+    assert (
+        [heap.pop()[0] for _ in range(3)] == ['b', 'a', 'c']
+    ), "'PairingHeap.meld' must merge both heaps"
+    
+    runs = [sorted(random.sample(range(100), 20)) for _ in range(5)]
+    
+    assert (
+        list(dsalgos.dstructs.merge(*runs)) == sorted(sum(runs, []))
+        and list(dsalgos.dstructs.merge(
+            *(run[::-1] for run in runs), key=lambda value: value // 10,
+            reverse=True
+        )) == sorted(
+            sum((run[::-1] for run in runs), []),
+            key=lambda value: value // 10, reverse=True
+        )
+    ), "'merge' must lazily merge sorted iterables (stably)"
+
+
+def test_SinglyLinkedList_indexed():
+    nodes = [dsalgos.dstructs.Node(dsalgos.dstructs.Data(i)) for i in range(6)]
+    
+    for indexed in (False, True):
+        sllist = dsalgos.dstructs.SinglyLinkedList(
+            elements=nodes[:4], indexed=indexed
+        )
+        
+        assert (
+            nodes[2] in sllist and 3 in sllist and nodes[5] not in sllist
+            and sllist.index(nodes[3]) == 3 and sllist.index(1) == 1
+        ), "'in' and 'index' must find node objects and data values"
+        
+        sllist.move_to_front(nodes[2])
+        sllist.remove(0)
+        sllist.appendleft(nodes[4])
+        sllist[1] = nodes[5]
+        
+        assert (
+            sllist.elements == [nodes[4], nodes[5], nodes[1], nodes[3]]
+            and sllist.index(nodes[1]) == 2 and nodes[2] not in sllist
+        ), "'move_to_front', 'remove' and item assignment must reorder"
+        assert (
+            sllist.pop() is nodes[3] and sllist.popleft() is nodes[4]
+            and len(sllist) == 2 and nodes[5]._previous is None
+            and nodes[5]._next is nodes[1] and nodes[1]._next is None
+        ), "'pop' and 'popleft' must unlink the end node objects"
+        
+        listed = [
+            dsalgos.dstructs.Node(dsalgos.dstructs.Data([i])) for i in range(2)
+        ]
+        sllist.extend(listed)
+        sllist.remove([0])
+        
+        assert (
+            len(sllist) == 3 and [1] in sllist and listed[0] not in sllist
+            and sllist.index(listed[1]) == 2
+        ), "Node objects with unhashable data must be found by value"
+
+
+def test_caches():
+    import threading
+    
+    cache = dsalgos.dstructs.LRUCache(2)
+    cache['a'], cache['b'] = 1, 2
+    cache.get('a')
+    cache['c'] = 3
+    
+    assert (
+        'b' not in cache and cache['a'] == 1 and cache.get('b') is None
+        and (cache.hits, cache.misses, cache.evictions) == (2, 1, 1)
+    ), "'LRUCache' must evict the least recently used entry and count"
+    
+    cache = dsalgos.dstructs.LFUCache(2)
+    cache['a'], cache['b'] = 1, 2
+    cache.get('a')
+    cache.get('b')
+    cache.get('b')
+    cache['c'] = 3
+    cache['d'] = 4
+    
+    assert (
+        sorted(cache._entries) == ['b', 'd']
+    ), "'LFUCache' must evict the least frequently used entry"
+    
+    now = [0.0]
+    cache = dsalgos.dstructs.TTLCache(2, ttl=10, timer=lambda: now[0])
+    cache['a'] = 1
+    now[0] = 5
+    cache['b'] = 2
+    now[0] = 12
+    
+    assert (
+        'a' not in cache and cache['b'] == 2 and cache.expire() == 0
+    ), "'TTLCache' entries must expire 'ttl' seconds after being stored"
+    
+    cache = dsalgos.dstructs.SizedCache(10, sizeof=len)
+    cache['a'], cache['b'], cache['c'] = 'aaaa', 'bbbb', 'cccc'
+    cache['d'] = 'd' * 11
+    
+    assert (
+        list(cache._entries) == ['b', 'c'] and cache.currbytes == 8
+    ), "'SizedCache' must keep the values within 'maxbytes'"
+    
+    @dsalgos.dstructs.memoize(
+        dsalgos.dstructs.LRUCache(50, lock=threading.RLock())
+    )
+    def square(value, power=2):
+        return value ** power
+    
+    def work():
+        for value in range(1000):
+            assert square(value % 60, power=3) == (value % 60) ** 3
+    
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    
+    for thread in threads:
+        thread.start()
+    
+    for thread in threads:
+        thread.join()
+    
+    assert (
+        len(square.cache) == 50
+        and square.cache.hits + square.cache.misses == 4000
+    ), "'memoize' must share a (locked) cache between threads"
+
+
+def test_concurrent_containers():
+    import asyncio
+    import queue
+    import threading
+    
+    for make, put, get in (
+        (dsalgos.dstructs.Queue, 'put', 'get'),
+        (dsalgos.dstructs.Stack, 'push', 'pop'),
+        (lambda maxsize: dsalgos.dstructs.Deque(maxsize, 'q'),
+         'append', 'popleft'),
+    ):
+        container, received = make(4), []
+        
+        def produce(start):
+            for item in range(start, start + 500):
+                getattr(container, put)(item)
+        
+        def consume():
+            items = [getattr(container, get)() for _ in range(500)]
+            received.extend(items)
+        
+        threads = [
+            threading.Thread(target=function, args=args)
+            for function, args in (
+                (produce, (0,)), (produce, (500,)), (consume, ()),
+                (consume, ()),
+            )
+        ]
+        
+        for thread in threads:
+            thread.start()
+        
+        for thread in threads:
+            thread.join()
+        
+        assert (
+            sorted(received) == list(range(1000)) and not len(container)
+        ), f"'{container!r}' must pass every item between threads once"
+        
+        try:
+            getattr(container, get)(timeout=0.01)
+        except queue.Empty:
+            pass
+        else:
+            assert False, "An empty container must time out"
+    
+    fifo = dsalgos.dstructs.Queue()
+    
+    for item in range(10):
+        fifo.put(item)
+    
+    assert (
+        [fifo.get_nowait() for _ in range(10)] == list(range(10))
+    ), "'Queue' must be first in, first out"
+    
+    tasks = dsalgos.dstructs.Queue()
+    tasks.put(1)
+    worker = threading.Thread(target=lambda: (tasks.get(), tasks.task_done()))
+    worker.start()
+    tasks.join()
+    worker.join()
+    
+    try:
+        tasks.task_done()
+    except ValueError:
+        pass
+    else:
+        assert False, "'task_done' must not be called more than 'put'"
+    
+    async def pipeline():
+        container, received = dsalgos.dstructs.AsyncQueue(2), []
+        
+        async def produce():
+            for item in range(50):
+                await container.put(item)
+        
+        async def consume():
+            for _ in range(50):
+                received.append(await container.get())
+        
+        await asyncio.gather(consume(), produce())
+        
+        tasks = dsalgos.dstructs.AsyncQueue()
+        
+        async def work():
+            await tasks.get()
+            tasks.task_done()
+        
+        await tasks.put(1)
+        worker = asyncio.create_task(work())
+        await tasks.join()
+        await worker
+        
+        assert (
+            tasks.empty() and tasks.qsize() == 0 and worker.done()
+        ), "'join' must wait for 'task_done'"
+        
+        stack = dsalgos.dstructs.AsyncStack()
+        await stack.push(1)
+        await stack.push(2)
+        
+        return received, await stack.pop()
+    
+    assert (
+        asyncio.run(pipeline()) == (list(range(50)), 2)
+    ), "The asyncio containers must wait for items and free slots"
+
+
+def test_dump_load(tmp_path):
+    Node, Data = dsalgos.dstructs.Node, dsalgos.dstructs.Data
+    dump, load = dsalgos.dstructs.dump, dsalgos.dstructs.load
+    root = Node(Data(0), children=[
+        Node(Data(1), children=[Node(Data(2)), Node(Data(3))]),
+        Node(Data(4), children=[Node(Data(5), action='e')]),
+    ])
+    spine = root
+    
+    for i in range(6, 3000):
+        spine = Node(Data(i), parent=spine)
+    
+    path = tmp_path / 'tree.bin'
+    dump(root, path, chunk_size=100)
+    copy = load(path)
+    
+    assert (
+        copy == root and copy is not root and copy.freeze() == root.freeze()
+        and copy.children[1].children[0].action == 'e'
+        and copy.children[0].children[0].next_sibling
+        is copy.children[0].children[1]
+        and list(copy.preorder())[-1].depth == spine.depth == 2994
+    ), "'load' must rebuild an equal tree of a deep tree"
+    
+    assert (
+        [
+            (depth, data[0])
+            for depth, data, _ in dsalgos.dstructs.iter_load(path)
+        ][:7] == [(0, 0), (1, 1), (2, 2), (2, 3), (1, 4), (2, 5), (1, 6)]
+    ), "'iter_load' must yield depths and data in pre-order"
+    
+    mixed = Node(Data('a', key=1), children=[
+        Node(), Node(Data(2**70)), Node([1, 2]), Node(Data(1.5))
+    ])
+    file = io.BytesIO()
+    dump(mixed, file)
+    file.seek(0)
+    copy = load(file)
+    
+    assert (
+        copy == mixed and copy.children[0].data == Data()
+        and copy.children[2].data == [1, 2]
+    ), "Any payloads must round-trip through the pickled table"
+    
+    sllist = dsalgos.dstructs.SinglyLinkedList.from_iterable(
+        [1.5, 2.5, 3.5], indexed=True
+    )
+    dump(sllist, path)
+    copy = load(path)
+    
+    assert (
+        copy.indexed and [node.data for node in copy]
+        == [Data(1.5), Data(2.5), Data(3.5)]
+        and len(load(io.BytesIO(path.read_bytes()))) == 3
+    ), "Lists must round-trip with their indexed flag"
+    assert (
+        list(dsalgos.dstructs.iter_load(path))
+        == [(0, Data(1.5), None), (0, Data(2.5), None), (0, Data(3.5), None)]
+    ), "'iter_load' must yield the elements of lists at depth 0"
+    
+    path.write_bytes(path.read_bytes()[:-8])
+    
+    try:
+        load(path)
+    
+    except ValueError:
+        pass
+    
+    else:
+        assert False, "A truncated stream must raise ValueError"
+
+
+def test_UnrolledList():
+    UnrolledList = dsalgos.dstructs.UnrolledList
+    ulist = UnrolledList('q', range(10), capacity=4)
+    
+    assert (
+        list(ulist) == list(range(10)) and ulist.chunk_count == 3
+        and [len(chunk) for chunk in ulist.chunks()] == [4, 4, 2]
+        and all(
+            isinstance(chunk, memoryview) for chunk in ulist.chunks()
+        )
+    ), "Appended values must fill the chunks in order"
+    
+    ulist.insert(1, 100)
+    
+    assert (
+        list(ulist) == [0, 100, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+        and [len(chunk) for chunk in ulist.chunks()] == [3, 2, 4, 2]
+    ), "Inserting into a full chunk must split it"
+    
+    assert (
+        ulist[1] == 100 and ulist[-1] == 9 and ulist[6] == 5
+        and list(ulist[2:9:2]) == [1, 3, 5, 7]
+        and list(ulist[::-1]) == list(reversed(ulist))
+        and 100 in ulist and ulist.index(5) == 6 and ulist.count(8) == 1
+    ), "Indexing and searching must follow the values"
+    
+    for _ in range(3):
+        ulist.pop(5)
+    
+    assert (
+        list(ulist) == [0, 100, 1, 2, 3, 7, 8, 9]
+        and [len(chunk) for chunk in ulist.chunks()] == [3, 2, 3]
+    ), "A chunk less than half full must merge with a neighbour"
+    
+    ulist[0] = -1
+    ulist.remove(100)
+    del ulist[-1]
+    ulist.extend([10, 11, 12])
+    
+    assert (
+        list(ulist) == [-1, 1, 2, 3, 7, 8, 10, 11, 12]
+        and ulist == UnrolledList('q', ulist.to_array())
+        and ulist.to_array().typecode == 'q'
+    ), "Updates must keep the values in order"
+    
+    for _ in range(len(ulist)):
+        ulist.pop(0)
+    
+    assert (
+        not ulist and ulist.chunk_count == 0
+    ), "Removing every value must unlink every chunk"
+    
+    try:
+        ulist.pop()
+    
+    except IndexError:
+        pass
+    
+    else:
+        assert False, "Popping from an empty list must raise IndexError"
+
+
+def test_btrees():
+    BTreeMap, BTreeSet = dsalgos.dstructs.BTreeMap, dsalgos.dstructs.BTreeSet
+    bmap = BTreeMap(fanout=4)
+    keys = list(range(0, 200, 2))
+    random.shuffle(keys)
+    
+    for key in keys:
+        bmap[key] = str(key)
+    
+    assert (
+        list(bmap) == list(range(0, 200, 2)) and len(bmap) == 100
+        and bmap[42] == '42' and bmap.get(43) is None and 44 in bmap
+        and 45 not in bmap
+    ), "Inserted keys must be found, in order"
+    
+    assert (
+        list(bmap.irange(10, 20)) == [10, 12, 14, 16, 18]
+        and list(bmap.items(195, reverse=True))
+        == [(198, '198'), (196, '196')]
+        and list(bmap.values(stop=5)) == ['0', '2', '4']
+        and list(reversed(bmap))[:2] == [198, 196]
+    ), "Range scans must follow the linked leaves both ways"
+    
+    assert (
+        bmap.rank(10) == 5 and bmap.rank(11) == 6 and bmap.select(5) == 10
+        and bmap.select(-1) == 198 and bmap.peekitem(0) == (0, '0')
+    ), "'rank' and 'select' must follow the sorted order"
+    
+    for key in keys[:90]:
+        del bmap[key]
+    
+    assert (
+        list(bmap) == sorted(keys[90:]) and bmap.pop(-1, 'missing') == 'missing'
+        and bmap == BTreeMap.from_sorted(
+            [(key, str(key)) for key in sorted(keys[90:])], fanout=4
+        )
+    ), "Deleted keys must be gone and the rest must stay in order"
+    
+    bset = BTreeSet.from_sorted(range(1000), fanout=8)
+    
+    for key in range(0, 1000, 3):
+        bset.discard(key)
+    
+    bset.add(3)
+    
+    assert (
+        len(bset) == 667 and bset.select(0) == 1 and bset.rank(5) == 4
+        and list(bset.irange(0, 7)) == [1, 2, 3, 4, 5]
+        and BTreeSet([3, 1, 2, 3]) == BTreeSet.from_sorted([1, 2, 3])
+    ), "Sets must support the same ordered operations"
+    
+    try:
+        BTreeSet.from_sorted([1, 3, 2])
+    
+    except ValueError:
+        pass
+    
+    else:
+        assert False, "'from_sorted' must reject unsorted keys"
@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+
+import dsalgos
+
+
+# Startup budgets (cumulative `-X importtime` microseconds, bytecode cached)
+PACKAGE_BUDGET = 50_000
+SUBMODULES_BUDGET = 150_000
+
+
+def import_times(statement, tmp_path):
+    """Returns the cumulative import time of every module imported by \
+*statement* in a fresh interpreter (after a first run caching bytecode)
+"""
+    
+    environment = dict(
+        os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(__file__)),
+        PYTHONPYCACHEPREFIX=str(tmp_path)
+    )
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+    command = [sys.executable, '-X', 'importtime', '-c', statement]
+    subprocess.run(command, env=environment, capture_output=True, check=True)
+    stderr = subprocess.run(
+        command, env=environment, capture_output=True, check=True, text=True
+    ).stderr
+    
+    return {
+        line.split('|')[2].strip(): int(line.split('|')[1])
+        for line in stderr.splitlines()
+        if line.startswith('import time:') and 'cumulative' not in line
+    }
+
+
+def test_lazy_submodules():
+    assert (
+        dsalgos.dstructs.Node is sys.modules['dsalgos.dstructs'].Node
+        and 'algos' in dir(dsalgos)
+    ), "'dsalgos.<submodule>' must import the submodule on first access"
+    
+    try:
+        dsalgos.missing
+    except AttributeError:
+        pass
+    else:
+        assert False, "Unknown attributes must raise 'AttributeError'"
+
+
+def test_import_time(tmp_path):
+    times = import_times('import dsalgos', tmp_path)
+    
+    assert (
+        'dsalgos.dstructs' not in times and 'dsalgos.algos' not in times
+    ), "'import dsalgos' must not import the submodules"
+    assert (
+        times['dsalgos'] < PACKAGE_BUDGET
+    ), f"'import dsalgos' took {times['dsalgos']} us"
+    
+    times = import_times('import dsalgos.algos', tmp_path)
+    total = times['dsalgos'] + times['dsalgos.algos']
+    
+    assert (
+        not {'numpy', 'asyncio', 'concurrent.futures', 'tempfile'} & set(times)
+    ), "Optional and rarely used dependencies must be imported lazily"
+    assert (
+        total < SUBMODULES_BUDGET
+    ), f"'import dsalgos.algos' took {total} us"